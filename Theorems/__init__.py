@@ -0,0 +1,83 @@
+"""
+Recurrence relation solvers.
+
+Submodules and the commonly used names below are imported on first access,
+so `import Theorems` is cheap and optional machinery such as the NumPy batch
+solvers is only loaded by code that actually uses it.
+"""
+import importlib
+
+# Bump whenever a solver change can alter results, so that persisted caches
+# built by an older version are detected as stale.
+SOLVER_VERSION = 3
+
+_SUBMODULES = {
+    "approximation_method",
+    "batch",
+    "bulk",
+    "cache",
+    "catalog",
+    "dispatch",
+    "evaluator",
+    "exact",
+    "extended_master_theorem",
+    "extended_master_theorem_akra_bazzi",
+    "growth",
+    "linear_recurrence",
+    "master_theorem",
+    "muster_theorem",
+    "parallel",
+    "parser",
+    "persistent_cache",
+    "ranking",
+    "recursion_tree",
+    "result",
+    "subtractive_master_theorem",
+    "symbolic",
+}
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "RecurrenceResult": "result",
+    "SolverCache": "cache",
+    "get_default_cache": "cache",
+    "set_cache_enabled": "cache",
+    "master_theorem_result": "master_theorem",
+    "extended_master_theorem_result": "extended_master_theorem",
+    "subtractive_master_theorem_result": "subtractive_master_theorem",
+    "exact_master_theorem_result": "exact",
+    "exact_extended_master_theorem_result": "exact",
+    "akra_bazzi": "extended_master_theorem_akra_bazzi",
+    "akra_bazzi_result": "extended_master_theorem_akra_bazzi",
+    "linear_recurrence_result": "linear_recurrence",
+    "linear_recurrence_value": "linear_recurrence",
+    "solve": "dispatch",
+    "solve_batch": "dispatch",
+    "master_theorem_batch": "batch",
+    "extended_master_theorem_batch": "batch",
+    "akra_bazzi_batch": "batch",
+    "linear_recurrence_batch": "batch",
+    "solve_parallel": "parallel",
+    "growth_signature": "ranking",
+    "argsort_growth": "ranking",
+    "sort_by_growth": "ranking",
+    "parse_recurrence": "parser",
+    "solve_expression": "parser",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_EXPORTS))
@@ -0,0 +1,33 @@
+from Theorems.extended_master_theorem_akra_bazzi import akra_bazzi_result
+
+
+def approximation_method_result(fractions, weights, k, i=0):
+    """
+    For recurrences with subproblems of different sizes:
+    T(n) = sum w_j T(f_j n) + Θ(n^k (log n)^i), with 0 < f_j < 1
+    Solved as the Akra–Bazzi recurrence with a_j = w_j and b_j = 1 / f_j.
+    Returns:
+        RecurrenceResult holding the case and the numeric exponents
+    """
+    if any(not 0 < f < 1 for f in fractions):
+        raise ValueError("every fraction f_j must lie strictly between 0 and 1")
+    return akra_bazzi_result(weights, [1 / f for f in fractions], k, i)
+
+
+def approximation_method(fractions, weights, k, i=0):
+    """
+    For recurrences T(n) = sum w_j T(f_j n) + Θ(n^k (log n)^i).
+    Returns:
+        complexity (str), case (int), comparison (str)
+    """
+    return approximation_method_result(fractions, weights, k, i).as_tuple()
+
+
+def print_approximation_method_result(fractions, weights, k, i=0):
+    complexity, case, comparison = approximation_method(fractions, weights, k, i)
+    terms = " + ".join(f"{w} T({f:.3g}n)" for f, w in zip(fractions, weights))
+    log_factor = f" (log n)^{i}" if i else ""
+
+    print(f"Recurrence relation: T(n) = {terms} + Θ(n^{k}{log_factor})")
+    print(f"Approximation Method Case {case} applies: {comparison}, where sum w_j f_j^p = 1")
+    print(f"Time complexity: {complexity}")
@@ -0,0 +1,351 @@
+from collections import namedtuple
+import math
+
+import numpy as np
+
+from Theorems.master_theorem import format_master_result
+from Theorems.extended_master_theorem import format_extended_result
+from Theorems.extended_master_theorem_akra_bazzi import MAX_DOUBLINGS
+
+# Arrays describing the solution of every recurrence in a batch.
+# case          - case id as returned by the scalar solver (0 for invalid input)
+# log_b_a       - log_b(a) for every row
+# poly_exponent - exponent of n in the resulting bound
+# log_exponent  - exponent of log n in the resulting bound
+# loglog        - True where the bound carries an extra log log n factor
+# exp_base      - base of the exponential factor (subtractive batches only)
+BatchResult = namedtuple(
+    "BatchResult", ["case", "log_b_a", "poly_exponent", "log_exponent", "loglog", "exp_base"],
+    defaults=(None,),
+)
+
+# Same relative tolerance the scalar solvers pass to math.isclose.
+REL_TOL = 1e-9
+
+# np.log may differ from math.log by a few ulps, so rows this close to a
+# case boundary are re-decided with math.log to match the scalar solvers.
+_ULP_SLACK = 8 * np.finfo(np.float64).eps
+
+
+def _columns(data, names):
+    """Pull the named columns out of a DataFrame, structured array or mapping."""
+    return [np.asarray(data[name]) for name in names]
+
+
+def _log_b_a(a, b):
+    """Vectorized math.log(a, b) with invalid rows flagged instead of raising."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    invalid = ~((a > 0) & (b > 0) & (b != 1) & np.isfinite(a) & np.isfinite(b))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_b_a = np.array(np.log(a) / np.log(b))
+    log_b_a[invalid] = np.nan
+    return log_b_a, invalid
+
+
+def _fix_boundary_rows(log_b_a, a, b, k, invalid):
+    """Recompute rows near the case boundary with math.log, in place."""
+    scale = np.maximum(np.abs(log_b_a), np.abs(k))
+    near = np.abs(log_b_a - k) <= (REL_TOL + _ULP_SLACK) * scale
+    near &= ~invalid
+    for idx in np.flatnonzero(near):
+        log_b_a.flat[idx] = math.log(a.flat[idx].item(), b.flat[idx].item())
+
+
+def _isclose(x, y):
+    """Vectorized math.isclose(x, y, rel_tol=REL_TOL)."""
+    return (x == y) | (np.abs(x - y) <= REL_TOL * np.maximum(np.abs(x), np.abs(y)))
+
+
+def master_theorem_batch(a, b=None, k=None):
+    """
+    Solve many recurrences T(n) = a T(n/b) + Θ(n^k) in one vectorized pass.
+
+    a, b and k are array-likes that broadcast against each other. Alternatively
+    pass a DataFrame or structured array with "a", "b" and "k" columns as a.
+    Returns a BatchResult of arrays; rows with invalid parameters get case 0.
+    """
+    if b is None and k is None:
+        a, b, k = _columns(a, ["a", "b", "k"])
+    a, b, k = np.broadcast_arrays(np.asarray(a), np.asarray(b), np.asarray(k))
+    k = k.astype(np.float64)
+
+    log_b_a, invalid = _log_b_a(a, b)
+    _fix_boundary_rows(log_b_a, a, b, k, invalid)
+
+    case = np.full(log_b_a.shape, 3, dtype=np.int8)
+    case[_isclose(log_b_a, k)] = 2
+    case[log_b_a > k] = 1
+    case[invalid] = 0
+
+    poly_exponent = np.where(case == 1, log_b_a, k)
+    log_exponent = (case == 2).astype(np.float64)
+    loglog = np.zeros(case.shape, dtype=bool)
+    return BatchResult(case, log_b_a, poly_exponent, log_exponent, loglog)
+
+
+def extended_master_theorem_batch(a, b=None, k=None, i=None):
+    """
+    Solve many recurrences T(n) = a T(n/b) + Θ(n^k (log n)^i) in one pass.
+
+    Accepts broadcastable array-likes or a single table with "a", "b", "k" and
+    "i" columns. Returns a BatchResult of arrays; invalid rows get case 0.
+    """
+    if b is None and k is None and i is None:
+        a, b, k, i = _columns(a, ["a", "b", "k", "i"])
+    a, b, k, i = np.broadcast_arrays(
+        np.asarray(a), np.asarray(b), np.asarray(k), np.asarray(i)
+    )
+    k = k.astype(np.float64)
+    i = i.astype(np.float64)
+
+    log_b_a, invalid = _log_b_a(a, b)
+    _fix_boundary_rows(log_b_a, a, b, k, invalid)
+
+    case = np.full(log_b_a.shape, 3, dtype=np.int8)
+    case[_isclose(log_b_a, k)] = 2
+    case[log_b_a < k] = 1
+    case[invalid] = 0
+
+    poly_exponent = np.where(case == 3, log_b_a, k)
+    log_exponent = np.select(
+        [case == 1, (case == 2) & (i > -1)], [i, i + 1], default=0.0
+    )
+    loglog = (case == 2) & (i == -1)
+    return BatchResult(case, log_b_a, poly_exponent, log_exponent, loglog)
+
+
+def subtractive_master_theorem_batch(a, b=None, k=None):
+    """
+    Solve many recurrences T(n) = a T(n-b) + Θ(n^k) in one pass.
+
+    Accepts broadcastable array-likes or a single table with "a", "b" and "k"
+    columns. log_b_a is NaN for every row; invalid rows get case 0.
+    """
+    if b is None and k is None:
+        a, b, k = _columns(a, ["a", "b", "k"])
+    a, b, k = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64),
+        np.asarray(k, dtype=np.float64),
+    )
+    invalid = ~(np.isfinite(a) & np.isfinite(b) & np.isfinite(k) & (b > 0))
+
+    case = np.where(a < 1, 1, np.where(a == 1, 2, 3)).astype(np.int8)
+    case[invalid] = 0
+
+    poly_exponent = np.select([case == 2, case == 3], [k + 1, 0.0], k)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        exp_base = np.where(case == 3, a ** (1 / np.where(invalid, 1, b)), 1.0)
+    log_b_a = np.full(case.shape, np.nan)
+    log_exponent = np.zeros(case.shape)
+    loglog = np.zeros(case.shape, dtype=bool)
+    return BatchResult(case, log_b_a, poly_exponent, log_exponent, loglog, exp_base)
+
+
+def iter_master_strings(a, b, k, result):
+    """Lazily yield the scalar (complexity, case, comparison) tuple per row."""
+    a, b, k = np.broadcast_arrays(np.asarray(a), np.asarray(b), np.asarray(k))
+    rows = zip(a.flat, b.flat, k.flat, result.log_b_a.flat, result.case.flat)
+    for a_n, b_n, k_n, log_b_a, case in rows:
+        if case == 0:
+            yield None
+        else:
+            yield format_master_result(
+                a_n.item(), b_n.item(), k_n.item(), log_b_a.item(), int(case)
+            )
+
+
+def iter_extended_strings(a, b, k, i, result):
+    """Lazily yield the scalar (complexity, case, comparison) tuple per row."""
+    a, b, k, i = np.broadcast_arrays(
+        np.asarray(a), np.asarray(b), np.asarray(k), np.asarray(i)
+    )
+    rows = zip(a.flat, b.flat, k.flat, i.flat, result.log_b_a.flat, result.case.flat)
+    for a_n, b_n, k_n, i_n, log_b_a, case in rows:
+        if case == 0:
+            yield None
+        else:
+            yield format_extended_result(
+                a_n.item(), b_n.item(), k_n.item(), i_n.item(), log_b_a.item(), int(case)
+            )
+
+
+def _invalid_coefficients(a, b):
+    """
+    Flag the rows no Akra–Bazzi recurrence has, as the scalar solver would.
+
+    Padding entries (a = 0) are ignored; a row is invalid when an entry has
+    a < 0, a value is not finite, an entry with a > 0 has b <= 1, or no
+    entry has a > 0.
+    """
+    used = a > 0
+    return (
+        (a < 0).any(axis=1)
+        | ~(np.isfinite(a) & np.isfinite(b)).all(axis=1)
+        | (used & ~(b > 1)).any(axis=1)
+        | ~used.any(axis=1)
+    )
+
+
+def critical_exponent_batch(a, b, iterations=100):
+    """
+    Solve sum_j a[r, j] / b[r, j]^p = 1 for every row r at once.
+
+    a and b are 2-D arrays of coefficient vectors; pad short rows with a = 0.
+    Uses the same safeguarded Newton iteration as the scalar Akra–Bazzi
+    solver, vectorized across rows. Rows the scalar solver would reject
+    (a < 0, b <= 1, non-finite or all-zero a) get p = NaN.
+    """
+    a, b = np.broadcast_arrays(
+        np.atleast_2d(np.asarray(a, dtype=np.float64)), np.atleast_2d(np.asarray(b, dtype=np.float64))
+    )
+    invalid = _invalid_coefficients(a, b)
+    # Invalid rows solve a harmless stand-in, T(n) = T(n/2), so that every
+    # row is bracketed and converges. Padding entries get log b = 0, so they
+    # add 0 rather than 0 * inf to g(p) for far-off p.
+    a = np.where(invalid[:, None], 0.0, a)
+    a[invalid, 0] = 1.0
+    b = np.where(invalid[:, None], 2.0, b)
+    log_b = np.where(a > 0, np.log(np.where(a > 0, b, 1.0)), 0.0)
+
+    def g(p):
+        return (a * np.exp(-p[:, None] * log_b)).sum(axis=1) - 1
+
+    def dg(p):
+        return -(a * log_b * np.exp(-p[:, None] * log_b)).sum(axis=1)
+
+    rows = a.shape[0]
+    lo = np.full(rows, -1.0)
+    hi = np.full(rows, 1.0)
+    # Far-off brackets overflow exp() to inf, which still orders correctly.
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        for _ in range(MAX_DOUBLINGS):
+            low = g(lo) <= 0
+            if not low.any():
+                break
+            lo[low] *= 2
+        for _ in range(MAX_DOUBLINGS):
+            high = g(hi) >= 0
+            if not high.any():
+                break
+            hi[high] *= 2
+        invalid |= ~(np.isfinite(lo) & np.isfinite(hi))
+        lo[invalid], hi[invalid] = -1.0, 1.0
+
+        p = (lo + hi) / 2
+        for _ in range(iterations):
+            value = g(p)
+            lo = np.where(value > 0, p, lo)
+            hi = np.where(value < 0, p, hi)
+            step = p - value / dg(p)
+            inside = (step > lo) & (step < hi)
+            p_next = np.where(inside, step, (lo + hi) / 2)
+            p_next = np.where(value == 0, p, p_next)
+            p_next[invalid] = 0.0
+            converged = np.all(np.abs(p_next - p) <= 4e-16 * np.maximum(1.0, np.abs(p)))
+            p = p_next
+            if converged:
+                break
+    p[invalid] = np.nan
+    return p
+
+
+def akra_bazzi_batch(a, b, k, i=0):
+    """
+    Solve many Akra–Bazzi recurrences T(n) = sum a_j T(n/b_j) + Θ(n^k (log n)^i).
+
+    a and b are 2-D coefficient arrays (one recurrence per row, padded with
+    a = 0); k and i broadcast against the rows. The critical exponent p is
+    returned in the log_b_a field; invalid rows get case 0.
+    """
+    p = critical_exponent_batch(a, b)
+    k, i = np.broadcast_arrays(
+        np.asarray(k, dtype=np.float64), np.asarray(i, dtype=np.float64), p
+    )[:2]
+
+    # math.isclose(p, k, rel_tol=REL_TOL, abs_tol=1e-12), as in the scalar solver
+    close = np.abs(p - k) <= np.maximum(REL_TOL * np.maximum(np.abs(p), np.abs(k)), 1e-12)
+    case = np.where(close, 2, np.where(p > k, 1, 3)).astype(np.int8)
+    case[np.isnan(p) | ~np.isfinite(k) | ~np.isfinite(i)] = 0
+
+    poly_exponent = np.where(case == 1, p, k)
+    log_exponent = np.select(
+        [case == 3, (case == 2) & (i > -1)], [i, i + 1], default=0.0
+    )
+    loglog = (case == 2) & (i == -1)
+    return BatchResult(case, p, poly_exponent, log_exponent, loglog)
+
+
+def dominant_root_batch(coefficients):
+    """
+    Return (r, m, ones) arrays for many linear recurrences
+    T(n) = c_1 T(n-1) + ... + c_d T(n-d) at once.
+
+    coefficients is a 2-D array with one coefficient vector per row, padded
+    with trailing zeros. r is the largest root modulus, m its multiplicity and
+    ones the multiplicity of x = 1, all decided as in the scalar
+    linear_recurrence.dominant_root. Rows that are all zero or not finite get
+    r = NaN.
+    """
+    from Theorems.linear_recurrence import ROOT_TOL, UNIT_TOL, multiplicity_at_one
+
+    c = np.atleast_2d(np.asarray(coefficients, dtype=np.float64))
+    rows, d = c.shape
+    invalid = ~np.isfinite(c).all(axis=1) | ~(c != 0).any(axis=1)
+    c = np.where(invalid[:, None], 0.0, c)
+    c[invalid, 0] = 1.0
+
+    # Eigenvalues of the companion matrices, the same matrices np.roots uses.
+    companion = np.zeros((rows, d, d))
+    companion[:, 0, :] = c
+    companion[:, np.arange(1, d), np.arange(d - 1)] = 1.0
+    roots = np.linalg.eigvals(companion)
+    moduli = np.abs(roots)
+    # Padding adds zero roots, which never reach the maximum of a valid row.
+    r = moduli.max(axis=1)
+    tol = ROOT_TOL * np.maximum(1.0, r)
+
+    circle = moduli >= (r - tol)[:, None]
+    close = np.abs(roots[:, :, None] - roots[:, None, :]) <= tol[:, None, None]
+    members = close & circle[:, None, :]
+    counts = np.where(circle, members.sum(axis=2), 0)
+    largest = counts.argmax(axis=1)
+    m = counts[np.arange(rows), largest]
+    # Modulus of the mean of the largest cluster, as in the scalar solver.
+    cluster = members[np.arange(rows), largest]
+    r = np.abs((roots * cluster).sum(axis=1) / m)
+
+    # x = 1 is decided exactly, on the few rows whose coefficients sum to about 1.
+    ones = np.zeros(rows, dtype=np.int64)
+    for row in np.flatnonzero(np.abs(c.sum(axis=1) - 1) <= 1e-9 * np.abs(c).sum(axis=1)):
+        ones[row] = multiplicity_at_one(c[row].tolist())
+    unit = np.abs(r - 1) <= np.where(ones > 0, tol, UNIT_TOL ** (1 / m))
+    r = np.where(unit, 1.0, r)
+    m = np.where(unit, np.maximum(m, ones), m)
+
+    r[invalid] = np.nan
+    return r, m, ones
+
+
+def linear_recurrence_batch(coefficients, k=0):
+    """
+    Solve many recurrences T(n) = c_1 T(n-1) + ... + c_d T(n-d) + Θ(n^k).
+
+    coefficients is a 2-D array (one recurrence per row, padded with trailing
+    zeros) and k broadcasts against the rows. The dominant root r is returned
+    in the log_b_a field and as exp_base where it exceeds 1; invalid rows get
+    case 0.
+    """
+    r, m, ones = dominant_root_batch(coefficients)
+    k = np.broadcast_to(np.asarray(k, dtype=np.float64), r.shape)
+
+    case = np.where(r < 1, 1, np.where(r == 1, 2, 3)).astype(np.int8)
+    case[np.isnan(r) | ~np.isfinite(k)] = 0
+
+    poly_exponent = np.select(
+        [case == 1, case == 2, case == 3], [k, np.maximum(k + ones, m - 1), m - 1], default=np.nan
+    )
+    exp_base = np.where(case == 3, r, 1.0)
+    log_exponent = np.zeros(r.shape)
+    loglog = np.zeros(r.shape, dtype=bool)
+    return BatchResult(case, r, poly_exponent, log_exponent, loglog, exp_base)
@@ -0,0 +1,230 @@
+import csv
+import json
+import math
+
+from Theorems.master_theorem import master_theorem_result
+from Theorems.extended_master_theorem import extended_master_theorem_result
+from Theorems.subtractive_master_theorem import subtractive_master_theorem_result
+
+
+def linear_recurrence_result(coefficients, k=0):
+    """Solve a linear record; the solver and its Fraction arithmetic load on first use."""
+    from Theorems.linear_recurrence import linear_recurrence_result
+
+    return linear_recurrence_result(coefficients, k)
+
+
+def akra_bazzi_result(a_list, b_list, k, i=0):
+    """Solve an Akra–Bazzi record; the solver loads on first use."""
+    from Theorems.extended_master_theorem_akra_bazzi import akra_bazzi_result
+
+    return akra_bazzi_result(a_list, b_list, k, i)
+
+
+# Theorem name -> (solver, parameter names)
+SOLVERS = {
+    "master": (master_theorem_result, ("a", "b", "k")),
+    "extended": (extended_master_theorem_result, ("a", "b", "k", "i")),
+    "subtractive": (subtractive_master_theorem_result, ("a", "b", "k")),
+    "akra_bazzi": (akra_bazzi_result, ("a", "b", "k", "i")),
+    "linear": (linear_recurrence_result, ("a", "k")),
+}
+
+# (theorem, parameter) pairs holding a list of numbers
+LIST_PARAMS = {("akra_bazzi", "a"), ("akra_bazzi", "b"), ("linear", "a")}
+
+OUTPUT_FIELDS = [
+    "line", "theorem", "a", "b", "k", "i", "case", "complexity", "comparison",
+    "log_b_a", "poly_exponent", "log_exponent", "exp_base", "loglog", "error",
+]
+
+
+class RecordError(ValueError):
+    """Raised when an input record cannot be parsed or solved."""
+
+
+def _number(value, name):
+    """Convert a JSON or CSV field to an int or a finite float."""
+    if isinstance(value, bool):
+        raise RecordError(f"'{name}' must be a number, got {value!r}")
+    if isinstance(value, int):
+        return value
+    number = value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+        try:
+            number = float(value)
+        except ValueError:
+            pass
+    if isinstance(number, float):
+        if not math.isfinite(number):
+            raise RecordError(f"'{name}' must be finite, got {value!r}")
+        return number
+    raise RecordError(f"'{name}' must be a number, got {value!r}")
+
+
+def _numbers(value, name):
+    """Convert a JSON list, or a CSV field such as "1 1", to a tuple of numbers."""
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    if not isinstance(value, (list, tuple)) or not value:
+        raise RecordError(f"'{name}' must be a non-empty list of numbers, got {value!r}")
+    return tuple(_number(x, name) for x in value)
+
+
+def read_jsonl(lines):
+    """Yield (line number, record) pairs; unparsable lines yield an exception."""
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise RecordError("record must be a JSON object")
+        except ValueError as e:
+            yield line_no, RecordError(f"invalid JSON: {e}")
+        else:
+            yield line_no, record
+
+
+def read_csv(lines):
+    """Yield (line number, record) pairs from CSV text with a header row."""
+    reader = csv.DictReader(lines)
+    for record in reader:
+        # Empty cells mean "not given" so optional columns like i can be blank.
+        yield reader.line_num, {key: value for key, value in record.items() if value not in ("", None)}
+
+
+def read_text(lines):
+    """Yield (line number, record) pairs from one recurrence expression per line."""
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line_no, {"expression": line}
+
+
+def parse_record(record):
+    """Return the (theorem, params) pair an input record asks to solve."""
+    if not isinstance(record, dict):
+        raise RecordError("record must be a JSON object")
+    if "expression" in record:
+        # The parser is only loaded for records that need it.
+        from Theorems.parser import ParseError, parse_recurrence
+
+        try:
+            recurrence = parse_recurrence(record["expression"])
+        except ParseError as e:
+            raise RecordError(str(e))
+        except TypeError:
+            raise RecordError(f"'expression' must be a string, got {record['expression']!r}")
+        return recurrence.theorem, [getattr(recurrence, name) for name in SOLVERS[recurrence.theorem][1]]
+    theorem = record.get("theorem") or ("extended" if "i" in record else "master")
+    if not isinstance(theorem, str) or theorem not in SOLVERS:
+        raise RecordError(f"unknown theorem {theorem!r}")
+    names = SOLVERS[theorem][1]
+    missing = [name for name in names if name not in record]
+    if missing:
+        raise RecordError(f"missing parameter(s): {', '.join(missing)}")
+    return theorem, [
+        (_numbers if (theorem, name) in LIST_PARAMS else _number)(record[name], name) for name in names
+    ]
+
+
+def solve_record(record, exact=False):
+    """
+    Solve one input record and return its RecurrenceResult.
+
+    With exact=True, master and extended records decide log_b(a) = k with
+    exact rational arithmetic instead of a float tolerance.
+    """
+    theorem, params = parse_record(record)
+    if exact and theorem in ("master", "extended"):
+        from Theorems import exact as exact_solvers
+
+        if theorem == "master":
+            return exact_solvers.exact_master_theorem_result(*params)
+        return exact_solvers.exact_extended_master_theorem_result(*params)
+    return SOLVERS[theorem][0](*params)
+
+
+def result_row(line_no, result):
+    """Build the output row for a solved record."""
+    row = {"line": line_no}
+    row.update(result.to_dict())
+    return row
+
+
+def solve_records(records, exact=False):
+    """
+    Lazily solve (line number, record) pairs into output rows.
+
+    A bad record becomes a row with an "error" field instead of stopping the
+    stream.
+    """
+    for line_no, record in records:
+        if isinstance(record, Exception):
+            yield {"line": line_no, "error": str(record)}
+            continue
+        try:
+            row = result_row(line_no, solve_record(record, exact))
+        except (RecordError, ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
+            yield {"line": line_no, "error": str(e) or type(e).__name__}
+        else:
+            yield row
+
+
+def finite(value):
+    """Replace NaN and infinite floats, which JSON cannot represent, with None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [finite(item) for item in value]
+    return value
+
+
+def encode_json(payload):
+    """Encode a payload as strict JSON, with null for NaN and infinity."""
+    try:
+        return json.dumps(payload, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        return json.dumps(finite(payload), ensure_ascii=False, allow_nan=False)
+
+
+def write_jsonl(rows, out):
+    """Write rows as strict JSON lines; returns (rows written, error rows)."""
+    count = errors = 0
+    for row in rows:
+        out.write(encode_json(row))
+        out.write("\n")
+        count += 1
+        errors += "error" in row
+    return count, errors
+
+
+def _csv_field(value):
+    """Render list parameters as "1 1", the spelling read_csv accepts."""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(x) for x in value)
+    return value
+
+
+def write_csv(rows, out):
+    """Write rows as CSV with a fixed header; returns (rows written, error rows)."""
+    writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = errors = 0
+    for row in rows:
+        writer.writerow({key: _csv_field(value) for key, value in row.items()})
+        count += 1
+        errors += "error" in row
+    return count, errors
+
+
+READERS = {"jsonl": read_jsonl, "csv": read_csv, "text": read_text}
+WRITERS = {"jsonl": write_jsonl, "csv": write_csv}
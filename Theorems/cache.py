@@ -0,0 +1,158 @@
+import functools
+import threading
+
+
+def normalize_params(params):
+    """Normalize solver parameters so that 2 and 2.0 map to the same key."""
+    return tuple(None if p is None else float(p) for p in params)
+
+
+class SolverCache:
+    """
+    Bounded LRU cache of solver results keyed on (theorem, params).
+
+    Equal numbers hash equal (2, 2.0 and Fraction(2)), so the raw parameter
+    tuple already is a normalized key and a hit costs one dict lookup. Hits
+    and misses are counted without locking, so under threads the counters
+    are approximate. Setting enabled to False bypasses the cache entirely
+    without clearing it.
+    """
+
+    def __init__(self, maxsize=4096, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Plain dicts keep insertion order: re-inserting on every hit keeps
+        # the least recently used entry first.
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the value cached under key, or None, counting a hit or miss."""
+        entries = self._entries
+        value = entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        entries[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache value under key, evicting the least recently used entries."""
+        entries = self._entries
+        with self._lock:
+            entries.pop(key, None)
+            entries[key] = value
+            while len(entries) > self.maxsize:
+                try:
+                    del entries[next(iter(entries))]
+                except (KeyError, RuntimeError):
+                    # A concurrent get() moved the oldest entry; look again.
+                    continue
+                self.evictions += 1
+
+    def lookup(self, theorem, params):
+        """Return the result cached for params, or None, without counting a miss."""
+        key = (theorem, params)
+        entries = self._entries
+        entry = entries.pop(key, None)
+        if entry is None:
+            return None
+        entries[key] = entry
+        self.hits += 1
+        types, result = entry
+        if types == tuple(map(type, params)):
+            return result
+        # Same numbers, different spelling (2 vs 2.0): reuse the decision
+        # but render with the caller's parameters.
+        return result.with_params(*params)
+
+    def get_or_solve(self, theorem, params, solve):
+        """Return the cached result for params, calling solve(*params) on a miss."""
+        if not self.enabled:
+            return solve(*params)
+        result = self.lookup(theorem, params)
+        if result is not None:
+            return result
+        self.misses += 1
+        result = solve(*params)
+        self.put((theorem, params), (tuple(map(type, params)), result))
+        return result
+
+    def flush(self):
+        """Write pending entries to backing storage; in-memory caches have none."""
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return the hit/miss/eviction counters as a dict."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+_default_cache = SolverCache()
+
+
+def get_default_cache():
+    """Return the cache shared by all theorem solvers."""
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """Replace the cache shared by all theorem solvers."""
+    global _default_cache
+    _default_cache = cache
+
+
+def set_cache_enabled(enabled):
+    """Turn memoization of the theorem solvers on or off."""
+    _default_cache.enabled = enabled
+
+
+def _positional(solve, params, kwargs):
+    """Bind keyword arguments to positions, so they share the positional call's entry."""
+    import inspect
+
+    bound = inspect.signature(solve).bind(*params, **kwargs)
+    bound.apply_defaults()
+    return bound.args
+
+
+def cached_solver(theorem):
+    """Decorator memoizing a *_result solver in the shared cache."""
+    def decorate(solve):
+        @functools.wraps(solve)
+        def wrapper(*params, **kwargs):
+            if kwargs:
+                params = _positional(solve, params, kwargs)
+            cache = _default_cache
+            if cache.enabled:
+                # Hits are answered here, one dict lookup deep; misses go
+                # through get_or_solve, which subclasses may extend.
+                result = cache.lookup(theorem, params)
+                if result is not None:
+                    return result
+            return cache.get_or_solve(theorem, params, solve)
+
+        wrapper.uncached = solve
+        return wrapper
+
+    return decorate
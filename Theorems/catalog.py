@@ -0,0 +1,174 @@
+"""
+Incremental solving of large recurrence catalogs.
+
+A catalog is an SQLite file holding every entry's input, a content hash of
+its solver inputs and its output row. Updating it with a fresh export
+re-solves only the entries whose hash changed and reports which
+complexities moved, e.g. "O(n^1 log n) → O(n^2.000)".
+
+Entries are identified by their "id" field (or "name"); entries without
+one fall back to their expression, then to their line number. Only the
+first entry with a given id counts; later ones are reported as errors.
+"""
+from collections import namedtuple
+import hashlib
+import json
+import sqlite3
+
+from Theorems import SOLVER_VERSION
+from Theorems.bulk import RecordError, parse_record, solve_records
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    hash BLOB NOT NULL,
+    input TEXT NOT NULL,
+    row TEXT NOT NULL,
+    complexity TEXT
+)
+"""
+
+# Entries are solved and written in chunks of this many records.
+WRITE_CHUNK = 10000
+
+# status - "added", "changed" or "removed" (or "error" for an unsolvable entry)
+# old/new - complexity before and after; None where it does not exist
+Change = namedtuple("Change", ["id", "status", "old", "new"])
+
+# Counts of what an update did
+UpdateSummary = namedtuple(
+    "UpdateSummary", ["added", "changed", "unchanged", "removed", "errors", "solved"]
+)
+
+
+def entry_id(line_no, record):
+    """Return the catalog key of an input record."""
+    if isinstance(record, dict):
+        for field in ("id", "name", "expression"):
+            if record.get(field) is not None:
+                return str(record[field])
+    return f"line:{line_no}"
+
+
+def content_hash(theorem, params, exact=False):
+    """Hash the solver inputs of an entry, including the solver version."""
+    key = json.dumps([SOLVER_VERSION, bool(exact), theorem, params])
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def connect(path):
+    """Open (creating if needed) the catalog database at path."""
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(SCHEMA)
+    return db
+
+
+def load_hashes(db):
+    """Return {id: (hash, complexity)} for every stored entry in one query."""
+    return {row[0]: (row[1], row[2]) for row in db.execute("SELECT id, hash, complexity FROM entries")}
+
+
+def _flush(db, pending, stored, exact, solver, summary, changes):
+    """Solve pending (line, record, id, hash) entries and write them in one transaction."""
+    rows = solver([(line_no, record) for line_no, record, _, _ in pending], exact)
+    writes = []
+    for (_, record, key, digest), row in zip(pending, rows):
+        if "error" in row:
+            summary["errors"] += 1
+            changes.append(Change(key, "error", None, row["error"]))
+            continue
+        row.pop("line", None)
+        new = row.get("complexity")
+        if key in stored:
+            old = stored[key][1]
+            summary["changed"] += 1
+            if old != new:
+                changes.append(Change(key, "changed", old, new))
+        else:
+            summary["added"] += 1
+            changes.append(Change(key, "added", None, new))
+        writes.append((key, digest, json.dumps(record, ensure_ascii=False),
+                       json.dumps(row, ensure_ascii=False), new))
+    summary["solved"] += len(pending)
+    with db:
+        db.executemany(
+            "INSERT OR REPLACE INTO entries (id, hash, input, row, complexity) VALUES (?, ?, ?, ?, ?)",
+            writes,
+        )
+
+
+def update_catalog(db, records, exact=False, prune=False, solver=None):
+    """
+    Bring the catalog up to date with (line number, record) pairs.
+
+    Only entries that are new or whose solver inputs changed are solved.
+    A record that cannot be parsed, or repeats the id of an earlier one, is
+    counted as an error and does not stop the update. With prune=True, stored entries missing from records are deleted.
+    solver(pairs, exact) yields output rows; it defaults to the serial bulk
+    solver. Returns (UpdateSummary, list of Change) where unchanged
+    complexities are left out of the changes.
+    """
+    solver = solver or (lambda pairs, exact: list(solve_records(pairs, exact)))
+    stored = load_hashes(db)
+    # id -> line number of the record that defined it
+    seen = {}
+    summary = dict.fromkeys(UpdateSummary._fields, 0)
+    changes = []
+    pending = []
+
+    for line_no, record in records:
+        key = entry_id(line_no, record)
+        if key in seen:
+            summary["errors"] += 1
+            changes.append(Change(key, "error", None, f"duplicate id, first given on line {seen[key]}"))
+            continue
+        seen[key] = line_no
+        if isinstance(record, Exception):
+            summary["errors"] += 1
+            changes.append(Change(key, "error", None, str(record)))
+            continue
+        try:
+            theorem, params = parse_record(record)
+            digest = content_hash(theorem, params, exact)
+        except (RecordError, ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
+            summary["errors"] += 1
+            changes.append(Change(key, "error", None, str(e) or type(e).__name__))
+            continue
+        if key in stored and stored[key][0] == digest:
+            summary["unchanged"] += 1
+            continue
+        pending.append((line_no, record, key, digest))
+        if len(pending) >= WRITE_CHUNK:
+            _flush(db, pending, stored, exact, solver, summary, changes)
+            pending = []
+    if pending:
+        _flush(db, pending, stored, exact, solver, summary, changes)
+
+    removed = [key for key in stored if key not in seen]
+    summary["removed"] = len(removed)
+    changes.extend(Change(key, "removed", stored[key][1], None) for key in removed)
+    if prune and removed:
+        with db:
+            db.executemany("DELETE FROM entries WHERE id = ?", ((key,) for key in removed))
+    return UpdateSummary(**summary), changes
+
+
+def iter_rows(db):
+    """Yield the stored output rows, each with its catalog id."""
+    for key, row in db.execute("SELECT id, row FROM entries ORDER BY id"):
+        row = json.loads(row)
+        row["id"] = key
+        yield row
+
+
+def format_change(change):
+    """Render a Change as one line of text."""
+    if change.status == "changed":
+        return f"{change.id}: {change.old} → {change.new}"
+    if change.status == "added":
+        return f"{change.id}: added {change.new}"
+    if change.status == "removed":
+        return f"{change.id}: removed (was {change.old})"
+    return f"{change.id}: error: {change.new}"
@@ -0,0 +1,174 @@
+"""
+Pick the cheapest theorem that applies to a recurrence and solve it.
+
+Rules are tried from the cheapest to the most general:
+
+    subtractive  T(n) = a T(n-b) + Θ(n^k)
+    master       T(n) = a T(n/b) + Θ(n^k) with a ≥ 1
+    extended     T(n) = a T(n/b) + Θ(n^k (log n)^i) with a ≥ 1 and i ≠ 0
+    akra_bazzi   several T(n/b_j) terms, or one term with 0 < a < 1
+    linear       several T(n-j) terms: roots of the characteristic polynomial
+
+The rule that fired is the theorem field of the returned result.
+"""
+from collections import namedtuple
+
+from Theorems.master_theorem import master_theorem_result
+from Theorems.extended_master_theorem import extended_master_theorem_result
+from Theorems.subtractive_master_theorem import subtractive_master_theorem_result
+from Theorems.extended_master_theorem_akra_bazzi import akra_bazzi_result
+from Theorems.linear_recurrence import linear_recurrence_result, shift_coefficients
+
+# Rule name -> why it applies
+RULES = {
+    "subtractive": "T(n-b) term with f(n) = Θ(n^k): subtractive master theorem",
+    "master": "one T(n/b) term, a ≥ 1 and f(n) = Θ(n^k): master theorem",
+    "extended": "one T(n/b) term, a ≥ 1 and a log factor in f(n): extended master theorem",
+    "akra_bazzi": "several T(n/b_j) terms or 0 < a < 1: Akra–Bazzi method",
+    "linear": "several T(n-j) terms: dominant root of the characteristic polynomial",
+}
+
+# Rule codes used by solve_batch, in RULES order
+RULE_NAMES = tuple(RULES)
+
+# rule - int8 array of indices into RULE_NAMES, one per row
+# result - BatchResult for every row
+BatchSolution = namedtuple("BatchSolution", ["rule", "result"])
+
+
+def classify(a, b, k, i=0, subtractive=False):
+    """Return the name of the rule solve() uses for these parameters."""
+    if subtractive:
+        if i:
+            raise ValueError("no rule applies to T(n-b) recurrences with a log factor")
+        if isinstance(a, (list, tuple)) and len(a) > 1:
+            return "linear"
+        return "subtractive"
+    if isinstance(a, (list, tuple)):
+        if len(a) > 1:
+            return "akra_bazzi"
+        a = a[0]
+    if 0 < a < 1:
+        return "akra_bazzi"
+    return "extended" if i else "master"
+
+
+def solve(a, b=None, k=0, i=0, subtractive=False, exact=False):
+    """
+    Solve a recurrence with the cheapest applicable theorem.
+
+    Either pass the parameters of T(n) = a T(n/b) + Θ(n^k (log n)^i) (a and b
+    may be lists for several terms, subtractive=True means T(n-b) and then
+    several terms need integer shifts b_j), or pass a
+    single recurrence string, parser Recurrence or bulk input record as a.
+    exact=True decides the master/extended boundary with exact arithmetic.
+    Returns a RecurrenceResult whose theorem field names the rule that fired.
+    Raises ValueError for the parameters solve_batch reports as case 0.
+    """
+    if b is None:
+        return _solve_recurrence(a, exact)
+    if subtractive:
+        if i:
+            raise ValueError("no rule applies to T(n-b) recurrences with a log factor")
+        if isinstance(a, (list, tuple)):
+            if len(a) > 1:
+                return linear_recurrence_result(shift_coefficients(a, b), k)
+            a, b = a[0], b[0]
+        return subtractive_master_theorem_result(a, b, k)
+    if isinstance(a, (list, tuple)):
+        if len(a) > 1:
+            return akra_bazzi_result(a, b, k, i)
+        a, b = a[0], b[0]
+    if not (a > 0 and b > 1):
+        # The rule solve_batch applies: such rows get case 0 there.
+        raise ValueError(f"T(n) = a T(n/b) + f(n) needs a > 0 and b > 1, got a = {a}, b = {b}")
+    if 0 < a < 1:
+        return akra_bazzi_result((a,), (b,), k, i)
+    if exact:
+        from Theorems import exact as exact_solvers
+
+        if i:
+            return exact_solvers.exact_extended_master_theorem_result(a, b, k, i)
+        return exact_solvers.exact_master_theorem_result(a, b, k)
+    if i:
+        return extended_master_theorem_result(a, b, k, i)
+    return master_theorem_result(a, b, k)
+
+
+def _solve_recurrence(recurrence, exact):
+    """Solve a recurrence string, parser Recurrence or bulk input record."""
+    from Theorems.parser import Recurrence, parse_recurrence
+
+    if isinstance(recurrence, str):
+        recurrence = parse_recurrence(recurrence)
+    if isinstance(recurrence, Recurrence):
+        theorem, a, b, k, i = recurrence
+        if theorem == "linear":
+            return linear_recurrence_result(a, k)
+        return solve(a, b, k, i, theorem == "subtractive", exact)
+
+    from Theorems.bulk import parse_record
+
+    theorem, params = parse_record(recurrence)
+    if theorem == "linear":
+        return linear_recurrence_result(*params)
+    return solve(*params[:3], *params[3:], subtractive=theorem == "subtractive", exact=exact)
+
+
+def solve_batch(a, b, k, i=0, subtractive=False):
+    """
+    Solve a mixed batch of single-term recurrences, one per row.
+
+    a, b, k, i and subtractive are broadcastable array-likes. Rows are
+    partitioned by rule and every partition is solved with one vectorized
+    call. Returns a BatchSolution; invalid rows get case 0.
+    """
+    import numpy as np
+    from Theorems import batch
+
+    a, b, k, i, subtractive = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64),
+        np.asarray(k, dtype=np.float64), np.asarray(i, dtype=np.float64),
+        np.asarray(subtractive, dtype=bool),
+    )
+    shape = a.shape
+    a, b, k, i, subtractive = (x.ravel() for x in (a, b, k, i, subtractive))
+
+    rule = np.where(
+        subtractive, 0,
+        np.where((a > 0) & (a < 1), 3, np.where(i != 0, 2, 1)),
+    ).astype(np.int8)
+    # Rows no rule can solve are left at case 0 and never reach a solver:
+    # T(n/b) needs a > 0 and b > 1, and T(n-b) takes no log factor.
+    invalid = np.where(subtractive, i != 0, ~((a > 0) & (b > 1)))
+
+    case = np.zeros(a.shape, dtype=np.int8)
+    log_b_a = np.full(a.shape, np.nan)
+    poly_exponent = np.full(a.shape, np.nan)
+    log_exponent = np.zeros(a.shape)
+    loglog = np.zeros(a.shape, dtype=bool)
+    exp_base = np.ones(a.shape)
+
+    for code, name in enumerate(RULE_NAMES):
+        rows = np.flatnonzero((rule == code) & ~invalid)
+        if not rows.size:
+            continue
+        if name == "subtractive":
+            part = batch.subtractive_master_theorem_batch(a[rows], b[rows], k[rows])
+            exp_base[rows] = part.exp_base
+        elif name == "master":
+            part = batch.master_theorem_batch(a[rows], b[rows], k[rows])
+        elif name == "extended":
+            part = batch.extended_master_theorem_batch(a[rows], b[rows], k[rows], i[rows])
+        else:
+            part = batch.akra_bazzi_batch(a[rows, None], b[rows, None], k[rows], i[rows])
+        case[rows] = part.case
+        log_b_a[rows] = part.log_b_a
+        poly_exponent[rows] = part.poly_exponent
+        log_exponent[rows] = part.log_exponent
+        loglog[rows] = part.loglog
+
+    result = batch.BatchResult(
+        *(x.reshape(shape) for x in (case, log_b_a, poly_exponent, log_exponent, loglog, exp_base))
+    )
+    return BatchSolution(rule.reshape(shape), result)
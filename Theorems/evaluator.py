@@ -0,0 +1,158 @@
+from collections import namedtuple
+import math
+
+import numpy as np
+
+# Sampled values of a recurrence: n and log T(n) (natural log) at each sample.
+Evaluation = namedtuple("Evaluation", ["n", "log_t"])
+
+# Outcome of checking a solver result against the evaluated recurrence.
+# verdict       - "tight", "loose" (bound grows faster) or "violated"
+# drift         - growth of log(T(n) / bound) measured in powers of log n
+# fitted_exponent - least-squares slope of log T(n) against log n on the tail
+Verification = namedtuple("Verification", ["verdict", "drift", "fitted_exponent", "evaluation"])
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _chain_log(log_a, log_start, log_f):
+    """
+    Evaluate T_j = a T_{j-1} + f_j for j = 1..m entirely in log space.
+
+    log_start is log T_0 and log_f holds log f_j. Unrolling the recurrence
+    gives T_j = a^j (T_0 + sum_{u<=j} a^-u f_u), so one logaddexp.accumulate
+    replaces the Python loop and nothing overflows.
+    """
+    j = np.arange(1, len(log_f) + 1, dtype=np.float64)
+    scaled = np.logaddexp.accumulate(log_f - j * log_a)
+    return j * log_a + np.logaddexp(log_start, scaled)
+
+
+def _check_a(a):
+    if a <= 0:
+        raise ValueError("a must be positive to evaluate the recurrence")
+    return math.log(a)
+
+
+def evaluate_dividing(a, b, k, i=0, n_max=1e12, base=1.0):
+    """
+    Evaluate T(n) = a T(n/b) + n^k (log n)^i with T(1) = base.
+
+    T is tabulated bottom-up at n = b, b^2, ... up to n_max, which is exact
+    for those n and needs only log_b(n_max) table entries.
+    """
+    log_a = _check_a(a)
+    if b <= 1:
+        raise ValueError("b must be greater than 1")
+    levels = int(math.log(n_max) / math.log(b))
+    if levels < 1:
+        raise ValueError("n_max must be at least b")
+
+    log_n = np.arange(1, levels + 1, dtype=np.float64) * math.log(b)
+    log_f = k * log_n
+    if i:
+        log_f += i * np.log(log_n)
+    log_t = _chain_log(log_a, math.log(base), log_f)
+    return Evaluation(np.exp(log_n), log_t)
+
+
+def evaluate_subtractive(a, b, k, n_max=1e6, base=1.0, samples=512,
+                         chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Evaluate T(n) = a T(n - b) + n^k with T(0) = base.
+
+    Steps n = b, 2b, ... are processed in fixed-size chunks, carrying only the
+    last value between chunks, so memory stays constant even for 10^8 steps.
+    About `samples` geometrically spaced values are kept for fitting.
+    """
+    log_a = _check_a(a)
+    if b <= 0:
+        raise ValueError("b must be positive")
+    steps = int(n_max / b)
+    if steps < 1:
+        raise ValueError("n_max must be at least b")
+
+    wanted = np.unique(np.geomspace(1, steps, samples).astype(np.int64))
+    sample_n = []
+    sample_log_t = []
+    log_last = math.log(base)
+    for start in range(1, steps + 1, chunk_size):
+        stop = min(start + chunk_size, steps + 1)
+        j = np.arange(start, stop, dtype=np.float64)
+        log_t = _chain_log(log_a, log_last, k * np.log(j * b))
+        log_last = log_t[-1]
+
+        picked = wanted[(wanted >= start) & (wanted < stop)]
+        sample_n.append(picked * b)
+        sample_log_t.append(log_t[picked - start])
+
+    return Evaluation(
+        np.concatenate(sample_n).astype(np.float64), np.concatenate(sample_log_t)
+    )
+
+
+def evaluate(result, n_max=None, base=1.0):
+    """
+    Numerically evaluate the recurrence a solver result describes.
+
+    Only single-term forms (master, extended and subtractive results) can be
+    evaluated; other results raise ValueError.
+    """
+    if result.theorem == "subtractive":
+        return evaluate_subtractive(result.a, result.b, result.k, n_max or 1e6, base)
+    if result.theorem not in ("master", "extended"):
+        raise ValueError(f"cannot evaluate {result.theorem} recurrences numerically")
+    return evaluate_dividing(result.a, result.b, result.k, result.i or 0, n_max or 1e12, base)
+
+
+def predicted_log(result, n):
+    """Return log of the solver's bound evaluated at the sample points n."""
+    n = np.asarray(n, dtype=np.float64)
+    log_n = np.log(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_log_n = np.log(log_n)
+        predicted = result.poly_exponent * log_n
+        if result.log_exponent:
+            predicted = predicted + result.log_exponent * log_log_n
+        if result.loglog:
+            predicted = predicted + np.log(log_log_n)
+    if result.exp_rate:
+        predicted = predicted + n * result.exp_rate
+    return predicted
+
+
+def fit_exponent(evaluation, tail=0.5):
+    """Least-squares slope of log T(n) against log n over the tail of the samples."""
+    log_n = np.log(evaluation.n)
+    mask = log_n >= log_n[0] + (1 - tail) * (log_n[-1] - log_n[0])
+    slope, _ = np.polyfit(log_n[mask], evaluation.log_t[mask], 1)
+    return float(slope)
+
+
+def verify(result, n_max=None, base=1.0, tolerance=0.5):
+    """
+    Check a solver result against the numerically evaluated recurrence.
+
+    log(T(n) / bound) is compared between the middle and the end of the
+    evaluated range, normalized by the change in log log n. A tight Θ bound
+    keeps this drift near zero; a missing log n factor shows up as a drift
+    of about 1, a polynomial error as a much larger one.
+    """
+    evaluation = evaluate(result, n_max, base)
+    ratio = evaluation.log_t - predicted_log(result, evaluation.n)
+    valid = np.isfinite(ratio) & (evaluation.n > math.e)
+    n = evaluation.n[valid]
+    ratio = ratio[valid]
+
+    mid = np.searchsorted(n, math.sqrt(n[0] * n[-1]))
+    mid = min(mid, len(n) - 2)
+    span = math.log(math.log(n[-1])) - math.log(math.log(n[mid]))
+    drift = float((ratio[-1] - ratio[mid]) / span)
+
+    if abs(drift) < tolerance:
+        verdict = "tight"
+    elif drift < 0:
+        verdict = "loose"
+    else:
+        verdict = "violated"
+    return Verification(verdict, drift, fit_exponent(evaluation), evaluation)
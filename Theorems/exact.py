@@ -0,0 +1,137 @@
+from fractions import Fraction
+import math
+
+from Theorems.cache import cached_solver
+from Theorems.master_theorem import make_master_result
+from Theorems.extended_master_theorem import make_extended_result
+
+# Float comparisons further apart than this (relative) cannot be flipped by
+# rounding in math.log, so they are decided without exact arithmetic.
+FAST_PATH_MARGIN = 1e-12
+
+# Give up on exact comparison when a^s or b^r would exceed this many bits.
+MAX_BITS = 1 << 16
+
+# How each decision was made: "fast" (float far from the boundary), "exact"
+# (rational arithmetic) or "fallback" (float tolerance, exact was too costly).
+_counters = {"fast": 0, "exact": 0, "fallback": 0}
+
+
+def exact_stats():
+    """Return how many decisions took the fast, exact and fallback paths."""
+    stats = dict(_counters)
+    total = sum(stats.values())
+    stats["fallback_rate"] = stats["fallback"] / total if total else 0.0
+    return stats
+
+
+def reset_exact_stats():
+    for key in _counters:
+        _counters[key] = 0
+
+
+def to_fraction(x):
+    """
+    Convert a number to a Fraction, or None if it has no exact value.
+
+    Floats are read by their shortest decimal spelling, so 0.1 means 1/10
+    and 1.5 means 3/2, matching what the user typed.
+    """
+    if isinstance(x, float):
+        if not math.isfinite(x):
+            return None
+        return Fraction(int(x)) if x.is_integer() else Fraction(repr(x))
+    try:
+        return Fraction(x)
+    except (TypeError, ValueError):
+        return None
+
+
+def compare_log(a, b, k):
+    """
+    Exactly compare log_b(a) with k.
+
+    Returns -1, 0 or 1 for log_b(a) <, = or > k, or None when the inputs have
+    no exact value or the comparison would need huge integers. With k = r/s,
+    log_b(a) vs k is decided by comparing a^s with b^r, which is exact.
+    """
+    fa, fb, fk = to_fraction(a), to_fraction(b), to_fraction(k)
+    if fa is None or fb is None or fk is None or fa <= 0 or fb <= 0 or fb == 1:
+        return None
+
+    r, s = fk.numerator, fk.denominator
+    a_bits = max(fa.numerator.bit_length(), fa.denominator.bit_length())
+    b_bits = max(fb.numerator.bit_length(), fb.denominator.bit_length())
+    if s * a_bits + abs(r) * b_bits > MAX_BITS:
+        return None
+
+    lhs = fa ** s
+    rhs = fb ** r
+    sign = (lhs > rhs) - (lhs < rhs)
+    # log_b is decreasing when b < 1, which flips the comparison.
+    return -sign if fb < 1 else sign
+
+
+def decide(a, b, k, log_b_a):
+    """
+    Return the sign of log_b(a) - k, deciding exactly near the boundary.
+
+    Falls back to math.isclose with the solvers' tolerance (returning 0 when
+    close) if exact comparison is not possible.
+    """
+    diff = log_b_a - k
+    if abs(diff) > FAST_PATH_MARGIN * max(1.0, abs(log_b_a), abs(k)):
+        _counters["fast"] += 1
+        return 1 if diff > 0 else -1
+
+    sign = compare_log(a, b, k)
+    if sign is not None:
+        _counters["exact"] += 1
+        return sign
+
+    _counters["fallback"] += 1
+    if math.isclose(log_b_a, k, rel_tol=1e-9):
+        return 0
+    return 1 if diff > 0 else -1
+
+
+@cached_solver("master_exact")
+def exact_master_theorem_result(a, b, k):
+    """
+    Solve T(n) = a T(n/b) + Θ(n^k), deciding log_b(a) = k exactly.
+
+    Case 2 applies only when log_b(a) equals k exactly (e.g. a=8, b=4,
+    k=1.5), so rounding in math.log can no longer move a recurrence
+    between cases.
+    """
+    log_b_a = math.log(a, b)
+    sign = decide(a, b, k, log_b_a)
+    if sign == 0:
+        # Report the exact value rather than the rounded float, e.g. 1.5
+        # instead of 1.4999999999999998.
+        log_b_a = float(k)
+    case = {1: 1, 0: 2, -1: 3}[sign]
+    return make_master_result(a, b, k, log_b_a, case)
+
+
+@cached_solver("extended_exact")
+def exact_extended_master_theorem_result(a, b, k, i):
+    """
+    Solve T(n) = a T(n/b) + Θ(n^k (log n)^i), deciding log_b(a) = k exactly.
+    """
+    log_b_a = math.log(a, b)
+    sign = decide(a, b, k, log_b_a)
+    if sign == 0:
+        log_b_a = float(k)
+    case = {-1: 1, 0: 2, 1: 3}[sign]
+    return make_extended_result(a, b, k, i, log_b_a, case)
+
+
+def exact_master_theorem(a, b, k):
+    """Exact-decision master_theorem; returns (complexity, case, comparison)."""
+    return exact_master_theorem_result(a, b, k).as_tuple()
+
+
+def exact_extended_master_theorem(a, b, k, i):
+    """Exact-decision extended_master_theorem; returns (complexity, case, comparison)."""
+    return exact_extended_master_theorem_result(a, b, k, i).as_tuple()
@@ -1,37 +1,83 @@
 import math
 
-def extended_master_theorem(a, b, k, i):
+from Theorems.cache import cached_solver
+from Theorems.result import RecurrenceResult, register_formatter
+
+
+@cached_solver("extended")
+def extended_master_theorem_result(a, b, k, i):
     """
     Solve recurrence of the form:
     T(n) = a T(n/b) + Θ(n^k (log n)^i)
+    Returns:
+        RecurrenceResult holding the case and the numeric exponents
     """
     log_b_a = math.log(a, b)
 
     if log_b_a < k:
-        complexity = f"O(n^{k} (log n)^{i})"
         case = 1
-        comparison = f"log_{b}({a}) = {log_b_a:.3f} < k = {k}"
     elif math.isclose(log_b_a, k):
+        case = 2
+    else:
+        case = 3
+
+    return make_extended_result(a, b, k, i, log_b_a, case)
+
+
+def make_extended_result(a, b, k, i, log_b_a, case):
+    """Build the RecurrenceResult for a decided case."""
+    loglog = False
+    if case == 1:
+        poly_exponent, log_exponent = k, i
+    elif case == 2:
+        poly_exponent = k
+        log_exponent = i + 1 if i > -1 else 0
+        loglog = i == -1
+    else:
+        poly_exponent, log_exponent = log_b_a, 0
+
+    return RecurrenceResult(
+        "extended", a, b, k, i, case, log_b_a, poly_exponent, log_exponent, loglog=loglog
+    )
+
+
+def extended_master_theorem(a, b, k, i):
+    """
+    Solve recurrence of the form:
+    T(n) = a T(n/b) + Θ(n^k (log n)^i)
+    Returns:
+        complexity (str), case (int), comparison (str)
+    """
+    return extended_master_theorem_result(a, b, k, i).as_tuple()
+
+
+def format_extended_result(a, b, k, i, log_b_a, case):
+    """Build the (complexity, case, comparison) strings for a decided case."""
+    if case == 1:
+        complexity = f"O(n^{k} (log n)^{i})"
+        comparison = f"log_{b}({a}) = {log_b_a:.3f} < k = {k}"
+    elif case == 2:
         if i > -1:
             complexity = f"O(n^{k} (log n)^{i+1})"
-            case = 2
             comparison = f"log_{b}({a}) = {log_b_a:.3f} ≈ k = {k}, i = {i} > -1"
         elif i == -1:
             complexity = f"O(n^{k} log log n)"
-            case = 2
             comparison = f"log_{b}({a}) = {log_b_a:.3f} ≈ k = {k}, i = {i}"
         else:
             complexity = f"O(n^{k})"
-            case = 2
             comparison = f"log_{b}({a}) = {log_b_a:.3f} ≈ k = {k}, i = {i} < -1"
     else:
         complexity = f"O(n^{log_b_a:.3f})"
-        case = 3
         comparison = f"log_{b}({a}) = {log_b_a:.3f} > k = {k}"
 
     return complexity, case, comparison
 
 
+register_formatter(
+    "extended", lambda r: format_extended_result(r.a, r.b, r.k, r.i, r.log_b_a, r.case)
+)
+
+
 def print_extended_master_result(a, b, k, i):
     complexity, case, comparison = extended_master_theorem(a, b, k, i)
     
@@ -0,0 +1,167 @@
+import functools
+import math
+
+from Theorems.result import RecurrenceResult, register_formatter
+
+# Tolerance used both for the root finder and for deciding p ≈ k.
+REL_TOL = 1e-9
+ABS_TOL = 1e-12
+
+# Bracket doublings before giving up; past about 1024 doublings the bracket
+# ends are infinite anyway.
+MAX_DOUBLINGS = 1100
+
+
+def _check_coefficients(a_list, b_list):
+    if len(a_list) != len(b_list) or not a_list:
+        raise ValueError("a and b must be non-empty and of the same length")
+    if any(a <= 0 for a in a_list):
+        raise ValueError("every a_i must be positive")
+    if any(b <= 1 for b in b_list):
+        raise ValueError("every b_i must be greater than 1")
+
+
+@functools.lru_cache(maxsize=4096)
+def _critical_exponent(a_list, b_list):
+    # h(p) = log(sum a_i b_i^-p) is strictly decreasing and convex, so the
+    # root of h is unique. Working in log space nothing overflows, however far
+    # the root is, and Newton steps on h converge even from far away.
+    log_a = [math.log(a) for a in a_list]
+    log_b = [math.log(b) for b in b_list]
+
+    def h(p):
+        x = [la - p * lb for la, lb in zip(log_a, log_b)]
+        m = max(x)
+        return m + math.log(sum(math.exp(v - m) for v in x))
+
+    def dh(p):
+        x = [la - p * lb for la, lb in zip(log_a, log_b)]
+        m = max(x)
+        w = [math.exp(v - m) for v in x]
+        return -sum(wi * lb for wi, lb in zip(w, log_b)) / sum(w)
+
+    # Bracket the root: h(lo) > 0 > h(hi).
+    lo, hi = -1.0, 1.0
+    for _ in range(MAX_DOUBLINGS):
+        if h(lo) > 0:
+            break
+        lo *= 2
+    for _ in range(MAX_DOUBLINGS):
+        if h(hi) < 0:
+            break
+        hi *= 2
+    if not (math.isfinite(lo) and math.isfinite(hi) and h(lo) > 0 > h(hi)):
+        raise ValueError(f"the critical exponent of a={list(a_list)}, b={list(b_list)} "
+                         f"is out of floating-point range")
+
+    # Newton steps, falling back to bisection whenever a step leaves the bracket.
+    p = (lo + hi) / 2
+    for _ in range(200):
+        value = h(p)
+        if value == 0:
+            return p
+        if value > 0:
+            lo = p
+        else:
+            hi = p
+        step = p - value / dh(p)
+        p_next = step if lo < step < hi else (lo + hi) / 2
+        if abs(p_next - p) <= 4e-16 * max(1.0, abs(p)):
+            return p_next
+        p = p_next
+    return p
+
+
+def critical_exponent(a_list, b_list):
+    """
+    Solve sum a_i / b_i^p = 1 for p.
+
+    Results are cached per coefficient set, normalized so that [1, 1] and
+    [1.0, 1.0] share an entry.
+    """
+    _check_coefficients(a_list, b_list)
+    return _critical_exponent(
+        tuple(float(a) for a in a_list), tuple(float(b) for b in b_list)
+    )
+
+
+def akra_bazzi_result(a_list, b_list, k, i=0):
+    """
+    Solve T(n) = sum a_j T(n/b_j) + Θ(n^k (log n)^i) with the Akra–Bazzi method.
+
+    The critical exponent p is stored in the result's log_b_a field. The
+    integral ∫ u^k (log u)^i / u^(p+1) du is evaluated in closed form, which
+    gives the same three cases as the master theorem.
+    Returns:
+        RecurrenceResult holding the case and the numeric exponents
+    """
+    p = critical_exponent(a_list, b_list)
+    a_list, b_list = tuple(a_list), tuple(b_list)
+    loglog = False
+
+    # Case 1: p > k, the integral converges
+    if p > k and not math.isclose(p, k, rel_tol=REL_TOL, abs_tol=ABS_TOL):
+        case, poly_exponent, log_exponent = 1, p, 0
+
+    # Case 2: p ≈ k, the integral is ∫ (log u)^i / u du
+    elif math.isclose(p, k, rel_tol=REL_TOL, abs_tol=ABS_TOL):
+        case, poly_exponent = 2, k
+        log_exponent = i + 1 if i > -1 else 0
+        loglog = i == -1
+
+    # Case 3: p < k, the integral grows like n^(k-p) (log n)^i
+    else:
+        case, poly_exponent, log_exponent = 3, k, i
+
+    return RecurrenceResult(
+        "akra_bazzi", a_list, b_list, k, i, case, p, poly_exponent, log_exponent, loglog=loglog
+    )
+
+
+def akra_bazzi(a_list, b_list, k, i=0):
+    """
+    Solve T(n) = sum a_j T(n/b_j) + Θ(n^k (log n)^i) with the Akra–Bazzi method.
+    Returns:
+        complexity (str), case (int), comparison (str)
+    """
+    return akra_bazzi_result(a_list, b_list, k, i).as_tuple()
+
+
+def format_akra_bazzi_result(a_list, b_list, k, i, p, case):
+    """Build the (complexity, case, comparison) strings for a decided case."""
+    log_factor = f" (log n)^{i}" if i else ""
+    if case == 1:
+        return f"O(n^{p:.3f})", 1, f"p = {p:.3f} > k = {k}"
+    elif case == 2:
+        if i > -1:
+            complexity = f"O(n^{k} (log n)^{i+1})" if i else f"O(n^{k} log n)"
+        elif i == -1:
+            complexity = f"O(n^{k} log log n)"
+        else:
+            complexity = f"O(n^{k})"
+        return complexity, 2, f"p = {p:.3f} ≈ k = {k}"
+    else:
+        return f"O(n^{k}{log_factor})", 3, f"p = {p:.3f} < k = {k}"
+
+
+register_formatter(
+    "akra_bazzi",
+    lambda r: format_akra_bazzi_result(r.a, r.b, r.k, r.i, r.log_b_a, r.case),
+)
+
+
+def print_akra_bazzi_result(a_list, b_list, k, i=0):
+    complexity, case, comparison = akra_bazzi(a_list, b_list, k, i)
+    terms = " + ".join(f"{a} T(n/{b})" for a, b in zip(a_list, b_list))
+    log_factor = f" (log n)^{i}" if i else ""
+
+    print(f"Recurrence relation: T(n) = {terms} + Θ(n^{k}{log_factor})")
+    print(f"Akra-Bazzi Case {case} applies: {comparison}, where sum a_i / b_i^p = 1")
+    print(f"Time complexity: {complexity}")
+
+    if case == 1:
+        print("Case 1: The work done by recursive calls dominates the combine step.")
+    elif case == 2:
+        print("Case 2: The recursive work and the combine step contribute equally.")
+    else:
+        print("Case 3: The combine step dominates the recursive work.")
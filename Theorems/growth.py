@@ -0,0 +1,172 @@
+"""
+Growth curves of solved recurrences for plotting.
+
+Series are generated on a geometric grid of n with NumPy instead of at
+every n, kept in log space so exponential bounds never overflow, capped at
+MAX_POINTS per curve and cached per parameter set.
+
+    chart = growth_chart([solve("T(n) = 7T(n/2) + n^2"), solve(2, 2, 1)], n_max=1e9)
+"""
+from functools import lru_cache
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from Theorems.evaluator import evaluate_dividing, evaluate_subtractive, predicted_log
+
+# Most points sent to the browser per curve
+MAX_POINTS = 400
+DEFAULT_POINTS = 200
+
+# Most rows in one chart, below Altair's default limit of 5000. Charts of
+# many curves get fewer points per curve.
+MAX_CHART_ROWS = 4800
+
+# Subtractive recurrences are evaluated step by step, so their numeric
+# curves stop here even when the predicted curve goes further.
+SUBTRACTIVE_EVAL_MAX = 1e6
+
+SERIES_CACHE_SIZE = 1024
+
+LOG10 = math.log(10)
+
+
+def _key(result):
+    """Cache key identifying the recurrence of a solver result."""
+    a, b = result.a, result.b
+    if isinstance(a, (list, tuple)):
+        a, b = tuple(map(float, a)), b if b is None else tuple(map(float, b))
+    else:
+        a, b = float(a), float(b)
+    return result.theorem, a, b, float(result.k), float(result.i or 0)
+
+
+def downsample(n, log_t, max_points=MAX_POINTS):
+    """Keep at most max_points samples, evenly spread over the given order."""
+    if len(n) <= max_points:
+        return n, log_t
+    keep = np.unique(np.linspace(0, len(n) - 1, max_points).round().astype(np.int64))
+    return n[keep], log_t[keep]
+
+
+def _frozen(*arrays):
+    """Mark cached arrays read-only so callers cannot corrupt the cache."""
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _predicted_series(bound, n_max, points):
+    poly_exponent, log_exponent, loglog, exp_rate = bound
+    shape = SimpleNamespace(poly_exponent=poly_exponent, log_exponent=log_exponent,
+                            loglog=loglog, exp_rate=exp_rate)
+    n = np.geomspace(2, n_max, points)
+    return _frozen(n, predicted_log(shape, n) / LOG10)
+
+
+def predicted_series(result, n_max=1e9, points=DEFAULT_POINTS):
+    """Return (n, log10 of the bound) on a geometric grid from 2 to n_max."""
+    points = min(int(points), MAX_POINTS)
+    # Keyed on the shape of the bound, so recurrences with equal bounds share a series.
+    bound = (float(result.poly_exponent), float(result.log_exponent), bool(result.loglog),
+             float(result.exp_rate))
+    return _predicted_series(bound, float(n_max), points)
+
+
+@lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _evaluated_series(key, n_max, points):
+    theorem, a, b, k, i = key
+    if theorem == "subtractive":
+        evaluation = evaluate_subtractive(a, b, k, min(n_max, SUBTRACTIVE_EVAL_MAX), samples=points)
+    elif theorem in ("master", "extended"):
+        evaluation = evaluate_dividing(a, b, k, i, n_max)
+    else:
+        raise ValueError(f"cannot evaluate {theorem} recurrences numerically")
+    n, log_t = downsample(evaluation.n, evaluation.log_t, points)
+    return _frozen(np.array(n), np.asarray(log_t) / LOG10)
+
+
+def evaluated_series(result, n_max=1e9, points=DEFAULT_POINTS):
+    """Return (n, log10 T(n)) from numerically evaluating the recurrence, with T(1) = 1."""
+    points = min(int(points), MAX_POINTS)
+    return _evaluated_series(_key(result), float(n_max), points)
+
+
+def clear_series_cache():
+    """Empty the predicted and evaluated series caches."""
+    _predicted_series.cache_clear()
+    _evaluated_series.cache_clear()
+
+
+def growth_table(results, labels=None, n_max=1e9, points=DEFAULT_POINTS, evaluated=False):
+    """
+    Return a long-format DataFrame with columns recurrence, kind, n and log10_t.
+
+    kind is "predicted" for the solver's bound and "evaluated" for the
+    numeric recurrence. Predicted curves are shifted to meet the evaluated
+    curve at its last point, since a Θ bound says nothing about constants.
+    """
+    import pandas as pd
+
+    labels = labels or [_label(result) for result in results]
+    frames = []
+    for label, result in zip(labels, results):
+        n, log10_t = predicted_series(result, n_max, points)
+        if evaluated:
+            try:
+                en, elog10_t = evaluated_series(result, n_max, points)
+            except ValueError:
+                en = None
+            if en is not None and len(en):
+                shift = elog10_t[-1] - np.interp(math.log(en[-1]), np.log(n), log10_t)
+                log10_t = log10_t + shift
+                frames.append(pd.DataFrame({"recurrence": label, "kind": "evaluated",
+                                            "n": en, "log10_t": elog10_t}))
+        frames.append(pd.DataFrame({"recurrence": label, "kind": "predicted",
+                                    "n": n, "log10_t": log10_t}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _label(result):
+    """Short text naming a solved recurrence."""
+    if result.theorem == "subtractive":
+        return f"{result.a}T(n-{result.b}) + n^{result.k}: {result.complexity}"
+    if result.theorem == "linear":
+        terms = " + ".join(f"{c}T(n-{j})" for j, c in enumerate(result.a, 1) if c)
+        return f"{terms} + n^{result.k}: {result.complexity}"
+    if result.theorem == "akra_bazzi":
+        return f"Akra–Bazzi a={list(result.a)} b={list(result.b)}: {result.complexity}"
+    log_factor = f" (log n)^{result.i}" if result.i else ""
+    return f"{result.a}T(n/{result.b}) + n^{result.k}{log_factor}: {result.complexity}"
+
+
+def growth_chart(results, labels=None, n_max=1e9, points=DEFAULT_POINTS, evaluated=False):
+    """
+    Build an Altair chart of log10 T(n) against n on a log axis.
+
+    Predicted bounds are solid lines and evaluated values dashed. Points
+    per curve are reduced so that the chart stays within MAX_CHART_ROWS.
+    """
+    import altair as alt
+
+    curves = max(1, len(results)) * (2 if evaluated else 1)
+    points = max(2, min(int(points), MAX_CHART_ROWS // curves))
+    table = growth_table(results, labels, n_max, points, evaluated)
+    return (
+        alt.Chart(table)
+        .mark_line()
+        .encode(
+            x=alt.X("n:Q", scale=alt.Scale(type="log"), title="n"),
+            y=alt.Y("log10_t:Q", title="log10 T(n)"),
+            color=alt.Color("recurrence:N", legend=alt.Legend(orient="bottom", columns=1, labelLimit=0)),
+            strokeDash=alt.StrokeDash(
+                "kind:N", title=None,
+                scale=alt.Scale(domain=["predicted", "evaluated"], range=[[1, 0], [4, 3]]),
+            ),
+            tooltip=["recurrence", "kind", alt.Tooltip("n:Q", format=".3~e"),
+                     alt.Tooltip("log10_t:Q", format=".3f")],
+        )
+        .interactive()
+    )
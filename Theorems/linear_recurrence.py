@@ -0,0 +1,303 @@
+"""
+Linear recurrences with constant coefficients,
+
+    T(n) = c_1 T(n-1) + c_2 T(n-2) + ... + c_d T(n-d) + Θ(n^k)
+
+such as T(n) = T(n-1) + T(n-2) + 1. The growth rate is decided by the root
+of the characteristic polynomial x^d - c_1 x^(d-1) - ... - c_d with the
+largest modulus r: an m-fold root gives Θ(r^n n^(m-1)) when r > 1 and
+Θ(n^(k+m)) when r = 1, and f(n) dominates when r < 1.
+
+Exact values of T(n) for huge n come from Kitamasa's method, which needs
+O(d^2 log n) integer (or modular) operations instead of n steps.
+"""
+from fractions import Fraction
+import functools
+import math
+import numbers
+
+from Theorems.result import RecurrenceResult, register_formatter
+
+# Roots closer than this (relative to max(1, r)) count as one repeated root.
+# np.roots moves an m-fold root by about eps^(1/m), so multiplicities up to
+# four are recovered.
+ROOT_TOL = 1e-3
+
+# The modulus r of an m-fold root counts as 1 within UNIT_TOL^(1/m).
+UNIT_TOL = 1e-9
+
+
+def _check_coefficients(coefficients):
+    """Return the coefficients as a tuple without trailing zeros."""
+    coefficients = tuple(coefficients)
+    if not all(isinstance(c, numbers.Real) and math.isfinite(c) for c in coefficients):
+        raise ValueError("every coefficient c_j must be a finite number")
+    while coefficients and coefficients[-1] == 0:
+        coefficients = coefficients[:-1]
+    if not coefficients:
+        raise ValueError("at least one coefficient c_j must be non-zero")
+    return coefficients
+
+
+def shift_coefficients(a_list, b_list):
+    """
+    Turn the terms a_j T(n - b_j) into the coefficient vector (c_1, ..., c_d).
+
+    Every shift b_j must be a positive integer; terms with equal shifts add up.
+    """
+    if len(a_list) != len(b_list) or not a_list:
+        raise ValueError("a and b must be non-empty and of the same length")
+    if any(float(b) != int(b) or b < 1 for b in b_list):
+        raise ValueError("every shift b_j must be a positive integer")
+    coefficients = [0] * int(max(b_list))
+    for a, b in zip(a_list, b_list):
+        coefficients[int(b) - 1] += a
+    return tuple(coefficients)
+
+
+def characteristic_roots(coefficients):
+    """Return the roots of x^d - c_1 x^(d-1) - ... - c_d as a NumPy array."""
+    import numpy as np
+
+    coefficients = _check_coefficients(coefficients)
+    return np.roots([1.0] + [-float(c) for c in coefficients])
+
+
+def multiplicity_at_one(coefficients):
+    """
+    Return how often x = 1 is a root of the characteristic polynomial.
+
+    Decided exactly: coefficients are read as the decimals they print as, so
+    0.3 and 0.7 add up to exactly 1.
+    """
+    poly = [Fraction(1)] + [-Fraction(str(c)) for c in _check_coefficients(coefficients)]
+    multiplicity = 0
+    # Synthetic division by (x - 1) while the remainder is zero.
+    while len(poly) > 1:
+        quotient = []
+        acc = 0
+        for c in poly:
+            acc += c
+            quotient.append(acc)
+        if quotient[-1] != 0:
+            break
+        poly = quotient[:-1]
+        multiplicity += 1
+    return multiplicity
+
+
+@functools.lru_cache(maxsize=4096)
+def _root_summary(coefficients):
+    """Return (r, m, multiplicity of x = 1) for a coefficient tuple."""
+    roots = characteristic_roots(coefficients)
+    moduli = abs(roots)
+    r = float(moduli.max())
+    tol = ROOT_TOL * max(1.0, r)
+    # Roots of equal modulus but different argument only add oscillation,
+    # so the bound takes the largest multiplicity found on the circle |x| = r.
+    circle = roots[moduli >= r - tol]
+    clusters = [abs(circle - z) <= tol for z in circle]
+    largest = max(clusters, key=lambda cluster: cluster.sum())
+    multiplicity = int(largest.sum())
+    # np.roots splits an m-fold root into m nearby roots whose errors cancel
+    # in their mean, so the mean is far more accurate than any one of them.
+    r = float(abs(circle[largest].mean()))
+    ones = multiplicity_at_one(coefficients)
+    # A root at exactly x = 1 is known from the exact test; roots elsewhere on
+    # the unit circle are accepted within the error np.roots makes on them.
+    if abs(r - 1) <= (tol if ones else UNIT_TOL ** (1 / multiplicity)):
+        r = 1.0
+        multiplicity = max(ones, multiplicity)
+    return r, multiplicity, ones
+
+
+def dominant_root(coefficients):
+    """
+    Return (r, m): the largest modulus r of a characteristic root and the
+    multiplicity m of that root.
+
+    Roots on the unit circle are reported as exactly r = 1. Results are
+    cached per coefficient vector.
+    """
+    return _root_summary(tuple(coefficients))[:2]
+
+
+def linear_recurrence_result(coefficients, k=0):
+    """
+    For recurrences of the form:
+    T(n) = c_1 T(n-1) + ... + c_d T(n-d) + Θ(n^k)
+    Returns:
+        RecurrenceResult holding the case, the dominant root r (in log_b_a)
+        and the numeric exponents
+    """
+    coefficients = tuple(coefficients)
+    r, m, ones = _root_summary(coefficients)
+    if r < 1:
+        return RecurrenceResult("linear", coefficients, None, k, None, 1, r, k)
+    if r == 1:
+        # f(n) resonates with the roots at x = 1; other roots on the unit
+        # circle contribute n^(m-1) on their own.
+        return RecurrenceResult("linear", coefficients, None, k, None, 2, r, max(k + ones, m - 1))
+    return RecurrenceResult("linear", coefficients, None, k, None, 3, r, m - 1, exp_base=r)
+
+
+def linear_recurrence(coefficients, k=0):
+    """
+    For recurrences of the form:
+    T(n) = c_1 T(n-1) + ... + c_d T(n-d) + Θ(n^k)
+    Returns:
+        complexity (str), case (int), explanation (str)
+    """
+    return linear_recurrence_result(coefficients, k).as_tuple()
+
+
+def _root_text(r):
+    """Render a root modulus with enough digits to tell it apart from 1."""
+    text = f"{r:.4g}"
+    return text if text != "1" else f"{r:.9g}"
+
+
+def format_linear_result(coefficients, k, r, case, poly_exponent):
+    """Build the (complexity, case, explanation) strings for a decided case."""
+    if case == 1:
+        return f"O(n^{k})", 1, f"dominant root |r| = {_root_text(r)} < 1, dominated by f(n)"
+    _, m, ones = _root_summary(tuple(coefficients))
+    if case == 2:
+        return (f"O(n^{poly_exponent})", 2,
+                f"dominant root |r| = 1 with multiplicity {m}, x = 1 with multiplicity {ones}")
+    base = _root_text(r)
+    complexity = f"O({base}^n)" if m == 1 else f"O({base}^n * n^{m - 1})"
+    return complexity, 3, f"dominant root |r| = {base} > 1 with multiplicity {m}"
+
+
+register_formatter(
+    "linear", lambda r: format_linear_result(r.a, r.k, r.log_b_a, r.case, r.poly_exponent)
+)
+
+
+def _exact(x, modulus):
+    """Convert a number for exact arithmetic: an int, or else a Fraction."""
+    if isinstance(x, numbers.Integral):
+        x = int(x)
+    elif isinstance(x, float):
+        if not math.isfinite(x):
+            raise ValueError("coefficients and initial values must be finite")
+        x = int(x) if x.is_integer() else Fraction(str(x))
+    elif not isinstance(x, (int, Fraction)):
+        raise ValueError(f"expected a number, got {x!r}")
+    if isinstance(x, Fraction) and x.denominator == 1:
+        x = x.numerator
+    if modulus is not None:
+        if not isinstance(x, int):
+            raise ValueError("modular evaluation needs integer coefficients and initial values")
+        x %= modulus
+    return x
+
+
+def _mulmod(p, q, recurrence, modulus):
+    """Multiply two polynomials of degree < d and reduce with x^d = sum c_j x^(d-j)."""
+    d = len(recurrence)
+    product = [0] * (2 * d - 1)
+    for i, x in enumerate(p):
+        if x:
+            for j, y in enumerate(q):
+                product[i + j] += x * y
+    for deg in range(2 * d - 2, d - 1, -1):
+        t = product[deg]
+        if t:
+            for j, c in enumerate(recurrence, 1):
+                product[deg - j] += t * c
+    product = product[:d]
+    if modulus is not None:
+        product = [x % modulus for x in product]
+    return product
+
+
+def linear_recurrence_value(coefficients, initial, n, forcing=(), modulus=None):
+    """
+    Return T(n) exactly for T(n) = c_1 T(n-1) + ... + c_d T(n-d) + f(n).
+
+    initial holds T(0), ..., T(d-1) and forcing the coefficients
+    (f_0, f_1, ...) of f(n) = f_0 + f_1 n + f_2 n^2 + ..., so
+    T(n) = T(n-1) + T(n-2) + 1 is coefficients=(1, 1), forcing=(1,).
+    Numbers must be ints or Fractions (integral floats are accepted). With a
+    modulus every operation is reduced mod modulus, which keeps huge n
+    cheap; without one the result is the exact, possibly enormous, value.
+
+    Uses Kitamasa's method: f(n) is absorbed by multiplying the
+    characteristic polynomial by (x - 1)^(deg f + 1), then x^n is reduced
+    modulo it by repeated squaring, in O(d^2 log n) operations.
+    """
+    if isinstance(n, bool) or not isinstance(n, int) or n < 0:
+        raise ValueError("n must be a non-negative integer")
+    if modulus is not None and (isinstance(modulus, bool) or not isinstance(modulus, int) or modulus < 1):
+        raise ValueError("modulus must be a positive integer")
+    coefficients = [_exact(c, modulus) for c in coefficients]
+    initial = [_exact(t, modulus) for t in initial]
+    forcing = [_exact(f, modulus) for f in forcing]
+    if not coefficients:
+        raise ValueError("at least one coefficient c_j is required")
+    if len(initial) != len(coefficients):
+        raise ValueError(f"expected {len(coefficients)} initial values T(0)..T({len(coefficients) - 1})")
+    while forcing and forcing[-1] == 0:
+        forcing.pop()
+
+    # Characteristic polynomial, highest power first, times (x - 1)^(deg f + 1).
+    poly = [1] + [-c for c in coefficients]
+    for _ in range(len(forcing)):
+        poly = [x - y for x, y in zip(poly + [0], [0] + poly)]
+    recurrence = [-x for x in poly[1:]]
+    d = len(recurrence)
+
+    # T(0), ..., T(d-1) of the homogeneous recurrence, from the original one.
+    values = list(initial)
+    for t in range(len(values), d):
+        value = sum(c * values[t - j] for j, c in enumerate(coefficients, 1))
+        value += sum(f * t ** e for e, f in enumerate(forcing))
+        values.append(value % modulus if modulus is not None else value)
+    if n < d:
+        return values[n]
+
+    # x^n mod the characteristic polynomial, low powers first.
+    result = [1] + [0] * (d - 1)
+    base = [0, 1] + [0] * (d - 2) if d > 1 else [recurrence[0]]
+    if modulus is not None:
+        base = [x % modulus for x in base]
+    while n:
+        if n & 1:
+            result = _mulmod(result, base, recurrence, modulus)
+        n >>= 1
+        if n:
+            base = _mulmod(base, base, recurrence, modulus)
+    value = sum(x * t for x, t in zip(result, values))
+    if modulus is not None:
+        return value % modulus
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return value.numerator
+    return value
+
+
+def print_linear_recurrence_result(coefficients, k=0):
+    complexity, case, explanation = linear_recurrence(coefficients, k)
+    terms = " + ".join(f"{c} T(n-{j})" for j, c in enumerate(coefficients, 1) if c).replace("+ -", "- ")
+    print(f"Recurrence relation: T(n) = {terms} + Θ(n^{k})")
+    print(f"Case {case} applies: {explanation}")
+    print(f"Time complexity: {complexity}\n")
+
+
+# example
+if __name__ == "__main__":
+    sample_tests = [
+        ((1, 1), 0),
+        ((1, 1), 2),
+        ((2, -1), 0),
+        ((0.5,), 1),
+        ((4, -4), 0),
+        ((0, 0, 2), 0),
+    ]
+
+    for coefficients, k in sample_tests:
+        print_linear_recurrence_result(coefficients, k)
+
+    print(f"Fibonacci F(100) = {linear_recurrence_value((1, 1), (0, 1), 100)}")
+    print(f"F(10^18) mod 1e9+7 = {linear_recurrence_value((1, 1), (0, 1), 10 ** 18, modulus=10 ** 9 + 7)}")
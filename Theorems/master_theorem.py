@@ -1,21 +1,60 @@
 import math
 
-def master_theorem(a, b, k):
+from Theorems.cache import cached_solver
+from Theorems.result import RecurrenceResult, register_formatter
+
+
+@cached_solver("master")
+def master_theorem_result(a, b, k):
+    """
+    Solve T(n) = a T(n/b) + Θ(n^k).
+    Returns:
+        RecurrenceResult holding the case and the numeric exponents
+    """
     log_b_a = math.log(a, b)
 
     # Case 1: log_b(a) > k
     if log_b_a > k:
-        return f"O(n^{log_b_a:.3f})", 1, f"log_{b}({a}) = {log_b_a:.3f} > {k}"
+        case = 1
 
     # Case 2: log_b(a) ≈ k
     elif math.isclose(log_b_a, k, rel_tol=1e-9):
-        return f"O(n^{k} log n)", 2, f"log_{b}({a}) = {log_b_a:.3f} ≈ {k}"
+        case = 2
 
     # Case 3: log_b(a) < k
+    else:
+        case = 3
+
+    return make_master_result(a, b, k, log_b_a, case)
+
+
+def make_master_result(a, b, k, log_b_a, case):
+    """Build the RecurrenceResult for a decided case."""
+    poly_exponent = log_b_a if case == 1 else k
+    log_exponent = 1 if case == 2 else 0
+    return RecurrenceResult("master", a, b, k, None, case, log_b_a, poly_exponent, log_exponent)
+
+
+def master_theorem(a, b, k):
+    """Solve T(n) = a T(n/b) + Θ(n^k) as (complexity, case, comparison) strings."""
+    return master_theorem_result(a, b, k).as_tuple()
+
+
+def format_master_result(a, b, k, log_b_a, case):
+    """Build the (complexity, case, comparison) strings for a decided case."""
+    if case == 1:
+        return f"O(n^{log_b_a:.3f})", 1, f"log_{b}({a}) = {log_b_a:.3f} > {k}"
+    elif case == 2:
+        return f"O(n^{k} log n)", 2, f"log_{b}({a}) = {log_b_a:.3f} ≈ {k}"
     else:
         return f"O(n^{k})", 3, f"log_{b}({a}) = {log_b_a:.3f} < {k}"
 
 
+register_formatter(
+    "master", lambda r: format_master_result(r.a, r.b, r.k, r.log_b_a, r.case)
+)
+
+
 def print_master_theorem_result(a, b, k):
     complexity, case, comparison = master_theorem(a, b, k)
 
@@ -30,6 +69,7 @@ def print_master_theorem_result(a, b, k):
     else:
         print("Case 3: The combine step dominates the recursive work.")
 
+
 master_test_cases = [
     {
         "a": 2,
@@ -67,4 +107,7 @@ def run_master_test_cases():
 
         print("-" * 50)
 
-run_master_test_cases()
+
+if __name__ == "__main__":
+    run_master_test_cases()
+
@@ -0,0 +1,7 @@
+# The Muster theorem is the decreasing-function counterpart of the master
+# theorem, T(n) = a T(n - b) + Θ(n^k), implemented in subtractive_master_theorem.
+from Theorems.subtractive_master_theorem import (
+    subtractive_master_theorem as muster_theorem,
+    subtractive_master_theorem_result as muster_theorem_result,
+    print_subtractive_master_result as print_muster_theorem_result,
+)
@@ -0,0 +1,123 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+
+from Theorems.bulk import RecordError, parse_record, result_row, solve_records
+from Theorems.cache import get_default_cache
+from Theorems.master_theorem import make_master_result
+from Theorems.extended_master_theorem import make_extended_result
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# Theorems the vectorized path handles -> (batch solver name, result builder)
+_VECTORIZED = {
+    "master": ("master_theorem_batch", make_master_result),
+    "extended": ("extended_master_theorem_batch", make_extended_result),
+}
+
+
+def iter_chunks(records, chunk_size):
+    """Split an iterable into lists of at most chunk_size items."""
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _solve_chunk_vectorized(chunk):
+    """Solve master/extended records of a chunk with the NumPy batch solvers."""
+    import numpy as np
+    from Theorems import batch
+
+    rows = [None] * len(chunk)
+    groups = {theorem: [] for theorem in _VECTORIZED}
+    scalar = []
+    for pos, (line_no, record) in enumerate(chunk):
+        if not isinstance(record, Exception):
+            try:
+                theorem, params = parse_record(record)
+            except RecordError:
+                theorem = None
+            if theorem in groups:
+                groups[theorem].append((pos, params))
+                continue
+        scalar.append(pos)
+
+    for theorem, members in groups.items():
+        if not members:
+            continue
+        batch_name, make_result = _VECTORIZED[theorem]
+        columns = [np.asarray(column, dtype=np.float64) for column in zip(*(p for _, p in members))]
+        solved = getattr(batch, batch_name)(*columns)
+        for (pos, params), case, log_b_a in zip(members, solved.case.tolist(), solved.log_b_a.tolist()):
+            if case == 0:
+                # Invalid parameters: let the scalar path report the error.
+                scalar.append(pos)
+            else:
+                rows[pos] = result_row(chunk[pos][0], make_result(*params, log_b_a, case))
+
+    scalar.sort()
+    for pos, row in zip(scalar, solve_records(chunk[pos] for pos in scalar)):
+        rows[pos] = row
+    return rows
+
+
+def solve_chunk(chunk, vectorized=False, exact=False):
+    """
+    Solve a list of (line number, record) pairs into output rows.
+
+    exact=True uses exact case decisions and takes precedence over vectorized.
+    """
+    if exact:
+        return list(solve_records(chunk, exact=True))
+    if vectorized:
+        try:
+            return _solve_chunk_vectorized(chunk)
+        except Exception:
+            # Fall back to the scalar path, which isolates errors per record.
+            pass
+    return list(solve_records(chunk))
+
+
+def _solve_chunk_in_worker(chunk, vectorized, exact):
+    """
+    solve_chunk for pool workers, which then write their pending cache entries.
+
+    Worker processes never run atexit handlers, so a persistent cache would
+    otherwise lose whatever it had not written yet.
+    """
+    rows = solve_chunk(chunk, vectorized, exact)
+    get_default_cache().flush()
+    return rows
+
+
+def _collect(chunk, future):
+    """Return a chunk's rows, turning a failed chunk into per-record errors."""
+    try:
+        return future.result()
+    except Exception as e:
+        return [{"line": line_no, "error": f"chunk failed: {e}"} for line_no, _ in chunk]
+
+
+def solve_parallel(records, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, vectorized=False,
+                   exact=False):
+    """
+    Solve (line number, record) pairs on a process pool.
+
+    Records are dispatched in chunks and rows are yielded in input order. At
+    most two chunks per worker are in flight, so memory stays bounded for
+    arbitrarily long inputs.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in iter_chunks(records, chunk_size):
+            pending.append((chunk, pool.submit(_solve_chunk_in_worker, chunk, vectorized, exact)))
+            if len(pending) >= max_pending:
+                yield from _collect(*pending.popleft())
+        while pending:
+            yield from _collect(*pending.popleft())
@@ -0,0 +1,340 @@
+"""
+Parse textual recurrences such as "T(n) = 7T(n/2) + n^2 log n".
+
+A recurrence is one recursive term a*T(n/b) or a*T(n-b), or several
+terms a_j*T(n/b_j) or a_j*T(n-j), plus a cost f(n) made of powers of n and
+of log n, optionally wrapped in Θ(...) or O(...).
+Common spellings are matched by a single compiled regex; anything else goes
+through a small hand-written tokenizer. Parsed forms are cached.
+
+    >>> parse_recurrence("T(n) = 2T(n-1) + 1")
+    Recurrence(theorem='subtractive', a=2, b=1, k=0, i=0)
+"""
+from collections import namedtuple
+from functools import lru_cache
+import re
+
+PARSE_CACHE_SIZE = 65536
+COST_CACHE_SIZE = 4096
+
+_NUMBER = r"\d+(?:\.\d*)?|\.\d+"
+
+# Whitespace is removed before matching, so "n^2 log n" arrives as "n^2logn".
+# A "-" only separates recursive terms, as in T(n) = 2T(n-1) - T(n-2) + 1.
+# T(cn/d) stands for T(n/b) with b = d/c, as in T(n) = T(n/3) + T(2n/3) + n.
+_TERM = rf"(-)?(?:({_NUMBER})\*?)?T\((?:({_NUMBER})\*?)?n([/-])({_NUMBER})\)(\+|-(?=(?:{_NUMBER})?\*?T\()|$)"
+_HEAD = re.compile(rf"(?:T\(n\)=)?{_TERM}")
+# Further recursive terms, as in T(n) = T(n-1) + T(n-2) + 1
+_NEXT_TERM = re.compile(_TERM)
+# Costs of the form c, n^k, log^i n or n^k log^i n.
+_FAST_COST = re.compile(
+    rf"({_NUMBER})"
+    rf"|(?:(n)(?:(?:\^|\*\*)({_NUMBER}))?)?\*?"
+    rf"(?:((?:log|lg|ln))(?:\^({_NUMBER}))?(?:n|\(n\)))?"
+)
+_TOKEN = re.compile(rf"{_NUMBER}|(?:log|lg)_\d+|log|lg|ln|sqrt|Theta|theta|Omega|Θ|Ω|O|n|\*\*|[-+*/^()]")
+
+_LOGS = ("log", "lg", "ln")
+_BOUNDS = ("Theta", "theta", "Omega", "Θ", "Ω", "O")
+_OPERATORS = ("+", "-", "/", ")", "^", "**")
+_DIGITS = "0123456789."
+
+
+class ParseError(ValueError):
+    """Raised when a recurrence string cannot be parsed."""
+
+
+class Recurrence(namedtuple("Recurrence", "theorem a b k i")):
+    """
+    A parsed recurrence; theorem is "master", "extended", "subtractive",
+    "akra_bazzi" or "linear". Akra–Bazzi recurrences keep the coefficients
+    and bases of their T(n/b_j) terms as tuples in a and b. Linear
+    recurrences keep their coefficients (c_1, ..., c_d) of T(n-1), ...,
+    T(n-d) in a and have b = None.
+    """
+
+    __slots__ = ()
+
+    def to_record(self):
+        """Return the record dict understood by Theorems.bulk."""
+        if self.theorem == "linear":
+            return {"theorem": "linear", "a": list(self.a), "k": self.k}
+        if self.theorem == "akra_bazzi":
+            return {"theorem": "akra_bazzi", "a": list(self.a), "b": list(self.b), "k": self.k, "i": self.i}
+        record = {"theorem": self.theorem, "a": self.a, "b": self.b, "k": self.k}
+        if self.theorem == "extended":
+            record["i"] = self.i
+        return record
+
+    def solve(self, exact=False):
+        """Solve with the cheapest applicable theorem; see Theorems.dispatch."""
+        from Theorems.dispatch import solve
+
+        return solve(self, exact=exact)
+
+
+def _number(text):
+    return float(text) if "." in text else int(text)
+
+
+def _tidy(x):
+    """Turn integral floats produced by exponent arithmetic back into ints."""
+    return int(x) if isinstance(x, float) and x.is_integer() else x
+
+
+def _recurrence(op, a, b, k, i):
+    """Pick the theorem for a parsed recurrence."""
+    if op == "-":
+        if i:
+            raise ParseError("subtractive recurrences with a log factor are not supported")
+        return Recurrence("subtractive", a, b, k, 0)
+    return Recurrence("extended" if i else "master", a, b, k, i)
+
+
+def _base(op, scale, b, text):
+    """Return the b of a T(n-b) or T(scale*n/b) term; dividing terms must shrink n."""
+    b = _number(b)
+    if op == "-":
+        return b
+    if scale is None:
+        if not b > 1:
+            raise ParseError(f"T(n/{b}) in {text!r} must shrink n, so b must be greater than 1")
+        return b
+    scale = _number(scale)
+    if not 0 < scale < b:
+        raise ParseError(f"T({scale}n/{b}) in {text!r} must shrink n")
+    return _tidy(b / scale)
+
+
+def _dividing(terms, k, i, text):
+    """Build the Recurrence of several (op, a, b) T(n/b_j) terms, merging equal b_j."""
+    coefficients = {}
+    for _, a, b in terms:
+        if a <= 0:
+            raise ParseError(f"the coefficient of T(n/{b}) must be positive in {text!r}")
+        coefficients[b] = coefficients.get(b, 0) + a
+    if len(coefficients) == 1:
+        (b, a), = coefficients.items()
+        return _recurrence("/", a, b, k, i)
+    return Recurrence("akra_bazzi", tuple(coefficients.values()), tuple(coefficients), k, i)
+
+
+def _linear(terms, k, i, text):
+    """Build the linear Recurrence of (op, a, b) recursive terms."""
+    if i:
+        raise ParseError("linear recurrences with a log factor are not supported")
+    coefficients = {}
+    for _, a, b in terms:
+        if not isinstance(b, int) or b < 1:
+            raise ParseError(f"shift {b!r} in {text!r} must be a positive integer")
+        coefficients[b] = coefficients.get(b, 0) + a
+    if not any(coefficients.values()):
+        raise ParseError(f"the recursive terms of {text!r} cancel out")
+    return Recurrence("linear", tuple(coefficients.get(j, 0) for j in range(1, max(coefficients) + 1)),
+                      None, k, 0)
+
+
+class _CostParser:
+    """
+    Recursive-descent parser for a cost f(n) given as sums, products and
+    quotients of constants, n, sqrt(n) and log n, each optionally raised to
+    a power. Evaluates to the pair (k, i) of f(n) = Θ(n^k (log n)^i).
+    """
+
+    def __init__(self, text):
+        self.tokens = _TOKEN.findall(text)
+        if sum(map(len, self.tokens)) != len(text):
+            pos = 0
+            for match in _TOKEN.finditer(text):
+                if match.start() != pos:
+                    break
+                pos = match.end()
+            raise ParseError(f"unexpected {text[pos:]!r} in cost")
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, value=None):
+        text = self.peek()
+        if text is None or (value is not None and text != value):
+            raise ParseError(f"expected {value or 'more input'} in cost, got {text or 'end of input'!r}")
+        self.pos += 1
+        return text
+
+    def parse(self):
+        k, i = self.sum()
+        if self.pos != len(self.tokens):
+            raise ParseError(f"unexpected {self.peek()!r} in cost")
+        return _tidy(k), _tidy(i)
+
+    def sum(self):
+        """Keep the dominant term of a sum such as n^2 + n log n - 1."""
+        best = self.product()
+        while self.peek() in ("+", "-"):
+            self.take()
+            best = max(best, self.product())
+        return best
+
+    def product(self):
+        k, i = self.power()
+        while True:
+            text = self.peek()
+            if text == "/":
+                self.take()
+                dk, di = self.power()
+                k, i = k - dk, i - di
+            elif text is not None and text not in _OPERATORS:
+                # "*" or implicit multiplication as in "n log n"
+                if text == "*":
+                    self.take()
+                dk, di = self.power()
+                k, i = k + dk, i + di
+            else:
+                return k, i
+
+    def power(self):
+        k, i = self.atom()
+        if self.peek() in ("^", "**"):
+            self.take()
+            e = self.exponent()
+            k, i = k * e, i * e
+        return k, i
+
+    def exponent(self):
+        text = self.peek()
+        if text == "-":
+            self.take()
+            return -self.exponent()
+        if text == "(":
+            self.take()
+            e = self.exponent()
+            if self.peek() == "/":
+                self.take()
+                e = e / self.exponent()
+            self.take(")")
+            return e
+        if text is not None and text[0] in _DIGITS:
+            return _number(self.take())
+        raise ParseError(f"expected an exponent in cost, got {text or 'end of input'!r}")
+
+    def argument(self):
+        """Parse the n in log n, log(n) or sqrt(n)."""
+        if self.peek() == "(":
+            self.take()
+            self.take("n")
+            self.take(")")
+        else:
+            self.take("n")
+
+    def atom(self):
+        text = self.take()
+        if text[0] in _DIGITS:
+            return 0, 0
+        if text == "n":
+            return 1, 0
+        if text == "sqrt":
+            self.argument()
+            return 0.5, 0
+        if text in _LOGS or text.startswith(("log_", "lg_")):
+            e = 1
+            if self.peek() in ("^", "**"):
+                self.take()
+                e = self.exponent()
+            self.argument()
+            return 0, e
+        if text in _BOUNDS:
+            self.take("(")
+            text = "("
+        if text == "(":
+            k, i = self.sum()
+            self.take(")")
+            return k, i
+        raise ParseError(f"unexpected {text!r} in cost")
+
+
+def parse_cost(text):
+    """Return (k, i) for a cost f(n) = Θ(n^k (log n)^i) such as "n^2 log n"."""
+    return _parse_cost("".join(text.split()))
+
+
+@lru_cache(maxsize=COST_CACHE_SIZE)
+def _parse_cost(text):
+    match = _FAST_COST.fullmatch(text)
+    if match and text:
+        const, n, k, log, i = match.groups()
+        if const:
+            return 0, 0
+        return (_number(k) if k else 1) if n else 0, (_number(i) if i else 1) if log else 0
+    return _CostParser(text).parse()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_recurrence(text):
+    """
+    Parse a recurrence string into a Recurrence.
+
+    Accepts forms like "T(n) = 7T(n/2) + n^2 log n", "2*T(n-1) + 1",
+    "T(n/2) + Θ(n/log n)", "4T(n/2) + n^(3/2) + n" and
+    "T(n) = 2T(n-1) - T(n-2) + 1" and "T(n) = T(n/3) + T(2n/3) + n".
+    Terms T(n/b) with equal b are added up, so several of them are solved
+    with the master theorem when they share one b and with Akra–Bazzi
+    otherwise. Only the dominant term of a sum counts, and a missing cost
+    means f(n) = Θ(1).
+    """
+    if not isinstance(text, str):
+        raise ParseError(f"expected a string, got {type(text).__name__}")
+    compact = "".join(text.split())
+    match = _HEAD.match(compact)
+    if match is None:
+        raise ParseError(f"cannot parse recurrence {text!r}; expected a*T(n/b) + f(n) or a*T(n-b) + f(n)")
+    sign, a, scale, op, b, sep = match.groups()
+    a = _number(a) if a else 1
+    if sign:
+        a = -a
+    if scale is not None and op == "-":
+        raise ParseError(f"cannot parse recurrence {text!r}; T({scale}n-{b}) is not supported")
+    b = _base(op, scale, b, text)
+    end = match.end()
+    terms = None
+    while sep and compact.find("T(", end) != -1:
+        match = _NEXT_TERM.match(compact, end)
+        if match is None:
+            break
+        if terms is None:
+            terms = [(op, a, b)]
+        next_sign, next_a, next_scale, next_op, next_b, next_sep = match.groups()
+        next_a = _number(next_a) if next_a else 1
+        if (sep == "-") != bool(next_sign):
+            next_a = -next_a
+        if next_op != op or (next_scale is not None and next_op == "-"):
+            raise ParseError(f"cannot parse recurrence {text!r}; several recursive terms must all be "
+                             f"T(n/b_j) or all T(n-j)")
+        terms.append((next_op, next_a, _base(next_op, next_scale, next_b, text)))
+        sep = next_sep
+        end = match.end()
+    cost = compact[end:]
+    if sep and not cost:
+        raise ParseError(f"missing cost after '+' in {text!r}")
+    k, i = _parse_cost(cost) if cost else (0, 0)
+    if terms is not None:
+        if op == "/":
+            return _dividing(terms, k, i, text)
+        return _linear(terms, k, i, text)
+    if a < 0:
+        if op == "/":
+            raise ParseError(f"the coefficient of T(n/{b}) must be positive in {text!r}")
+        # A negative coefficient makes T(n) oscillate: solved as a linear recurrence.
+        return _linear([(op, a, b)], k, i, text)
+    return _recurrence(op, a, b, k, i)
+
+
+def clear_parse_cache():
+    """Empty the caches of parsed recurrences and costs."""
+    parse_recurrence.cache_clear()
+    _parse_cost.cache_clear()
+
+
+def solve_expression(text, exact=False):
+    """Parse a recurrence string and solve it with the cheapest applicable theorem."""
+    return parse_recurrence(text).solve(exact)
@@ -0,0 +1,346 @@
+"""
+Opt-in persistent solver cache in an SQLite file.
+
+PersistentCache is a SolverCache whose misses fall through to an SQLite
+table shared by every process using the same file, so CLI workers, web
+app replicas and CI runs stop re-solving the same recurrences after each
+restart. Entries are keyed on the solver name, the normalized parameters
+(exact values for the exact solvers) and SOLVER_VERSION; entries written by an older solver version are never
+read and are deleted when the file is opened.
+
+    cache = enable_persistent_cache("solver_cache.db", ttl=7 * 86400)
+
+The file uses WAL journaling, so readers never block the single writer,
+and every process and thread gets its own connection. New entries are
+written in batches. Entries older than the TTL are ignored and purged, and
+the least recently used entries are evicted beyond max_entries.
+
+    python -m Theorems.persistent_cache warm solver_cache.db recurrences.db
+    python -m Theorems.persistent_cache info solver_cache.db
+"""
+import argparse
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from Theorems import SOLVER_VERSION
+from Theorems.cache import SolverCache, get_default_cache, normalize_params, set_default_cache
+from Theorems.result import RecurrenceResult
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    solver TEXT NOT NULL,
+    params TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (solver, params, version)
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+# Numeric fields of a RecurrenceResult stored per entry
+FIELDS = ("theorem", "case", "log_b_a", "poly_exponent", "log_exponent", "exp_base", "loglog")
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# New entries are written once this many are pending or this many seconds
+# have passed since the last write.
+WRITE_BATCH = 256
+WRITE_INTERVAL = 1.0
+
+# Last-access times are only refreshed when older than this, so that hits
+# rarely need a write.
+ACCESS_RESOLUTION = 60.0
+
+# Size and TTL eviction runs after this many written entries.
+EVICT_EVERY = 10000
+
+# Seconds a connection waits for another process's write lock
+BUSY_TIMEOUT = 30.0
+
+# Solvers whose results depend on the exact parameter values
+EXACT_SOLVERS = {"master_exact", "extended_exact"}
+
+
+def params_key(theorem, params):
+    """
+    Return the text key of a parameter tuple.
+
+    Parameters are normalized to floats, except for the exact solvers, where
+    1/3 and 0.3333333333333333 (or 2**53 + 1 and 2**53) must not share an
+    entry: those are keyed on the exact fractions the solvers decide with.
+    """
+    if theorem in EXACT_SOLVERS:
+        return json.dumps([None if p is None else _exact_text(p) for p in params])
+    return json.dumps(normalize_params(params))
+
+
+def _exact_text(x):
+    from Theorems.exact import to_fraction
+
+    fraction = to_fraction(x)
+    return repr(x) if fraction is None else str(fraction)
+
+
+class PersistentCache(SolverCache):
+    """
+    SolverCache backed by an SQLite file shared across processes.
+
+    Lookups try the in-memory LRU first, then the file, and only then the
+    solver. ttl is the lifetime of an entry in seconds (None keeps entries
+    until they are evicted for size).
+    """
+
+    def __init__(self, path, maxsize=4096, enabled=True, ttl=None,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        super().__init__(maxsize, enabled)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._pid = None
+        self._closed = False
+        self._connect_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        with self._connection() as db:
+            db.execute("DELETE FROM results WHERE version < ?", (SOLVER_VERSION,))
+
+    def _connection(self):
+        """Return this thread's connection, opening it on first use in each process."""
+        with self._connect_lock:
+            if self._pid != os.getpid():
+                # A forked child must not reuse the parent's connections or
+                # write its pending entries twice.
+                self._pid = os.getpid()
+                self._local = threading.local()
+                self._pending = []
+                self._last_write = time.monotonic()
+                self._written = 0
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(SCHEMA)
+            self._local.db = db
+        return db
+
+    def load(self, theorem, params):
+        """Return the stored result for params rendered with them, or None."""
+        db = self._connection()
+        key = params_key(theorem, params)
+        row = db.execute(
+            "SELECT result, created, accessed FROM results WHERE solver = ? AND params = ? AND version = ?",
+            (theorem, key, SOLVER_VERSION),
+        ).fetchone()
+        now = time.time()
+        if row is None or (self.ttl is not None and row[1] < now - self.ttl):
+            self.disk_misses += 1
+            return None
+        self.disk_hits += 1
+        if now - row[2] > ACCESS_RESOLUTION:
+            with db:
+                db.execute(
+                    "UPDATE results SET accessed = ? WHERE solver = ? AND params = ? AND version = ?",
+                    (now, theorem, key, SOLVER_VERSION),
+                )
+        fields = dict(zip(FIELDS, json.loads(row[0])))
+        result = RecurrenceResult(
+            fields["theorem"], None, None, None, None, fields["case"], fields["log_b_a"],
+            fields["poly_exponent"], fields["log_exponent"], fields["exp_base"], fields["loglog"],
+        )
+        return result.with_params(*params)
+
+    def store(self, theorem, params, result):
+        """Queue a solved result for writing to the file."""
+        self._connection()
+        now = time.time()
+        # Exponents taken from the parameters may be Fractions; they are stored as floats.
+        value = json.dumps([getattr(result, field) for field in FIELDS], default=float)
+        with self._write_lock:
+            self._pending.append(
+                (theorem, params_key(theorem, params), SOLVER_VERSION, value, now, now)
+            )
+            due = (len(self._pending) >= WRITE_BATCH
+                   or time.monotonic() - self._last_write >= WRITE_INTERVAL)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write every pending entry in one transaction."""
+        db = self._connection()
+        with self._write_lock:
+            pending, self._pending = self._pending, []
+            self._last_write = time.monotonic()
+        if not pending:
+            return
+        with db:
+            db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", pending)
+        self._written += len(pending)
+        if self._written >= EVICT_EVERY:
+            self._written = 0
+            self.evict()
+
+    def evict(self):
+        """
+        Delete entries of older solver versions, expired entries and the least
+        recently used entries beyond max_entries. Returns how many were deleted.
+        """
+        db = self._connection()
+        deleted = 0
+        with db:
+            deleted += db.execute("DELETE FROM results WHERE version < ?", (SOLVER_VERSION,)).rowcount
+            if self.ttl is not None:
+                deleted += db.execute(
+                    "DELETE FROM results WHERE created < ?", (time.time() - self.ttl,)
+                ).rowcount
+            excess = db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                deleted += db.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY accessed LIMIT ?)", (excess,)
+                ).rowcount
+        return deleted
+
+    def get_or_solve(self, theorem, params, solve):
+        """Return the result from memory, else from the file, else by calling solve(*params)."""
+        if not self.enabled:
+            return solve(*params)
+
+        def load_or_solve(*params):
+            result = self.load(theorem, params)
+            if result is None:
+                result = solve(*params)
+                self.store(theorem, params, result)
+            return result
+
+        return super().get_or_solve(theorem, params, load_or_solve)
+
+    def clear(self):
+        """Drop all entries, in memory and in the file, and reset the counters."""
+        super().clear()
+        self.disk_hits = self.disk_misses = 0
+        db = self._connection()
+        with self._write_lock:
+            self._pending = []
+        with db:
+            db.execute("DELETE FROM results")
+
+    def close(self):
+        """Write pending entries and close this thread's connection."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def stats(self):
+        """Return the in-memory counters plus the file's hit/miss counters and size."""
+        stats = super().stats()
+        total = self.disk_hits + self.disk_misses
+        stats.update({
+            "path": self.path,
+            "ttl": self.ttl,
+            "disk_entries": self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0],
+            "max_entries": self.max_entries,
+            "disk_hits": self.disk_hits,
+            "disk_misses": self.disk_misses,
+            "disk_hit_rate": self.disk_hits / total if total else 0.0,
+        })
+        return stats
+
+
+def enable_persistent_cache(path, ttl=None, max_entries=DEFAULT_MAX_ENTRIES, maxsize=4096):
+    """
+    Make a PersistentCache on path the cache shared by all theorem solvers.
+
+    Pending entries are written when the process exits. Returns the cache.
+    """
+    cache = PersistentCache(path, maxsize=maxsize, ttl=ttl, max_entries=max_entries)
+    set_default_cache(cache)
+    atexit.register(cache.close)
+    return cache
+
+
+def warm_from_catalog(cache, catalog_path, exact=False):
+    """
+    Solve every entry of a catalog (see Theorems.catalog) into the cache.
+
+    Only theorems with a cached solver are stored. Returns
+    (entries solved, entries skipped because they could not be solved).
+    """
+    from Theorems.bulk import RecordError, solve_record
+
+    catalog = sqlite3.connect(f"file:{catalog_path}?mode=ro", uri=True)
+    previous = get_default_cache()
+    set_default_cache(cache)
+    solved = skipped = 0
+    try:
+        for (text,) in catalog.execute("SELECT input FROM entries"):
+            try:
+                solve_record(json.loads(text), exact)
+            except (RecordError, ValueError, TypeError, ZeroDivisionError, OverflowError):
+                skipped += 1
+            else:
+                solved += 1
+    finally:
+        set_default_cache(previous)
+        catalog.close()
+        cache.flush()
+    return solved, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm up, inspect or trim a persistent solver cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    warm = subparsers.add_parser("warm", help="Preload the cache with every entry of a catalog")
+    warm.add_argument("path", help="Cache file (created if missing)")
+    warm.add_argument("catalog", help="Catalog database written by main.py catalog")
+    warm.add_argument("--exact", action="store_true",
+                      help="Decide log_b(a) = k with exact rational arithmetic")
+    info = subparsers.add_parser("info", help="Print the number of entries and the solver version")
+    info.add_argument("path")
+    evict = subparsers.add_parser("evict", help="Delete stale, expired and excess entries")
+    evict.add_argument("path")
+    evict.add_argument("--ttl", type=float, help="Delete entries older than this many seconds")
+    evict.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES,
+                       help=f"Keep at most this many entries (default: {DEFAULT_MAX_ENTRIES:,})")
+    clear = subparsers.add_parser("clear", help="Delete every entry")
+    clear.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "warm":
+        cache = PersistentCache(args.path)
+        start = time.perf_counter()
+        solved, skipped = warm_from_catalog(cache, args.catalog, args.exact)
+        print(f"Solved {solved:,} catalog entries into {args.path} ({skipped:,} skipped) "
+              f"in {time.perf_counter() - start:.2f}s")
+    elif args.command == "info":
+        cache = PersistentCache(args.path)
+        db = cache._connection()
+        print(f"{args.path}: solver version {SOLVER_VERSION}")
+        for solver, count in db.execute("SELECT solver, COUNT(*) FROM results GROUP BY solver ORDER BY solver"):
+            print(f"  {solver:<16} {count:>10,}")
+    elif args.command == "evict":
+        cache = PersistentCache(args.path, ttl=args.ttl, max_entries=args.max_entries)
+        print(f"Deleted {cache.evict():,} entries")
+    else:
+        cache = PersistentCache(args.path)
+        cache.clear()
+        print(f"Cleared {args.path}")
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
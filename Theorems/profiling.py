@@ -0,0 +1,311 @@
+"""
+Opt-in per-stage timing of the theorem solvers.
+
+While a profile is active, the solver entry points and their stages are
+replaced by timed wrappers. Disabling restores the original functions, so
+there is no overhead at all when profiling is off.
+
+    with profile() as profiler:
+        master_theorem_result(8, 2, 2).complexity
+    print(profiler.summary_table())
+
+Stages per theorem (inner stages are also counted in the outer ones):
+
+    call    public *_result entry point, including the cache lookup
+    solve   the solver itself on a cache miss
+    log     math.log inside the solver
+    build   building the RecurrenceResult
+    format  rendering the complexity and comparison strings
+    print   the print_* helpers, including terminal I/O
+"""
+from contextlib import contextmanager
+import functools
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+# Module -> [(attribute, theorem, stage)] functions timed while profiling
+TARGETS = {
+    "Theorems.master_theorem": [
+        ("master_theorem_result", "master", "call"),
+        ("make_master_result", "master", "build"),
+        ("print_master_theorem_result", "master", "print"),
+    ],
+    "Theorems.extended_master_theorem": [
+        ("extended_master_theorem_result", "extended", "call"),
+        ("make_extended_result", "extended", "build"),
+        ("print_extended_master_result", "extended", "print"),
+    ],
+    "Theorems.subtractive_master_theorem": [
+        ("subtractive_master_theorem_result", "subtractive", "call"),
+        ("print_subtractive_master_result", "subtractive", "print"),
+    ],
+    "Theorems.exact": [
+        ("exact_master_theorem_result", "master_exact", "call"),
+        ("exact_extended_master_theorem_result", "extended_exact", "call"),
+    ],
+    "Theorems.extended_master_theorem_akra_bazzi": [
+        ("akra_bazzi_result", "akra_bazzi", "call"),
+        ("critical_exponent", "akra_bazzi", "root"),
+        ("print_akra_bazzi_result", "akra_bazzi", "print"),
+    ],
+    "Theorems.linear_recurrence": [
+        ("linear_recurrence_result", "linear", "call"),
+        ("_root_summary", "linear", "root"),
+        ("linear_recurrence_value", "linear", "value"),
+        ("print_linear_recurrence_result", "linear", "print"),
+    ],
+    "Theorems.bulk": [
+        ("parse_record", "bulk", "parse"),
+        ("result_row", "bulk", "row"),
+    ],
+}
+
+# Modules whose math.log calls are timed as the "log" stage of a theorem
+LOG_MODULES = {
+    "Theorems.master_theorem": "master",
+    "Theorems.extended_master_theorem": "extended",
+    "Theorems.exact": "exact",
+}
+
+_active = None
+_lock = threading.Lock()
+
+
+class Profiler:
+    """Call counts and total time per (theorem, stage), plus an optional event trace."""
+
+    def __init__(self, trace=False, max_events=100000):
+        self.stats = {}
+        self.trace = trace
+        self.max_events = max_events
+        self.events = []
+        self.started = time.perf_counter_ns()
+        self._patches = []
+        # id(wrapper) -> (wrapper, original function) for every timed wrapper
+        self._originals = {}
+        self._lock = threading.Lock()
+
+    def record(self, key, start, end):
+        with self._lock:
+            entry = self.stats.get(key)
+            if entry is None:
+                entry = self.stats[key] = [0, 0]
+            entry[0] += 1
+            entry[1] += end - start
+            if self.trace and len(self.events) < self.max_events:
+                self.events.append((key, start, end, threading.get_ident()))
+
+    def timed(self, theorem, stage, func):
+        """Return func wrapped to record its calls under (theorem, stage)."""
+        key = (theorem, stage)
+        record = self.record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(key, start, clock())
+
+        return timed
+
+    def rows(self):
+        """Yield (theorem, stage, calls, total seconds) sorted by theorem and time."""
+        with self._lock:
+            items = [(key, tuple(entry)) for key, entry in self.stats.items()]
+        items.sort(key=lambda item: (item[0][0], -item[1][1]))
+        for (theorem, stage), (calls, total_ns) in items:
+            yield theorem, stage, calls, total_ns / 1e9
+
+    def summary_table(self):
+        """Render the timings as a plain-text table."""
+        lines = [f"{'theorem':<14} {'stage':<8} {'calls':>10} {'total ms':>11} {'mean us':>9}"]
+        for theorem, stage, calls, total in self.rows():
+            lines.append(
+                f"{theorem:<14} {stage:<8} {calls:>10,} {total * 1e3:>11.2f} {total / calls * 1e6:>9.2f}"
+            )
+        if len(lines) == 1:
+            lines.append("(no solver calls recorded)")
+        return "\n".join(lines)
+
+    def to_prometheus(self):
+        """Render the timings in the Prometheus text exposition format."""
+        lines = [
+            "# HELP recurrence_stage_calls_total Calls per theorem and stage.",
+            "# TYPE recurrence_stage_calls_total counter",
+        ]
+        rows = list(self.rows())
+        for theorem, stage, calls, _ in rows:
+            lines.append(f'recurrence_stage_calls_total{{theorem="{theorem}",stage="{stage}"}} {calls}')
+        lines += [
+            "# HELP recurrence_stage_seconds_total Time spent per theorem and stage.",
+            "# TYPE recurrence_stage_seconds_total counter",
+        ]
+        for theorem, stage, _, total in rows:
+            lines.append(f'recurrence_stage_seconds_total{{theorem="{theorem}",stage="{stage}"}} {total:.9f}')
+        return "\n".join(lines) + "\n"
+
+    def to_trace(self):
+        """Return the recorded events in the Chrome trace-event JSON format."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        return {
+            "traceEvents": [
+                {"name": f"{theorem}.{stage}", "cat": theorem, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": (start - self.started) / 1000, "dur": (end - start) / 1000}
+                for (theorem, stage), start, end, tid in events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def write(self, path):
+        """Write a JSON trace (.json) or a Prometheus text dump (anything else)."""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                json.dump(self.to_trace() if self.trace else self.to_dict(), f)
+            else:
+                f.write(self.to_prometheus())
+
+    def to_dict(self):
+        """Return the timings as a list of dicts."""
+        return [
+            {"theorem": theorem, "stage": stage, "calls": calls, "seconds": total}
+            for theorem, stage, calls, total in self.rows()
+        ]
+
+
+class _TimedMath:
+    """Stand-in for the math module whose log() is timed."""
+
+    def __init__(self, log):
+        self.log = log
+
+    def __getattr__(self, name):
+        return getattr(math, name)
+
+
+def _patch(profiler, namespace, name, value):
+    profiler._patches.append((namespace, name, getattr(namespace, name)))
+    setattr(namespace, name, value)
+
+
+def _patch_item(profiler, mapping, key, value):
+    profiler._patches.append((mapping, key, mapping[key]))
+    mapping[key] = value
+
+
+def _importers(replacements):
+    """
+    Yield (module, attribute, replacement) for module globals bound to a
+    function in replacements, which maps id(function) -> (function, replacement).
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == "Theorems" or module_name.startswith("Theorems.")
+                                  or module_name in ("__main__", "main", "app", "server")):
+            continue
+        for name, value in list(vars(module).items()):
+            pair = replacements.get(id(value)) if callable(value) else None
+            if pair is not None and pair[0] is value:
+                yield module, name, pair[1]
+
+
+def enable(trace=False, max_events=100000):
+    """Start profiling the solvers and return the active Profiler."""
+    import importlib
+    global _active
+
+    with _lock:
+        if _active is not None:
+            return _active
+        profiler = Profiler(trace, max_events)
+
+        # Patch every module that imported a target, not just the one defining it.
+        wrappers = {}
+        for module_name, targets in TARGETS.items():
+            module = importlib.import_module(module_name)
+            for name, theorem, stage in targets:
+                func = getattr(module, name)
+                timed = profiler.timed(theorem, stage, func)
+                wrappers[id(func)] = (func, timed)
+                profiler._originals[id(timed)] = (timed, func)
+        for module, name, timed in list(_importers(wrappers)):
+            _patch(profiler, module, name, timed)
+
+        from Theorems import bulk
+        for theorem, (solver, names) in list(bulk.SOLVERS.items()):
+            pair = wrappers.get(id(solver))
+            if pair is not None and pair[0] is solver:
+                _patch_item(profiler, bulk.SOLVERS, theorem, (pair[1], names))
+
+        for module_name, theorem in LOG_MODULES.items():
+            module = sys.modules[module_name]
+            _patch(profiler, module, "math", _TimedMath(profiler.timed(theorem, "log", math.log)))
+
+        from Theorems import result
+        for theorem, formatter in list(result.FORMATTERS.items()):
+            _patch_item(profiler, result.FORMATTERS, theorem, profiler.timed(theorem, "format", formatter))
+
+        from Theorems.cache import get_default_cache
+        cache = get_default_cache()
+        get_or_solve = cache.get_or_solve
+        clock = time.perf_counter_ns
+
+        def timed_get_or_solve(theorem, params, solve):
+            def timed_solve(*args):
+                start = clock()
+                try:
+                    return solve(*args)
+                finally:
+                    profiler.record((theorem, "solve"), start, clock())
+
+            return get_or_solve(theorem, params, timed_solve)
+
+        _patch(profiler, cache, "get_or_solve", timed_get_or_solve)
+        _active = profiler
+        return profiler
+
+
+def disable():
+    """Stop profiling and restore the original functions; returns the Profiler."""
+    global _active
+
+    with _lock:
+        profiler, _active = _active, None
+        if profiler is None:
+            return None
+        for target, name, original in reversed(profiler._patches):
+            if isinstance(target, dict):
+                target[name] = original
+            elif name == "get_or_solve":
+                # Drop the instance attribute so the method is found again.
+                vars(target).pop(name, None)
+            else:
+                setattr(target, name, original)
+        profiler._patches = []
+        # Modules imported while profiling bound the wrappers themselves.
+        for module, name, original in list(_importers(profiler._originals)):
+            setattr(module, name, original)
+        profiler._originals = {}
+        return profiler
+
+
+def get_profiler():
+    """Return the active Profiler, or None when profiling is off."""
+    return _active
+
+
+@contextmanager
+def profile(trace=False, max_events=100000):
+    """Profile the solvers for the duration of a with block."""
+    profiler = enable(trace, max_events)
+    try:
+        yield profiler
+    finally:
+        disable()
@@ -0,0 +1,151 @@
+"""
+Ranking recurrences by growth rate.
+
+Every solver result maps to a numeric growth signature
+
+    (exp_rate, poly_exponent, log_exponent, loglog)
+
+for the bound exp_base^n n^poly_exponent (log n)^log_exponent (log log n)^loglog,
+where exp_rate = log(exp_base) stays finite when exp_base overflows.
+Comparing signatures left to right orders bounds asymptotically, so
+rankings never depend on the formatted complexity strings. The bulk APIs
+sort millions of signatures with one np.lexsort call:
+
+    order = argsort_growth(solve_batch(a, b, k).result)    # cheapest first
+    best = top_k(results, 10)                              # ten slowest-growing
+"""
+import math
+
+# Field order of a growth signature, most significant first
+SIGNATURE_FIELDS = ("exp_rate", "poly_exponent", "log_exponent", "loglog")
+
+# Signatures are snapped to this many decimals, so that log_27(3) = 3.0000000000000004
+# ranks equal to k = 3. Values beyond SNAP_LIMIT are left as they are.
+DECIMALS = 9
+SNAP_LIMIT = 1e15
+
+_SCALE = 10.0 ** DECIMALS
+
+
+def _snap(x):
+    x = float(x)
+    if math.isnan(x):
+        return math.inf
+    if abs(x) >= SNAP_LIMIT:
+        return x
+    return round(x * _SCALE) / _SCALE
+
+
+def growth_signature(result):
+    """
+    Return the growth signature of a solver result as a tuple of floats.
+
+    Usable as a sort key: sorted(results, key=growth_signature) orders them
+    from the slowest to the fastest growing bound. NaN exponents become
+    +inf so that the tuples stay comparable.
+    """
+    return (_snap(result.exp_rate), _snap(result.poly_exponent), _snap(result.log_exponent),
+            1.0 if result.loglog else 0.0)
+
+
+def compare_growth(x, y):
+    """Return -1, 0 or 1 as the bound of result x grows slower than, like or faster than y."""
+    sx, sy = growth_signature(x), growth_signature(y)
+    return (sx > sy) - (sx < sy)
+
+
+def signature_array(items):
+    """
+    Return an (N, 4) float64 array of growth signatures.
+
+    items is a BatchResult or BatchSolution from the batch solvers, an
+    (N, 4) array of signatures, or an iterable of solver results. Batch
+    rows are converted column-wise without creating Python objects. Rows
+    that were not solved (case 0 or NaN exponents) are all NaN.
+    """
+    import numpy as np
+
+    if hasattr(items, "rule") and hasattr(items, "result"):
+        items = items.result
+    if hasattr(items, "_fields") and "case" in items._fields:
+        case = np.asarray(items.case).reshape(-1)
+        exp_base = items.exp_base if items.exp_base is not None else 1.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exp_rate = np.log(np.asarray(exp_base, dtype=np.float64))
+        signatures = np.stack(
+            [np.broadcast_to(np.asarray(column, dtype=np.float64).reshape(-1), case.shape)
+             for column in (exp_rate, items.poly_exponent, items.log_exponent, items.loglog)],
+            axis=-1,
+        )
+        signatures[case == 0] = np.nan
+    elif isinstance(items, np.ndarray):
+        signatures = items.astype(np.float64).reshape(-1, len(SIGNATURE_FIELDS))
+    else:
+        signatures = np.array(
+            [(r.exp_rate, r.poly_exponent, r.log_exponent, bool(r.loglog)) for r in items],
+            dtype=np.float64,
+        ).reshape(-1, len(SIGNATURE_FIELDS))
+
+    # The same snapping as growth_signature, column-wise.
+    snapped = np.where(np.abs(signatures) < SNAP_LIMIT, np.rint(signatures * _SCALE) / _SCALE,
+                       signatures)
+    snapped[np.isnan(snapped).any(axis=1)] = np.nan
+    return snapped
+
+
+def argsort_growth(items, descending=False):
+    """
+    Return indices ordering items from the slowest to the fastest growing bound.
+
+    With descending=True the fastest growing come first. Equal signatures
+    keep their input order, and unsolved rows are last either way.
+    """
+    import numpy as np
+
+    signatures = signature_array(items)
+    # np.lexsort sorts by its last key first and puts NaN last. Negating
+    # every column reverses the order; ties keep their input order.
+    keys = -signatures if descending else signatures
+    return np.lexsort(keys.T[::-1])
+
+
+def sort_by_growth(results, descending=False):
+    """Return a list of solver results ordered by growth rate."""
+    results = list(results)
+    return [results[j] for j in argsort_growth(results, descending).tolist()]
+
+
+def top_k(items, k, largest=False):
+    """
+    Return the indices of the k slowest growing items, slowest first.
+
+    With largest=True the k fastest growing are returned instead, fastest
+    first; unsolved rows come last either way. Rows are narrowed one
+    signature field at a time with np.partition, which is linear, so only
+    the k selected rows are lexsorted.
+    """
+    import numpy as np
+
+    signatures = signature_array(items)
+    keys = -signatures if largest else signatures.copy()
+    keys[np.isnan(keys)] = np.inf
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Rows strictly ahead of the k-th row on a field are in; rows tied with
+    # it go on to the next field.
+    chosen = []
+    pool = np.arange(len(keys))
+    need = k
+    for field in range(len(SIGNATURE_FIELDS)):
+        if need >= len(pool):
+            break
+        values = keys[pool, field]
+        threshold = np.partition(values, need - 1)[need - 1]
+        ahead = pool[values < threshold]
+        chosen.append(ahead)
+        need -= len(ahead)
+        pool = pool[values == threshold]
+    # Rows still tied on every field are taken in input order.
+    selected = np.sort(np.concatenate(chosen + [pool[:need]]))
+    return selected[np.lexsort(keys[selected].T[::-1])]
@@ -0,0 +1,252 @@
+"""
+Level-by-level cost of the recursion tree of a recurrence.
+
+Covers the forms solved by master_theorem, extended_master_theorem and
+subtractive_master_theorem:
+
+    T(n) = a T(n/b) + n^k (log n)^i     with T(s) = 1 for s < b
+    T(n) = a T(n - b) + n^k             with T(s) = 1 for s < b
+
+Level j of the tree has a^j nodes of size n/b^j (or n - jb), so every
+level is computed directly from j and nothing is materialized: levels are
+yielded lazily, totals come from closed-form geometric sums, and trees
+millions of levels deep need constant memory. Counts and work are kept as
+log10 values so exponential trees never overflow.
+
+    for level in iter_levels("master", 8, 2, 2, n=1024):
+        print(level.depth, level.log10_nodes, level.size, level.log10_work)
+"""
+from collections import namedtuple
+import math
+
+# Most rows in a table of levels shown by the CLI and the Streamlit app
+MAX_ROWS = 40
+
+# Totals without a closed form are summed exactly with NumPy up to this many
+# levels and in near-geometric blocks beyond it.
+EXACT_LEVELS = 1 << 16
+BLOCK_CHANGE = 1e-3
+
+LOG10 = math.log(10)
+
+# One level of the tree. size is the subproblem size at that depth, share
+# the fraction of the total work done there. The last level holds the leaves.
+Level = namedtuple("Level", ["depth", "size", "log10_nodes", "log10_work", "share"])
+
+# levels      - number of levels, leaves included
+# log10_*     - work in the internal levels, in the leaves and in total
+# ratio       - factor by which the work changes from one level to the next
+#               (a / b^k, or a for subtractive forms)
+# dominant    - "root", "balanced" or "leaves": where most of the work is done
+TreeSummary = namedtuple(
+    "TreeSummary",
+    ["levels", "log10_internal", "log10_leaves", "log10_total", "ratio", "dominant"],
+)
+
+
+def _check(theorem, a, b, n):
+    """Validate the parameters and return the number of internal levels."""
+    if theorem not in ("master", "extended", "subtractive"):
+        raise ValueError(f"no recursion tree for {theorem} recurrences")
+    if a <= 0:
+        raise ValueError("a must be positive")
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    if theorem == "subtractive":
+        if b <= 0:
+            raise ValueError("b must be positive")
+        return int(n / b + 1e-9)
+    if b <= 1:
+        raise ValueError("b must be greater than 1")
+    return int(math.log(n) / math.log(b) + 1e-9)
+
+
+def _size(theorem, b, n, depth):
+    return n - depth * b if theorem == "subtractive" else n / b ** depth
+
+
+def _log_sum_geometric(log_q, count):
+    """Return log(1 + q + ... + q^(count-1)) for q = exp(log_q), without overflow."""
+    if count <= 0:
+        return -math.inf
+    if abs(log_q) < 1e-12:
+        return math.log(count)
+    if log_q > 0:
+        # (q^count - 1) / (q - 1) = q^count (1 - q^-count) / (q - 1)
+        return count * log_q + math.log(-math.expm1(-count * log_q)) - math.log(math.expm1(log_q))
+    return math.log(-math.expm1(count * log_q)) - math.log(-math.expm1(log_q))
+
+
+def _log_sum_power(log_q, p, x0, dx, count):
+    """
+    Return log(sum of q^j (x0 - j dx)^p for j < count), where x0 - j dx > 0.
+
+    Up to EXACT_LEVELS terms are summed exactly in one NumPy array.
+    Longer sums are split into blocks over which x0 - j dx changes by at
+    most BLOCK_CHANGE relative to its start; each block is a geometric sum
+    with the ratio of its first two terms, good to about p BLOCK_CHANGE^2
+    relative error, and the number of blocks grows only with log(x0 / dx).
+    """
+    if count <= EXACT_LEVELS:
+        import numpy as np
+
+        j = np.arange(count, dtype=np.float64)
+        return float(np.logaddexp.reduce(j * log_q + p * np.log(x0 - j * dx)))
+
+    total = -math.inf
+    j = 0
+    while j < count:
+        x = x0 - j * dx
+        block = max(1, min(count - j, int(BLOCK_CHANGE * x / dx)))
+        log_ratio = log_q + p * math.log1p(-dx / x) if block > 1 else 0.0
+        total = _logaddexp(total, j * log_q + p * math.log(x) + _log_sum_geometric(log_ratio, block))
+        j += block
+    return total
+
+
+def _logaddexp(x, y):
+    """Return log(exp(x) + exp(y)) for floats, either of which may be -inf."""
+    if x < y:
+        x, y = y, x
+    if y == -math.inf:
+        return x
+    return x + math.log1p(math.exp(y - x))
+
+
+def tree_summary(theorem, a, b, k, i=0, n=1e6):
+    """
+    Return the TreeSummary of the recursion tree for input size n.
+
+    The internal work is a geometric sum in closed form when each level does
+    ratio times the work of the one above: always for master forms, and for
+    extended forms with i = 0 and subtractive forms with k = 0. Otherwise the
+    levels are summed with NumPy, or in near-geometric blocks for trees
+    deeper than EXACT_LEVELS.
+    """
+    internal = _check(theorem, a, b, n)
+    i = i or 0
+    if theorem == "subtractive":
+        ratio = a
+        geometric = k == 0
+    else:
+        ratio = a / b ** k
+        geometric = i == 0
+    if geometric:
+        log_internal = k * math.log(n) + _log_sum_geometric(math.log(ratio), internal)
+    elif theorem == "subtractive":
+        log_internal = _log_sum_power(math.log(a), k, n, b, internal)
+    else:
+        # n^k (a / b^k)^j (log n - j log b)^i
+        log_internal = k * math.log(n) + _log_sum_power(
+            math.log(ratio), i, math.log(n), math.log(b), internal)
+    log_leaves = internal * math.log(a)
+    log_total = _logaddexp(log_internal, log_leaves)
+
+    if math.isclose(ratio, 1, rel_tol=1e-9):
+        dominant = "balanced"
+    else:
+        dominant = "leaves" if ratio > 1 else "root"
+    return TreeSummary(internal + 1, log_internal / LOG10, log_leaves / LOG10,
+                       log_total / LOG10, ratio, dominant)
+
+
+def iter_levels(theorem, a, b, k, i=0, n=1e6, depths=None):
+    """
+    Yield a Level for each depth from the root down to the leaves.
+
+    depths restricts the output to the given increasing depths, e.g. from
+    sample_depths(). Each level is computed from its depth alone, so any
+    number of levels is generated in constant memory.
+    """
+    summary = tree_summary(theorem, a, b, k, i, n)
+    internal = summary.levels - 1
+    log10_a = math.log10(a)
+    for depth in depths if depths is not None else range(summary.levels):
+        if not 0 <= depth <= internal:
+            raise ValueError(f"depth {depth} is outside the tree (0..{internal})")
+        size = _size(theorem, b, n, depth)
+        log10_nodes = depth * log10_a
+        if depth == internal:
+            log10_work = log10_nodes
+        else:
+            log10_work = log10_nodes + k * math.log10(size)
+            if i and theorem != "subtractive":
+                log10_work += i * math.log10(math.log(size))
+        yield Level(depth, size, log10_nodes, log10_work,
+                    10 ** (log10_work - summary.log10_total))
+
+
+def sample_depths(levels, max_rows=MAX_ROWS):
+    """Yield at most max_rows depths evenly spread over 0..levels-1, ends included."""
+    if levels <= max_rows:
+        yield from range(levels)
+        return
+    previous = -1
+    for row in range(max_rows):
+        depth = round(row * (levels - 1) / (max_rows - 1))
+        if depth != previous:
+            yield depth
+            previous = depth
+
+
+def level_table(theorem, a, b, k, i=0, n=1e6, max_rows=MAX_ROWS):
+    """Return (TreeSummary, list of at most max_rows Levels) for display."""
+    summary = tree_summary(theorem, a, b, k, i, n)
+    depths = sample_depths(summary.levels, max_rows)
+    return summary, list(iter_levels(theorem, a, b, k, i, n, depths))
+
+
+def tree_params(result):
+    """Return (theorem, a, b, k, i) of a solver result or parsed recurrence."""
+    return result.theorem, result.a, result.b, result.k, result.i or 0
+
+
+def format_log10(log10_x):
+    """Render a number given by its log10, switching to an exponent when large."""
+    if log10_x < 15:
+        return f"{10 ** log10_x:.6g}"
+    exponent = math.floor(log10_x)
+    mantissa = 10 ** (log10_x - exponent)
+    if round(mantissa, 3) >= 10:
+        mantissa, exponent = mantissa / 10, exponent + 1
+    return f"{mantissa:.3f}e+{exponent}"
+
+
+DOMINANT_TEXT = {
+    "root": "work shrinks by a factor {ratio:.4g} per level, so the root (the combine step) dominates",
+    "balanced": "no level dominates, so the depth multiplies the work of the root",
+    "leaves": "work grows by a factor {ratio:.4g} per level, so the leaves (the recursive calls) dominate",
+}
+
+
+def explain(summary):
+    """One sentence saying which part of the tree does most of the work."""
+    return DOMINANT_TEXT[summary.dominant].format(ratio=summary.ratio if summary.ratio > 1
+                                                  else 1 / summary.ratio)
+
+
+def format_level_table(summary, levels):
+    """Render a summary and its levels as a plain-text table."""
+    lines = [f"{'depth':>13} {'size':>14} {'nodes':>14} {'work':>14} {'share':>8}"]
+    for level in levels:
+        lines.append(
+            f"{level.depth:>13,} {level.size:>14.6g} {format_log10(level.log10_nodes):>14} "
+            f"{format_log10(level.log10_work):>14} {level.share:>8.2%}"
+        )
+    if len(levels) < summary.levels:
+        lines.append(f"({len(levels)} of {summary.levels:,} levels shown)")
+    lines.append(f"Internal work: {format_log10(summary.log10_internal)}, "
+                 f"leaves: {format_log10(summary.log10_leaves)}, "
+                 f"total: {format_log10(summary.log10_total)}")
+    lines.append(f"Levels: {summary.levels:,}; {explain(summary)}.")
+    return "\n".join(lines)
+
+
+# example
+if __name__ == "__main__":
+    for params in [("master", 8, 2, 2), ("master", 2, 2, 1), ("master", 2, 2, 2),
+                   ("extended", 2, 2, 1, 1), ("subtractive", 2, 1, 0),
+                   ("subtractive", 1, 0.001, 1)]:
+        summary, levels = level_table(*params, n=1e6, max_rows=8)
+        print(params)
+        print(format_level_table(summary, levels), end="\n\n")
@@ -0,0 +1,134 @@
+import math
+
+# Theorem name -> function(result) returning the (complexity, case, comparison)
+# strings. Every theorem module registers its formatter when imported.
+FORMATTERS = {}
+
+
+def register_formatter(theorem, formatter):
+    """Register the string formatter used by results of the given theorem."""
+    FORMATTERS[theorem] = formatter
+
+
+def _fmt(x):
+    """Render a number without a trailing .0 for integral values."""
+    if float(x).is_integer():
+        return str(int(x))
+    return f"{x:.3f}".rstrip("0")
+
+
+class RecurrenceResult:
+    """
+    Numeric solution of a recurrence.
+
+    The bound is Θ(exp_base^n * n^poly_exponent * (log n)^log_exponent),
+    times log log n when loglog is set. exp_base is inf when it does not fit
+    in a float; exp_rate stays finite. Text, LaTeX and JSON renderings are
+    only built when asked for.
+    """
+
+    __slots__ = (
+        "theorem", "a", "b", "k", "i",
+        "case", "log_b_a", "poly_exponent", "log_exponent", "exp_base", "loglog",
+        "_strings",
+    )
+
+    def __init__(self, theorem, a, b, k, i, case, log_b_a, poly_exponent,
+                 log_exponent=0, exp_base=1, loglog=False):
+        self.theorem = theorem
+        self.a = a
+        self.b = b
+        self.k = k
+        self.i = i
+        self.case = case
+        self.log_b_a = log_b_a
+        self.poly_exponent = poly_exponent
+        self.log_exponent = log_exponent
+        self.exp_base = exp_base
+        self.loglog = loglog
+        self._strings = None
+
+    def __repr__(self):
+        return (
+            f"RecurrenceResult(theorem={self.theorem!r}, case={self.case}, "
+            f"log_b_a={self.log_b_a!r}, poly_exponent={self.poly_exponent!r}, "
+            f"log_exponent={self.log_exponent!r}, exp_base={self.exp_base!r}, "
+            f"loglog={self.loglog!r})"
+        )
+
+    def __str__(self):
+        return self.complexity
+
+    def with_params(self, a, b, k, i=None):
+        """Return a copy of this result rendered with different parameters."""
+        return RecurrenceResult(
+            self.theorem, a, b, k, i, self.case, self.log_b_a, self.poly_exponent,
+            self.log_exponent, self.exp_base, self.loglog,
+        )
+
+    def as_tuple(self):
+        """Return the legacy (complexity, case, comparison) tuple."""
+        if self._strings is None:
+            self._strings = FORMATTERS[self.theorem](self)
+        return self._strings
+
+    @property
+    def exp_rate(self):
+        """Natural log of exp_base; subtractive results take it from a and b."""
+        if self.theorem == "subtractive" and self.case == 3:
+            return math.log(self.a) / self.b
+        return math.log(self.exp_base)
+
+    @property
+    def complexity(self):
+        return self.as_tuple()[0]
+
+    @property
+    def comparison(self):
+        return self.as_tuple()[2]
+
+    def to_text(self):
+        """Render the case and complexity as plain text."""
+        return f"Case {self.case}: {self.comparison}\nTime complexity: {self.complexity}"
+
+    def to_latex(self):
+        """Render the bound as a LaTeX expression."""
+        factors = []
+        if self.exp_base != 1:
+            if self.theorem == "subtractive":
+                factors.append(f"{_fmt(self.a)}^{{n/{_fmt(self.b)}}}")
+            else:
+                factors.append(f"{_fmt(self.exp_base)}^n")
+        if self.poly_exponent != 0:
+            factors.append(f"n^{{{_fmt(self.poly_exponent)}}}")
+        if self.log_exponent == 1:
+            factors.append(r"\log n")
+        elif self.log_exponent != 0:
+            factors.append(rf"\log^{{{_fmt(self.log_exponent)}}} n")
+        if self.loglog:
+            factors.append(r"\log \log n")
+        return r"O\left(" + (r" \cdot ".join(factors) or "1") + r"\right)"
+
+    def to_dict(self):
+        """Return the numeric fields and rendered complexity as a dict."""
+        return {
+            "theorem": self.theorem,
+            "a": self.a,
+            "b": self.b,
+            "k": self.k,
+            "i": self.i,
+            "case": self.case,
+            "log_b_a": self.log_b_a,
+            "poly_exponent": self.poly_exponent,
+            "log_exponent": self.log_exponent,
+            "exp_base": self.exp_base,
+            "loglog": self.loglog,
+            "complexity": self.complexity,
+            "comparison": self.comparison,
+        }
+
+    def to_json(self):
+        """Render the result as a JSON object string."""
+        import json
+
+        return json.dumps(self.to_dict(), ensure_ascii=False)
@@ -1,3 +1,39 @@
+import math
+
+from Theorems.cache import cached_solver
+from Theorems.result import RecurrenceResult, register_formatter
+
+
+@cached_solver("subtractive")
+def subtractive_master_theorem_result(a, b, k):
+    """
+    For recurrences of the form:
+    T(n) = a T(n - b) + Θ(n^k)
+    Returns:
+        RecurrenceResult holding the case and the numeric exponents
+
+    For a > 1 the stored exponents are the tight Θ(a^(n/b)): unrolling
+    gives a^(n/b) times a convergent sum over the n^k terms, so the n^k
+    of the O(a^(n/b) n^k) statement is not part of the dominant term.
+    """
+    if not b > 0:
+        raise ValueError("b must be positive")
+    if a < 1:
+        return RecurrenceResult("subtractive", a, b, k, None, 1, None, k)
+    elif a == 1:
+        return RecurrenceResult("subtractive", a, b, k, None, 2, None, k + 1)
+    else:  # a > 1
+        return RecurrenceResult("subtractive", a, b, k, None, 3, None, 0, exp_base=_exp_base(a, b))
+
+
+def _exp_base(a, b):
+    """a^(1/b), or inf when it does not fit in a float (e.g. a = 10, b = 0.001)."""
+    try:
+        return a ** (1 / b)
+    except OverflowError:
+        return math.inf
+
+
 def subtractive_master_theorem(a, b, k):
     """
     For recurrences of the form:
@@ -5,9 +41,14 @@ def subtractive_master_theorem(a, b, k):
     Returns:
         complexity (str), case (int), explanation (str)
     """
-    if a < 1:
+    return subtractive_master_theorem_result(a, b, k).as_tuple()
+
+
+def format_subtractive_result(a, b, k, case):
+    """Build the (complexity, case, explanation) strings for a decided case."""
+    if case == 1:
         return f"O(n^{k})", 1, f"a = {a} < 1, dominated by the combine step (unusual case)"
-    elif a == 1:
+    elif case == 2:
         return f"O(n^{k+1})", 2, f"a = 1, sum of polynomial terms increases degree by 1"
     else:  # a > 1
         if k == 0:
@@ -16,6 +57,11 @@ def subtractive_master_theorem(a, b, k):
             return f"O({a}^(n/{b}) * n^{k})", 3, f"a = {a} > 1, exponential times polynomial growth"
 
 
+register_formatter(
+    "subtractive", lambda r: format_subtractive_result(r.a, r.b, r.k, r.case)
+)
+
+
 def print_subtractive_master_result(a, b, k):
     complexity, case, explanation = subtractive_master_theorem(a, b, k)
     print(f"Recurrence relation: T(n) = {a} T(n - {b}) + Θ(n^{k})")
@@ -0,0 +1,315 @@
+"""
+Exact symbolic bounds of solver results, built with SymPy.
+
+The solvers report bounds such as O(n^1.585) with rounded exponents. This
+module rebuilds each bound as an exact SymPy expression, e.g.
+n**(log(3)/log(2)), so bounds can be simplified, compared and ordered
+without rounding:
+
+    from Theorems.symbolic import bound, compare, sort_results
+    bound(master_theorem_result(3, 2, 1))            # n**(log(3)/log(2))
+    compare(master_theorem_result(3, 2, 1), "n^2")   # -1: O(n^log2(3)) ⊂ O(n^2)
+
+SymPy is imported on first use and exponents are memoized per parameter
+set. submit() builds them in a background process pool, so the numeric
+solvers never wait on SymPy.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+import functools
+import threading
+
+from Theorems.exact import FAST_PATH_MARGIN, to_fraction
+
+# Most parameter sets whose exact exponents are remembered
+CACHE_SIZE = 4096
+
+# Background worker processes started by submit()
+DEFAULT_WORKERS = 2
+
+# Digits used to decide the sign of a difference SymPy cannot simplify to 0
+PRECISION = 60
+
+_growth_keys = {}
+_futures = {}
+_executor = None
+_lock = threading.Lock()
+
+
+def _sympy():
+    import sympy
+
+    return sympy
+
+
+@functools.lru_cache(maxsize=None)
+def symbol():
+    """Return the positive SymPy symbol n used in every bound."""
+    return _sympy().Symbol("n", positive=True)
+
+
+def _number(x):
+    """Return x as an exact SymPy Rational, or a Float if it has no exact value."""
+    sympy = _sympy()
+    fraction = to_fraction(x)
+    if fraction is None:
+        return sympy.Float(x)
+    return sympy.Rational(fraction.numerator, fraction.denominator)
+
+
+def _dominant_modulus(coefficients):
+    """Return the exact modulus of the largest root of x^d - c_1 x^(d-1) - ... - c_d."""
+    sympy = _sympy()
+    x = sympy.Symbol("x")
+    d = len(coefficients)
+    poly = sympy.Poly(x ** d - sum(_number(c) * x ** (d - j) for j, c in enumerate(coefficients, 1)), x)
+    roots = sympy.roots(poly)
+    if sum(roots.values()) != d:
+        # No radicals for every root: fall back to indexed algebraic roots.
+        roots = dict.fromkeys(poly.all_roots())
+    root = max(roots, key=lambda r: abs(complex(r.evalf(PRECISION))))
+    return sympy.simplify(sympy.Abs(root))
+
+
+def params(result):
+    """Return the hashable parameter set identifying a result's bound."""
+    a, b = result.a, result.b
+    if isinstance(a, list):
+        a = tuple(a)
+    if isinstance(b, list):
+        b = tuple(b)
+    return (result.theorem, a, b, result.k, result.i, result.case, result.log_b_a,
+            result.poly_exponent, result.log_exponent, result.exp_base, bool(result.loglog))
+
+
+def _build_growth_key(key):
+    """Compute the exact (exp_base, poly, log, loglog) exponents of a parameter set."""
+    sympy = _sympy()
+    theorem, a, b, k, i, case, log_b_a, poly_exponent, log_exponent, exp_base, loglog = key
+    exact_exp_base = sympy.Integer(1)
+    exact_poly = _number(poly_exponent)
+
+    if (theorem, case) in (("master", 1), ("extended", 3)):
+        exact_poly = sympy.log(_number(a), _number(b))
+    elif theorem == "akra_bazzi" and case == 1:
+        # sum a_j b_j^-p = 1 only has a closed form when every b_j is equal.
+        if len(set(b)) == 1:
+            exact_poly = sympy.log(sum(_number(x) for x in a), _number(b[0]))
+        else:
+            exact_poly = sympy.Float(log_b_a)
+    elif theorem == "subtractive" and case == 3:
+        exact_exp_base = _number(a) ** (1 / _number(b))
+    elif theorem == "linear" and case == 3:
+        exact_exp_base = _dominant_modulus(a)
+    return exact_exp_base, exact_poly, _number(log_exponent), int(loglog)
+
+
+def _remember(key, growth_key):
+    with _lock:
+        if key not in _growth_keys and len(_growth_keys) >= CACHE_SIZE:
+            _growth_keys.pop(next(iter(_growth_keys)))
+        _growth_keys[key] = growth_key
+    return growth_key
+
+
+def growth_key(result):
+    """
+    Return the exact exponents (exp_base, poly, log, loglog) of a result.
+
+    The bound is exp_base^n n^poly (log n)^log (log log n)^loglog, so
+    comparing these tuples left to right orders bounds asymptotically.
+    """
+    key = params(result)
+    cached = _growth_keys.get(key)
+    if cached is not None:
+        return cached
+    return _remember(key, _build_growth_key(key))
+
+
+def _assemble(growth):
+    sympy = _sympy()
+    n = symbol()
+    exp_base, poly, log, loglog = growth
+    return exp_base ** n * n ** poly * sympy.log(n) ** log * sympy.log(sympy.log(n)) ** loglog
+
+
+def bound(result):
+    """Return the exact SymPy expression of a result's bound, without the O()."""
+    return _assemble(growth_key(result))
+
+
+def to_latex(result):
+    """Render the exact bound of a result as LaTeX, e.g. O\\left(n^{\\frac{\\log 3}{\\log 2}}\\right)."""
+    return r"O\left(" + _sympy().latex(bound(result)) + r"\right)"
+
+
+def _compare_numbers(x, y):
+    """Return -1, 0 or 1 for exact SymPy numbers x <, = or > y."""
+    fx, fy = float(x), float(y)
+    if abs(fx - fy) > FAST_PATH_MARGIN * max(1.0, abs(fx), abs(fy)):
+        return -1 if fx < fy else 1
+    difference = x - y
+    if difference == 0 or difference.equals(0):
+        return 0
+    return -1 if difference.evalf(PRECISION) < 0 else 1
+
+
+def _compare_keys(x, y):
+    for u, v in zip(x, y):
+        sign = _compare_numbers(u, v)
+        if sign:
+            return sign
+    return 0
+
+
+def expression(x):
+    """
+    Return a SymPy expression for a result, an expression or a string.
+
+    Strings may be written like the solvers' output, e.g. "O(n^2 log n)".
+    """
+    if hasattr(x, "theorem"):
+        return bound(x)
+    if not isinstance(x, str):
+        return x
+    from sympy.parsing.sympy_parser import (convert_xor, implicit_multiplication_application,
+                                            parse_expr, standard_transformations)
+
+    text = x.strip()
+    if text.startswith("O(") and text.endswith(")"):
+        text = text[2:-1]
+    sympy = _sympy()
+    return parse_expr(
+        text.replace("·", "*"),
+        local_dict={"n": symbol(), "log": sympy.log},
+        transformations=standard_transformations + (convert_xor, implicit_multiplication_application),
+    )
+
+
+def compare(x, y):
+    """
+    Asymptotically compare two bounds: -1 if x = o(y), 0 if x = Θ(y), 1 if y = o(x).
+
+    Two solver results are compared exactly through their growth keys. Any
+    other expression (or string) is compared with a limit of x / y.
+    """
+    if hasattr(x, "theorem") and hasattr(y, "theorem"):
+        return _compare_keys(growth_key(x), growth_key(y))
+    sympy = _sympy()
+    ratio = sympy.limit(expression(x) / expression(y), symbol(), sympy.oo)
+    if ratio == 0:
+        return -1
+    if ratio is sympy.oo:
+        return 1
+    if ratio.is_positive and ratio.is_finite:
+        return 0
+    raise ValueError(f"cannot compare {x} and {y}: the ratio tends to {ratio}")
+
+
+def is_big_o(x, y):
+    """Return True when x = O(y)."""
+    return compare(x, y) <= 0
+
+
+def is_little_o(x, y):
+    """Return True when x = o(y), e.g. O(n^log2(3)) ⊂ O(n^2)."""
+    return compare(x, y) < 0
+
+
+def sort_results(results, reverse=False):
+    """
+    Return the results ordered from slowest to fastest growing.
+
+    Equal parameter sets share one growth key and equal keys one comparison,
+    so sorting many results costs SymPy work only per distinct bound.
+    """
+    results = list(results)
+    keys = [growth_key(result) for result in results]
+    distinct = sorted(set(keys), key=functools.cmp_to_key(_compare_keys))
+    # Θ-equal keys (e.g. log(4, 2) and 2) must share a rank.
+    rank = {}
+    for position, key in enumerate(distinct):
+        if position and not _compare_keys(distinct[position - 1], key):
+            rank[key] = rank[distinct[position - 1]]
+        else:
+            rank[key] = position
+    order = sorted(range(len(results)), key=lambda j: rank[keys[j]], reverse=reverse)
+    return [results[j] for j in order]
+
+
+def _worker_growth_key(key):
+    """Build a growth key in a worker process."""
+    return _build_growth_key(key)
+
+
+def _get_executor(workers=None):
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=workers or DEFAULT_WORKERS)
+        return _executor
+
+
+def submit(result, workers=None):
+    """
+    Build the exact bound of a result in a background worker process.
+
+    Returns a Future of the SymPy expression. Requests for the same
+    parameter set share one Future, and finished keys are memoized in this
+    process, so a later bound() call returns at once.
+    """
+    key = params(result)
+    cached = _growth_keys.get(key)
+    if cached is not None:
+        future = Future()
+        future.set_result(_assemble(cached))
+        return future
+    with _lock:
+        future = _futures.get(key)
+    if future is not None:
+        return future
+
+    growth = _get_executor(workers).submit(_worker_growth_key, key)
+    future = Future()
+
+    def done(growth):
+        with _lock:
+            _futures.pop(key, None)
+        if growth.exception() is not None:
+            future.set_exception(growth.exception())
+        else:
+            future.set_result(_assemble(_remember(key, growth.result())))
+
+    with _lock:
+        _futures[key] = future
+    growth.add_done_callback(done)
+    return future
+
+
+def shutdown(wait=True):
+    """Stop the background workers started by submit()."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def clear_cache():
+    """Forget every memoized growth key."""
+    with _lock:
+        _growth_keys.clear()
+
+
+# example
+if __name__ == "__main__":
+    from Theorems.dispatch import solve
+
+    results = [solve(text) for text in (
+        "T(n) = 3T(n/2) + n", "T(n) = 4T(n/2) + n", "T(n) = 2T(n/2) + n log n",
+        "T(n) = T(n-1) + T(n-2) + 1", "T(n) = 2T(n-1) + 1", "T(n) = 8T(n/2) + n^2",
+    )]
+    for result in sort_results(results):
+        print(f"{result.complexity:<24} exact: {bound(result)}")
+    print("O(n^log2(3)) ⊂ O(n^2):", is_little_o(results[0], "n^2"))
+    print(submit(solve("T(n) = 7T(n/2) + n^2")).result())
+    shutdown()
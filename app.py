@@ -1,8 +1,13 @@
+import atexit
+import hashlib
+import os
 import streamlit as st
-import math
 from Theorems.master_theorem import master_theorem
-from Theorems.extended_master_theorem import extended_master_theorem
+from Theorems.extended_master_theorem import extended_master_theorem_result
 from Theorems.subtractive_master_theorem import subtractive_master_theorem
+from Theorems.cache import SolverCache, set_default_cache
+from Theorems.parser import ParseError
+from Theorems.dispatch import RULES, solve
 
 # Set page configuration
 st.set_page_config(
@@ -11,6 +16,30 @@ st.set_page_config(
     layout="wide",
 )
 
+# Solver cache shared by every session, so it survives script reruns. Set
+# RECURRENCE_CACHE_DB to also share it with other replicas and restarts.
+@st.cache_resource
+def get_solver_cache():
+    path = os.environ.get("RECURRENCE_CACHE_DB")
+    if path:
+        from Theorems.persistent_cache import PersistentCache
+        ttl = os.environ.get("RECURRENCE_CACHE_TTL")
+        cache = PersistentCache(path, maxsize=16384, ttl=float(ttl) if ttl else None)
+        # Write the entries still pending when the server shuts down.
+        atexit.register(cache.close)
+    else:
+        cache = SolverCache(maxsize=16384)
+    set_default_cache(cache)
+    return cache
+
+# Solved uploads keyed by file content, shared by every session
+@st.cache_resource
+def get_upload_cache():
+    return SolverCache(maxsize=8)
+
+# Rows per chunk when solving an uploaded file
+UPLOAD_CHUNK = 20000
+
 # Application header
 def display_header():
     st.title("Recurrence Relation Solver")
@@ -32,9 +61,15 @@ def create_sidebar():
                 "Master Theorem",
                 "Extended Master Theorem",
                 "Subtractive Master Theorem", 
+                "Recurrence Expression",
+                "Batch Upload",
+                "Growth Curves",
+                "Recursion Tree",
                 "About"
             ]
         )
+        with st.expander("Solver cache"):
+            st.json(get_solver_cache().stats())
     return theorem_option
 
 # Master Theorem UI
@@ -113,7 +148,8 @@ def render_extended_master_theorem():
     
     if st.button("Solve using Extended Master Theorem"):
         try:
-            complexity, case, comparison = extended_master_theorem(a, b, k, i)
+            result = extended_master_theorem_result(a, b, k, i)
+            complexity, case, comparison = result.as_tuple()
             
             st.success(f"Time Complexity: {complexity}")
             
@@ -121,7 +157,7 @@ def render_extended_master_theorem():
             st.subheader("Explanation")
             st.markdown(f"**Case {case}** applies: {comparison}")
 
-            log_b_a = math.log(a, b)
+            log_b_a = result.log_b_a
             
             if case == 3:  # Note: case numbers differ between functions and are adjusted here
                 st.markdown("**The recursive work dominates**: The work done by recursive calls is more significant than the combine step.")
@@ -187,6 +223,221 @@ def render_subtractive_master_theorem():
         except Exception as e:
             st.error(f"Error solving the recurrence: {str(e)}")
 
+# Free-form recurrence UI
+def render_expression():
+    st.header("Recurrence Expression")
+    st.markdown("""
+    Type a recurrence and the matching theorem is chosen automatically, e.g.
+
+    - T(n) = 7T(n/2) + n^2 log n
+    - T(n) = 2T(n-1) + 1
+    - T(n) = T(n/2) + Θ(n / log n)
+    - T(n) = T(n/3) + T(2n/3) + n
+    """)
+
+    expression = st.text_input("Recurrence", value="T(n) = 7T(n/2) + n^2 log n")
+    exact = st.checkbox("Show the exact symbolic bound", value=False,
+                        help="Rebuild the bound with SymPy, e.g. n^(log 7 / log 2) instead of n^2.807")
+
+    if st.button("Solve recurrence"):
+        try:
+            result = solve(expression)
+
+            st.success(f"Time Complexity: {result.complexity}")
+            st.subheader("Explanation")
+            st.markdown(f"**Rule**: {RULES[result.theorem]}")
+            st.markdown(f"**Case {result.case}** applies: {result.comparison}")
+            st.subheader("Bound")
+            st.latex(f"T(n) = {result.to_latex()}")
+            if exact:
+                from Theorems.symbolic import to_latex
+                st.latex(f"T(n) = {to_latex(result)}")
+                st.caption("Exact bound built with SymPy.")
+
+        except ParseError as e:
+            st.error(f"Could not parse the recurrence: {str(e)}")
+        except Exception as e:
+            st.error(f"Error solving the recurrence: {str(e)}")
+
+def iter_upload_chunks(upload):
+    """Yield (first line number, records, fraction of the file read) for an uploaded file."""
+    upload.seek(0)
+    if upload.name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(upload)
+        total = max(parquet.metadata.num_rows, 1)
+        line = 1
+        for batch in parquet.iter_batches(batch_size=UPLOAD_CHUNK):
+            records = batch.to_pylist()
+            yield line, records, (line - 1 + len(records)) / total
+            line += len(records)
+    else:
+        import pandas as pd
+
+        # Cells stay text and are converted like the CLI CSV reader does, so an
+        # integer column with blank cells is not turned into floats.
+        line = 2  # line 1 is the header
+        for frame in pd.read_csv(upload, chunksize=UPLOAD_CHUNK, dtype=str, keep_default_na=False):
+            records = frame.to_dict("records")
+            yield line, records, upload.tell() / max(upload.size, 1)
+            line += len(records)
+
+def solve_upload(upload, progress):
+    """Solve an uploaded CSV/Parquet file chunk by chunk; returns a DataFrame of results."""
+    import pandas as pd
+    from Theorems.bulk import OUTPUT_FIELDS
+    from Theorems.parallel import solve_chunk
+
+    frames = []
+    solved = 0
+    for line, records, fraction in iter_upload_chunks(upload):
+        # Empty cells ("", NaN or None) mean "not given", as in the CLI CSV reader.
+        chunk = [
+            (line + offset, {key: value for key, value in record.items()
+                             if value is not None and value == value and value != ""})
+            for offset, record in enumerate(records)
+        ]
+        frames.append(pd.DataFrame(solve_chunk(chunk, vectorized=True), columns=OUTPUT_FIELDS))
+        solved += len(records)
+        progress.progress(min(fraction, 1.0), text=f"Solved {solved:,} rows")
+    if not frames:
+        return pd.DataFrame(columns=OUTPUT_FIELDS)
+    return pd.concat(frames, ignore_index=True).dropna(axis=1, how="all")
+
+# Batch upload UI
+def render_batch_upload():
+    st.header("Batch Upload")
+    st.markdown("""
+    Upload a CSV or Parquet file with one recurrence per row. Use the columns
+    `theorem`, `a`, `b`, `k` and `i` (as in `main.py solve`), or an
+    `expression` column such as `T(n) = 7T(n/2) + n^2 log n`.
+    """)
+
+    upload = st.file_uploader("Recurrences", type=["csv", "parquet"])
+    if upload is None:
+        return
+
+    # Hash the upload's buffer in place rather than copying it out.
+    key = (hashlib.sha256(upload.getbuffer()).hexdigest(), upload.name.lower().endswith(".parquet"))
+    cache = get_upload_cache()
+    entry = cache.get(key)
+    if entry is None:
+        progress = st.progress(0.0, text="Solving...")
+        try:
+            results = solve_upload(upload, progress)
+        except Exception as e:
+            progress.empty()
+            st.error(f"Could not read the file: {str(e)}")
+            return
+        progress.empty()
+        entry = {"results": results}
+        cache.put(key, entry)
+
+    results = entry["results"]
+    errors = int(results["error"].notna().sum()) if "error" in results else 0
+    st.success(f"Solved {len(results):,} recurrences ({errors:,} errors)")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox("Rows per page", [25, 100, 500], index=1)
+    pages = max((len(results) - 1) // page_size + 1, 1)
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+    start = (page - 1) * page_size
+    st.dataframe(results.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"Page {page} of {pages}")
+
+    if "csv" not in entry:
+        entry["csv"] = results.to_csv(index=False).encode("utf-8")
+    st.download_button("Download results (CSV)", entry["csv"],
+                       file_name=upload.name.rsplit(".", 1)[0] + "_solved.csv", mime="text/csv")
+
+# Growth curve UI
+def render_growth_curves():
+    from Theorems.growth import MAX_POINTS, growth_chart
+
+    st.header("Growth Curves")
+    st.markdown("Compare how recurrences grow. Enter one recurrence per line.")
+
+    text = st.text_area(
+        "Recurrences",
+        value="T(n) = 2T(n/2) + n\nT(n) = 7T(n/2) + n^2\nT(n) = 8T(n/2) + n^3\nT(n) = T(n-1) + n",
+        height=150,
+    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        exponent = st.slider("Largest n (10^x)", min_value=3, max_value=12, value=9)
+    with col2:
+        points = st.slider("Points per curve", min_value=20, max_value=MAX_POINTS, value=200, step=20)
+    with col3:
+        evaluated = st.checkbox("Show evaluated T(n)", value=False,
+                                help="Numerically evaluate each recurrence with T(1) = 1")
+
+    results, labels = [], []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            result = solve(line)
+        except Exception as e:
+            st.warning(f"Skipping {line.strip()!r}: {str(e)}")
+            continue
+        results.append(result)
+        labels.append(f"{line.strip()}: {result.complexity}")
+
+    if results:
+        chart = growth_chart(results, labels, n_max=10.0 ** exponent, points=points, evaluated=evaluated)
+        st.altair_chart(chart, use_container_width=True)
+        st.caption("n on a log axis against log10 T(n). Predicted curves are solid; "
+                   "evaluated ones are dashed, with the bound shifted to meet them.")
+
+def render_recursion_tree():
+    import pandas as pd
+    from Theorems.recursion_tree import MAX_ROWS, explain, format_log10, level_table, tree_params
+
+    st.header("Recursion Tree")
+    st.markdown("See how the work is spread over the levels of the recursion tree, "
+                "and why a case of the master theorem applies.")
+
+    expression = st.text_input("Recurrence", value="T(n) = 2T(n/2) + n", key="tree_expression")
+    col1, col2 = st.columns(2)
+    with col1:
+        exponent = st.slider("Input size n (10^x)", min_value=1, max_value=12, value=6)
+    with col2:
+        rows = st.slider("Levels shown", min_value=5, max_value=MAX_ROWS, value=20)
+
+    try:
+        result = solve(expression)
+        summary, levels = level_table(*tree_params(result), n=10.0 ** exponent, max_rows=rows)
+    except ParseError as e:
+        st.error(f"Could not parse the recurrence: {str(e)}")
+        return
+    except ValueError as e:
+        st.error(str(e))
+        return
+
+    st.success(f"Time Complexity: {result.complexity} (case {result.case})")
+    st.markdown(f"The tree has **{summary.levels:,}** levels: {explain(summary)}.")
+    table = pd.DataFrame({
+        "depth": [level.depth for level in levels],
+        "subproblem size": [f"{level.size:.6g}" for level in levels],
+        "nodes": [format_log10(level.log10_nodes) for level in levels],
+        "work": [format_log10(level.log10_work) for level in levels],
+        "share of total": [100 * level.share for level in levels],
+    })
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_config={"share of total": st.column_config.ProgressColumn(format="%.2f%%", min_value=0, max_value=100)},
+    )
+    if len(levels) < summary.levels:
+        st.caption(f"{len(levels)} of {summary.levels:,} levels shown, evenly spaced; the last row holds the leaves.")
+    st.markdown(f"Internal work **{format_log10(summary.log10_internal)}**, "
+                f"leaves **{format_log10(summary.log10_leaves)}**, "
+                f"total **{format_log10(summary.log10_total)}** with T(n) = 1 at the leaves.")
+
 # About section
 def render_about():
     st.header("About Recurrence Relation Solver")
@@ -218,6 +469,7 @@ def render_about():
 
 # Main application
 def main():
+    get_solver_cache()
     display_header()
     theorem_option = create_sidebar()
     
@@ -227,6 +479,14 @@ def main():
         render_extended_master_theorem()
     elif theorem_option == "Subtractive Master Theorem":
         render_subtractive_master_theorem()
+    elif theorem_option == "Recurrence Expression":
+        render_expression()
+    elif theorem_option == "Batch Upload":
+        render_batch_upload()
+    elif theorem_option == "Growth Curves":
+        render_growth_curves()
+    elif theorem_option == "Recursion Tree":
+        render_recursion_tree()
     else:  # About
         render_about()
     
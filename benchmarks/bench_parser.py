@@ -0,0 +1,85 @@
+"""
+Throughput benchmark for the recurrence expression parser.
+
+Parses a fixed set of distinct synthetic expressions with a cold parse cache
+(every expression is new) and again with a hot cache, on one core. Exits
+with status 1 when the cold rate is below --min-rate.
+
+    python benchmarks/bench_parser.py --size 50000 --min-rate 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Theorems.parser import clear_parse_cache, parse_recurrence  # noqa: E402
+
+SEED = 20250101
+
+# Spellings upstream tooling emits; the last few go through the tokenizer.
+TEMPLATES = (
+    "T(n) = {a}T(n/{b}) + n^{k}",
+    "T(n) = {a}T(n/{b}) + n^{k} log n",
+    "T(n) = {a}T(n/{b}) + n log^{i} n",
+    "T(n) = {a}T(n-{b}) + 1",
+    "T(n) = {a}T(n-{b}) + n^{k}",
+    "{a}*T(n/{b}) + n**{k}",
+    "T(n) = {a}T(n/{b}) + Θ(n^{k} / log n)",
+    "T(n) = {a}T(n/{b}) + sqrt(n) (log n)^{i}",
+)
+
+
+def make_expressions(size, seed=SEED):
+    """Return size distinct expressions, cycling through the templates."""
+    rng = random.Random(seed)
+    seen = set()
+    expressions = []
+    while len(expressions) < size:
+        template = TEMPLATES[len(expressions) % len(TEMPLATES)]
+        text = template.format(a=rng.randint(1, 5000), b=rng.randint(2, 64),
+                               k=rng.randint(0, 40) / 4, i=rng.randint(1, 8))
+        if text not in seen:
+            seen.add(text)
+            expressions.append(text)
+    return expressions
+
+
+def run(expressions):
+    """Parse every expression once; returns expressions per second."""
+    start = time.perf_counter()
+    for text in expressions:
+        parse_recurrence(text)
+    elapsed = time.perf_counter() - start
+    return len(expressions) / elapsed if elapsed > 0 else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the recurrence expression parser.")
+    parser.add_argument("--size", type=float, default=50000,
+                        help="Number of distinct expressions; keep it below the parse cache "
+                             "size for a meaningful hot run (default: 50000)")
+    parser.add_argument("--min-rate", type=float, default=100000,
+                        help="Fail below this many cold parses per second (default: 100000)")
+    args = parser.parse_args()
+
+    expressions = make_expressions(int(args.size))
+    clear_parse_cache()
+    cold = run(expressions)
+    hot = run(expressions)
+    info = parse_recurrence.cache_info()
+
+    print(f"{len(expressions):,} distinct expressions")
+    print(f"  cold cache: {cold:>12,.0f} parses/s")
+    print(f"  hot cache:  {hot:>12,.0f} parses/s  ({info.hits:,} hits, {info.currsize:,} cached)")
+    if cold < args.min_rate:
+        print(f"FAIL: cold rate below {args.min_rate:,.0f} parses/s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
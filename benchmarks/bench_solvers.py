@@ -0,0 +1,305 @@
+"""
+Benchmark suite for the theorem solvers.
+
+Covers scalar calls with the cache disabled and with a hot cache, the NumPy
+batch solvers and the `main.py solve` bulk mode for the master, extended and
+subtractive theorems, on fixed synthetic workloads. Reports ops/sec, p50/p99
+latency and peak memory, and can save the results as JSON and compare against
+a baseline.
+
+    python benchmarks/bench_solvers.py --sizes 1e3 1e4 1e5 --save baseline.json
+    python benchmarks/bench_solvers.py --compare baseline.json --threshold 0.15
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Theorems.cache import SolverCache, get_default_cache, set_default_cache  # noqa: E402
+from Theorems.master_theorem import master_theorem  # noqa: E402
+from Theorems.extended_master_theorem import extended_master_theorem  # noqa: E402
+from Theorems.subtractive_master_theorem import subtractive_master_theorem  # noqa: E402
+
+SEED = 20250101
+THEOREMS = ("master", "extended", "subtractive")
+SCENARIOS = ("scalar_uncached", "scalar_hot", "batch", "cli")
+
+# Batch scenarios are timed per chunk of this many records.
+BATCH_CHUNK = 4096
+
+# CLI latency is timed per request on at most this many records, sent one
+# at a time; throughput and memory come from a separate whole-file run.
+CLI_LATENCY_SAMPLES = 2000
+
+SCALAR = {
+    "master": master_theorem,
+    "extended": extended_master_theorem,
+    "subtractive": subtractive_master_theorem,
+}
+
+
+def make_workload(theorem, size, seed=SEED):
+    """Return fixed synthetic parameter columns for a theorem."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    columns = {
+        "a": rng.integers(1, 65, size).astype(np.float64),
+        "b": rng.integers(2, 17, size).astype(np.float64),
+        "k": rng.integers(0, 9, size) / 2,
+    }
+    if theorem == "extended":
+        columns["i"] = rng.integers(-4, 5, size) / 2
+    if theorem == "subtractive":
+        columns["a"] = rng.integers(1, 9, size) / 2
+        columns["b"] = rng.integers(1, 5, size).astype(np.float64)
+    return columns
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def summarize(latencies_ns, records, elapsed):
+    """Turn per-operation latencies into the reported metrics."""
+    latencies_ns.sort()
+    return {
+        "records": records,
+        "ops_per_sec": records / elapsed if elapsed > 0 else float("inf"),
+        "p50_us": percentile(latencies_ns, 0.50) / 1000,
+        "p99_us": percentile(latencies_ns, 0.99) / 1000,
+    }
+
+
+def bench_scalar(theorem, columns, hot):
+    """Time one call per record through the tuple-returning solver."""
+    solver = SCALAR[theorem]
+    rows = list(zip(*(columns[name].tolist() for name in columns)))
+    previous = get_default_cache()
+    cache = SolverCache(maxsize=max(len(rows), 1), enabled=hot)
+    set_default_cache(cache)
+    try:
+        if hot:
+            for row in rows:
+                solver(*row)
+        latencies = []
+        clock = time.perf_counter_ns
+        start = clock()
+        for row in rows:
+            t0 = clock()
+            solver(*row)
+            latencies.append(clock() - t0)
+        elapsed = (clock() - start) / 1e9
+    finally:
+        set_default_cache(previous)
+    return summarize(latencies, len(rows), elapsed)
+
+
+def bench_batch(theorem, columns):
+    """Time the NumPy batch solver over fixed-size chunks."""
+    from Theorems import batch
+
+    solver = {
+        "master": batch.master_theorem_batch,
+        "extended": batch.extended_master_theorem_batch,
+        "subtractive": batch.subtractive_master_theorem_batch,
+    }[theorem]
+    size = len(columns["a"])
+    latencies = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for lo in range(0, size, BATCH_CHUNK):
+        chunk = [column[lo:lo + BATCH_CHUNK] for column in columns.values()]
+        t0 = clock()
+        solver(*chunk)
+        latencies.append(clock() - t0)
+    elapsed = (clock() - start) / 1e9
+    return summarize(latencies, size, elapsed)
+
+
+def write_records(theorem, columns, f):
+    """Write the workload as JSONL records for `main.py solve`."""
+    names = list(columns)
+    for row in zip(*(columns[name].tolist() for name in names)):
+        record = dict(zip(names, row))
+        record["theorem"] = theorem
+        f.write(json.dumps(record) + "\n")
+
+
+# Runs a script and writes the peak RSS of this process in KiB to argv[1].
+# A forked child's ru_maxrss starts from the parent's peak on Linux (so
+# RUSAGE_CHILDREN and even wait4 report the benchmark's own memory); VmHWM
+# belongs to the address space created by exec and is the child's alone.
+PEAK_RSS_RUNNER = """
+import resource, runpy, sys
+out, sys.argv = sys.argv[1], sys.argv[2:]
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+finally:
+    try:
+        with open("/proc/self/status") as f:
+            peak = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        # ru_maxrss is in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak //= 1024 if sys.platform == "darwin" else 1
+    with open(out, "w") as f:
+        f.write(str(peak))
+"""
+
+
+def run_child(script_args):
+    """Run a Python script to completion; return (elapsed ns, its own peak RSS in KiB)."""
+    with tempfile.NamedTemporaryFile("r", suffix=".peak", delete=False) as f:
+        path = f.name
+    try:
+        start = time.perf_counter_ns()
+        subprocess.run([sys.executable, "-c", PEAK_RSS_RUNNER, path] + script_args, cwd=ROOT, check=False)
+        elapsed_ns = time.perf_counter_ns() - start
+        with open(path) as f:
+            peak = int(f.read() or 0)
+    finally:
+        os.unlink(path)
+    return elapsed_ns, peak
+
+
+def cli_latencies(theorem, columns, samples):
+    """Send records to one `main.py solve` process one at a time; return per-request ns."""
+    lines = io.StringIO()
+    write_records(theorem, {name: column[:samples] for name, column in columns.items()}, lines)
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "main.py", "solve", "--quiet"],
+        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    latencies = []
+    clock = time.perf_counter_ns
+    try:
+        for line in lines.getvalue().splitlines(keepends=True):
+            t0 = clock()
+            proc.stdin.write(line)
+            proc.stdin.flush()
+            proc.stdout.readline()
+            latencies.append(clock() - t0)
+    finally:
+        proc.stdin.close()
+        proc.stdout.read()
+        proc.wait()
+    return latencies
+
+
+def bench_cli(theorem, columns):
+    """Time `main.py solve`: throughput and memory over a file, latency per request."""
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        path = f.name
+        write_records(theorem, columns, f)
+    try:
+        elapsed_ns, peak = run_child(["main.py", "solve", "--quiet", path, "-o", os.devnull])
+    finally:
+        os.unlink(path)
+    latencies = cli_latencies(theorem, columns, CLI_LATENCY_SAMPLES)
+    metrics = summarize(latencies, len(columns["a"]), elapsed_ns / 1e9)
+    metrics["peak_kib"] = peak
+    return metrics
+
+
+def run_scenario(theorem, scenario, columns, measure_memory):
+    if scenario == "cli":
+        return bench_cli(theorem, columns)
+
+    def call():
+        if scenario == "batch":
+            return bench_batch(theorem, columns)
+        return bench_scalar(theorem, columns, hot=scenario == "scalar_hot")
+
+    metrics = call()
+    if measure_memory:
+        # Separate run: tracemalloc slows allocation down too much to time it.
+        tracemalloc.start()
+        call()
+        metrics["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return metrics
+
+
+def run(sizes, theorems, scenarios, measure_memory=True):
+    results = {}
+    for size in sizes:
+        for theorem in theorems:
+            columns = make_workload(theorem, size)
+            for scenario in scenarios:
+                metrics = run_scenario(theorem, scenario, columns, measure_memory)
+                key = f"{theorem}/{scenario}/{size}"
+                results[key] = metrics
+                print(
+                    f"{key:<32} {metrics['ops_per_sec']:>14,.0f} ops/s  "
+                    f"p50 {metrics['p50_us']:>10.2f} µs  p99 {metrics['p99_us']:>10.2f} µs  "
+                    f"peak {metrics.get('peak_kib', float('nan')):>10,.0f} KiB"
+                )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return regression messages for metrics worse than baseline by threshold."""
+    regressions = []
+    for key, metrics in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if metrics["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{key}: ops/sec {old['ops_per_sec']:,.0f} -> {metrics['ops_per_sec']:,.0f}"
+            )
+        if metrics["p99_us"] > old["p99_us"] * (1 + threshold):
+            regressions.append(f"{key}: p99 {old['p99_us']:.2f} -> {metrics['p99_us']:.2f} µs")
+        if "peak_kib" in metrics and "peak_kib" in old and metrics["peak_kib"] > old["peak_kib"] * (1 + threshold):
+            regressions.append(
+                f"{key}: peak memory {old['peak_kib']:,.0f} -> {metrics['peak_kib']:,.0f} KiB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=float, default=[1e3, 1e4, 1e5],
+                        help="Workload sizes in records (default: 1e3 1e4 1e5)")
+    parser.add_argument("--theorems", nargs="+", choices=THEOREMS, default=list(THEOREMS))
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--no-memory", action="store_true", help="Skip peak memory measurement")
+    parser.add_argument("--save", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown that counts as a regression (default: 0.10)")
+    args = parser.parse_args()
+
+    results = run([int(s) for s in args.sizes], args.theorems, args.scenarios,
+                  measure_memory=not args.no_memory)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            }, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
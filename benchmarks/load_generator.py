@@ -0,0 +1,113 @@
+"""
+Load generator for server.py.
+
+Opens a number of keep-alive connections and sends /solve (or /solve/batch)
+requests as fast as the server answers them, then reports throughput and
+latency percentiles.
+
+    python server.py --port 8080 &
+    python benchmarks/load_generator.py --port 8080 --connections 64 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+def make_records(count, distinct, seed):
+    """Return records drawn from `distinct` fixed parameter sets."""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        theorem = rng.choice(["master", "extended", "subtractive"])
+        record = {"theorem": theorem, "a": rng.randint(1, 64), "b": rng.randint(2, 16),
+                  "k": rng.randint(0, 8) / 2}
+        if theorem == "extended":
+            record["i"] = rng.randint(-4, 4) / 2
+        pool.append(record)
+    return [rng.choice(pool) for _ in range(count)]
+
+
+async def request(reader, writer, host, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, path, bodies, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        i = 0
+        while time.perf_counter() < deadline:
+            body = bodies[i % len(bodies)]
+            i += 1
+            start = time.perf_counter()
+            status = await request(reader, writer, host, path, body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(args):
+    records = make_records(10000, args.distinct, args.seed)
+    if args.batch_size > 1:
+        path = "/solve/batch"
+        bodies = [json.dumps(records[i:i + args.batch_size]).encode()
+                  for i in range(0, len(records), args.batch_size)]
+    else:
+        path = "/solve"
+        bodies = [json.dumps(record).encode() for record in records]
+
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + args.duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(args.host, args.port, path, bodies[c::args.connections] or bodies,
+               deadline, latencies, errors)
+        for c in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    n = len(latencies)
+    pick = lambda q: latencies[min(n - 1, int(q * n))] * 1000  # noqa: E731
+    records_per_request = max(args.batch_size, 1)
+    print(f"{n} requests in {elapsed:.1f}s over {args.connections} connections ({len(errors)} errors)")
+    print(f"throughput: {n / elapsed:,.0f} requests/s, {n * records_per_request / elapsed:,.0f} records/s")
+    print(f"latency: p50 {pick(0.5):.2f} ms  p90 {pick(0.9):.2f} ms  "
+          f"p99 {pick(0.99):.2f} ms  p99.9 {pick(0.999):.2f} ms  max {latencies[-1] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run (default: 10)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Records per request; above 1 uses /solve/batch (default: 1)")
+    parser.add_argument("--distinct", type=int, default=1000,
+                        help="Distinct recurrences in the workload (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
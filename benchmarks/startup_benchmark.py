@@ -0,0 +1,101 @@
+"""
+Startup-time check for the CLI and batch entry points.
+
+Runs `python -X importtime main.py ...` several times and fails (exit code 1)
+if the best import time exceeds the budget or if any module of the web or
+optional numeric stack gets imported. The budget covers only what a probe
+adds to a bare `python -c pass`, so interpreter startup (site, encodings)
+and the speed of the host largely cancel out.
+
+    python benchmarks/startup_benchmark.py --budget-ms 30
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must never be imported by `main.py --help` or a plain `main.py solve`.
+FORBIDDEN = ("streamlit", "pandas", "pyarrow", "altair", "matplotlib", "sympy", "numpy", "scipy")
+
+BASELINE = ["-c", "pass"]
+
+PROBES = {
+    "help": ["main.py", "--help"],
+    "solve": ["main.py", "solve", "--quiet"],
+}
+
+
+def run_importtime(args):
+    """Run one probe and return (total import time in µs, imported modules)."""
+    # Bytecode must be written, or every run would include compiling the
+    # package and the best run would measure the compiler.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime"] + args,
+        cwd=ROOT, input="", capture_output=True, text=True, env=env,
+    )
+    total = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        # Top-level imports are indented by one space only; their cumulative
+        # times add up to the whole import cost.
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total, modules
+
+
+def best_of(args, runs):
+    """Return (fastest total import time in µs, modules of the last run)."""
+    best = None
+    modules = []
+    for _ in range(runs):
+        total, modules = run_importtime(args)
+        best = total if best is None else min(best, total)
+    return best, modules
+
+
+def check(name, args, runs, budget_ms, baseline, baseline_modules):
+    """Measure a probe against the bare interpreter; return a list of failure messages."""
+    best, modules = best_of(args, runs)
+    added = max(best - baseline, 0)
+
+    failures = []
+    forbidden = sorted({m for m in modules if m.split(".")[0] in FORBIDDEN})
+    if forbidden:
+        failures.append(f"{name}: imported {', '.join(forbidden)}")
+    if added / 1000 > budget_ms:
+        failures.append(f"{name}: {added / 1000:.1f} ms over bare startup exceeds budget of {budget_ms} ms")
+
+    print(f"{name:<8} {best / 1000:8.1f} ms  +{added / 1000:6.1f} ms  "
+          f"{len(modules) - len(baseline_modules)} modules")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=30.0,
+                        help="Maximum import time a probe may add to `python -c pass` (default: 30)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Runs per probe; the fastest one counts (default: 5)")
+    args = parser.parse_args()
+
+    baseline, baseline_modules = best_of(BASELINE, args.runs)
+    print(f"{'bare':<8} {baseline / 1000:8.1f} ms  (python -c pass, {len(baseline_modules)} modules)")
+    failures = []
+    for name, probe in PROBES.items():
+        failures += check(name, probe, args.runs, args.budget_ms, baseline, baseline_modules)
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 
 import sys
 import os
-from Theorems.master_theorem import print_master_theorem_result
-from Theorems.extended_master_theorem import print_extended_master_result
-from Theorems.subtractive_master_theorem import print_subtractive_master_result
+import argparse
+import time
+
+# Solver modules are imported inside the functions that use them so that
+# `main.py --help` and the bulk mode only load what they need.
 
 def clear_screen():
     """Clear the console screen."""
@@ -27,7 +29,8 @@ def print_menu():
     print("1. Master Theorem (T(n) = a * T(n/b) + Θ(n^k))")
     print("2. Extended Master Theorem (T(n) = a * T(n/b) + Θ(n^k * (log n)^i))")
     print("3. Subtractive Master Theorem (T(n) = a * T(n-b) + Θ(n^k))")
-    print("4. Exit")
+    print("4. Type a recurrence (e.g. T(n) = 7T(n/2) + n^2 log n)")
+    print("5. Exit")
     print("=" * 60)
 
 def get_float_input(prompt):
@@ -49,6 +52,8 @@ def get_int_input(prompt):
 
 def master_theorem_solver():
     """Handle the Master Theorem input and solution."""
+    from Theorems.master_theorem import print_master_theorem_result
+
     print("\n== Master Theorem Solver ==")
     print("For recurrences of form: T(n) = a * T(n/b) + Θ(n^k)")
     
@@ -69,6 +74,8 @@ def master_theorem_solver():
 
 def extended_master_theorem_solver():
     """Handle the Extended Master Theorem input and solution."""
+    from Theorems.extended_master_theorem import print_extended_master_result
+
     print("\n== Extended Master Theorem Solver ==")
     print("For recurrences of form: T(n) = a * T(n/b) + Θ(n^k * (log n)^i)")
     
@@ -90,6 +97,8 @@ def extended_master_theorem_solver():
 
 def subtractive_master_theorem_solver():
     """Handle the Subtractive Master Theorem input and solution."""
+    from Theorems.subtractive_master_theorem import print_subtractive_master_result
+
     print("\n== Subtractive Master Theorem Solver ==")
     print("For recurrences of form: T(n) = a * T(n-b) + Θ(n^k)")
     
@@ -108,7 +117,202 @@ def subtractive_master_theorem_solver():
     print("-" * 50)
     print_subtractive_master_result(a, b, k)
 
-def main():
+def expression_solver():
+    """Parse a typed recurrence and solve it with the cheapest applicable theorem."""
+    from Theorems.parser import ParseError, parse_recurrence
+    from Theorems.dispatch import RULES, solve
+
+    print("\n== Recurrence Expression Solver ==")
+    print("Examples: T(n) = 7T(n/2) + n^2 log n, T(n) = 2T(n-1) + 1, T(n) = T(n/3) + T(2n/3) + n")
+
+    while True:
+        try:
+            recurrence = parse_recurrence(input("Enter the recurrence: "))
+            break
+        except ParseError as e:
+            print(f"Error: {e}")
+
+    print("\nSolving...")
+    print("-" * 50)
+    result = solve(recurrence)
+    print(f"Rule: {RULES[result.theorem]}")
+    print(result.to_text())
+
+def open_inputs(paths):
+    """Yield lines from the given files, or from stdin when none are given."""
+    if not paths or paths == ['-']:
+        yield from sys.stdin
+        return
+    for path in paths:
+        with open(path, encoding='utf-8', newline='') as f:
+            yield from f
+
+def run_solve(args):
+    """Stream recurrences from files or stdin and write one result per line."""
+    from Theorems.bulk import READERS, WRITERS, solve_records
+
+    if args.workers != 1 or args.vectorized:
+        from Theorems.parallel import solve_parallel, solve_chunk, iter_chunks
+
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    start = time.perf_counter()
+    try:
+        records = READERS[args.input_format](open_inputs(args.files))
+        if args.workers != 1:
+            rows = solve_parallel(records, args.workers, args.chunk_size, args.vectorized,
+                                  args.exact)
+        elif args.vectorized and not args.exact:
+            rows = (row for chunk in iter_chunks(records, args.chunk_size)
+                    for row in solve_chunk(chunk, vectorized=True))
+        else:
+            rows = solve_records(records, args.exact)
+        count, errors = WRITERS[args.format](rows, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = count / elapsed if elapsed > 0 else float('inf')
+        print(f"Solved {count} records ({errors} errors) in {elapsed:.2f}s "
+              f"({rate:,.0f} records/s)", file=sys.stderr)
+    return 1 if errors else 0
+
+def run_catalog(args):
+    """Re-solve the new and changed entries of a catalog and report complexity changes."""
+    import json
+    from Theorems.bulk import READERS
+    from Theorems.catalog import connect, format_change, update_catalog
+
+    solver = None
+    if args.workers != 1 or args.vectorized:
+        from Theorems.parallel import solve_parallel
+
+        def solver(pairs, exact):
+            return list(solve_parallel(pairs, args.workers, args.chunk_size, args.vectorized, exact))
+
+    start = time.perf_counter()
+    db = connect(args.catalog)
+    try:
+        records = READERS[args.input_format](open_inputs(args.files))
+        summary, changes = update_catalog(db, records, args.exact, args.prune, solver)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for change in changes:
+            if args.diff_format == 'jsonl':
+                out.write(json.dumps(change._asdict(), ensure_ascii=False) + "\n")
+            else:
+                out.write(format_change(change) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        print(f"{summary.added} added, {summary.changed} re-solved, {summary.unchanged} unchanged, "
+              f"{summary.removed} {'removed' if args.prune else 'missing'}, {summary.errors} errors "
+              f"in {elapsed:.2f}s", file=sys.stderr)
+    moved = any(change.status == 'changed' for change in changes)
+    return 1 if summary.errors or (args.fail_on_change and moved) else 0
+
+def run_tree(args):
+    """Print the work done on each level of a recurrence's recursion tree."""
+    from Theorems.parser import ParseError, parse_recurrence
+    from Theorems.dispatch import solve
+    from Theorems.recursion_tree import format_level_table, level_table, tree_params
+
+    try:
+        recurrence = parse_recurrence(args.recurrence)
+        summary, levels = level_table(*tree_params(recurrence), n=args.n, max_rows=args.rows)
+        result = solve(recurrence)
+    except (ParseError, ValueError, ZeroDivisionError, OverflowError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print(f"{args.recurrence}  →  {result.complexity} (case {result.case})")
+    print(f"Recursion tree for n = {args.n:g}:")
+    print(format_level_table(summary, levels))
+    return 0
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Solve recurrence relations. Run without arguments for the interactive menu."
+    )
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-stage solver timings at exit (work in worker processes is not included)')
+    parser.add_argument('--profile-out', metavar='FILE',
+                        help='Also write the timings to FILE: a JSON trace for .json, '
+                             'Prometheus text otherwise')
+    parser.add_argument('--cache-db', metavar='FILE', default=os.environ.get('RECURRENCE_CACHE_DB'),
+                        help='Keep solved results in this SQLite file, shared across runs and '
+                             'processes (default: $RECURRENCE_CACHE_DB, off when unset)')
+    parser.add_argument('--cache-ttl', type=float, metavar='SECONDS',
+                        default=os.environ.get('RECURRENCE_CACHE_TTL'),
+                        help='Ignore and evict cached results older than this (default: $RECURRENCE_CACHE_TTL)')
+    subparsers = parser.add_subparsers(dest='command')
+
+    solve = subparsers.add_parser(
+        'solve', help='Solve recurrences read from files or stdin without prompting'
+    )
+    solve.add_argument('files', nargs='*', help='Input files (default: stdin)')
+    solve.add_argument('--input-format', choices=['jsonl', 'csv', 'text'], default='jsonl',
+                       help='Format of the input records; text is one recurrence such as '
+                            '"T(n) = 7T(n/2) + n^2" per line (default: jsonl)')
+    solve.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl',
+                       help='Format of the output records (default: jsonl)')
+    solve.add_argument('-o', '--output', help='Output file (default: stdout)')
+    solve.add_argument('-j', '--workers', type=int, default=1,
+                       help='Worker processes to solve with; 0 uses every core (default: 1)')
+    solve.add_argument('--chunk-size', type=int, default=10000,
+                       help='Records per chunk dispatched to a worker (default: 10000)')
+    solve.add_argument('--vectorized', action='store_true',
+                       help='Solve master/extended records with the NumPy batch solvers')
+    solve.add_argument('--exact', action='store_true',
+                       help='Decide log_b(a) = k with exact rational arithmetic')
+    solve.add_argument('-q', '--quiet', action='store_true',
+                       help='Do not report throughput on stderr')
+
+    catalog = subparsers.add_parser(
+        'catalog', help='Incrementally re-solve a recurrence catalog and diff the complexities'
+    )
+    catalog.add_argument('catalog', help='Catalog database file (created if missing)')
+    catalog.add_argument('files', nargs='*', help='Input files (default: stdin)')
+    catalog.add_argument('--input-format', choices=['jsonl', 'csv', 'text'], default='jsonl',
+                         help='Format of the input records (default: jsonl)')
+    catalog.add_argument('--diff-format', choices=['text', 'jsonl'], default='text',
+                         help='Format of the reported changes (default: text)')
+    catalog.add_argument('-o', '--output', help='Write the changes here (default: stdout)')
+    catalog.add_argument('--prune', action='store_true',
+                         help='Delete stored entries that are missing from the input')
+    catalog.add_argument('--fail-on-change', action='store_true',
+                         help='Exit with status 1 when any stored complexity changed')
+    catalog.add_argument('-j', '--workers', type=int, default=1,
+                         help='Worker processes to solve with; 0 uses every core (default: 1)')
+    catalog.add_argument('--chunk-size', type=int, default=10000,
+                         help='Records per chunk dispatched to a worker (default: 10000)')
+    catalog.add_argument('--vectorized', action='store_true',
+                         help='Solve master/extended records with the NumPy batch solvers')
+    catalog.add_argument('--exact', action='store_true',
+                         help='Decide log_b(a) = k with exact rational arithmetic')
+    catalog.add_argument('-q', '--quiet', action='store_true',
+                         help='Do not report the summary on stderr')
+
+    tree = subparsers.add_parser(
+        'tree', help='Show the work done on each level of the recursion tree'
+    )
+    tree.add_argument('recurrence', help='Recurrence such as "T(n) = 2T(n/2) + n"')
+    tree.add_argument('-n', type=float, default=1e6,
+                      help='Input size at the root of the tree (default: 1e6)')
+    tree.add_argument('--rows', type=int, default=40,
+                      help='Most levels to show; deeper trees are sampled evenly (default: 40)')
+
+    return parser.parse_args(argv)
+
+def interactive_main():
     """Main application loop."""
     while True:
         try:
@@ -116,7 +320,7 @@ def main():
             print_header()
             print_menu()
             
-            choice = input("Enter your choice (1-4): ")
+            choice = input("Enter your choice (1-5): ")
             
             if choice == '1':
                 master_theorem_solver()
@@ -125,6 +329,8 @@ def main():
             elif choice == '3':
                 subtractive_master_theorem_solver()
             elif choice == '4':
+                expression_solver()
+            elif choice == '5':
                 print("\nThank you for using the Recurrence Relation Solver!")
                 sys.exit(0)
             else:
@@ -135,5 +341,37 @@ def main():
         
         input("\nPress Enter to continue...")
 
+def report_profile(profiler, args):
+    """Print the profile breakdown and write it to --profile-out if given."""
+    print("\nSolver profile:", file=sys.stderr)
+    print(profiler.summary_table(), file=sys.stderr)
+    if args.profile_out:
+        profiler.write(args.profile_out)
+        print(f"Profile written to {args.profile_out}", file=sys.stderr)
+
+def main(argv=None):
+    """Run a subcommand, or the interactive menu when none is given."""
+    args = parse_args(argv)
+    if args.cache_db:
+        from Theorems.persistent_cache import enable_persistent_cache
+        enable_persistent_cache(args.cache_db, ttl=args.cache_ttl)
+    profiler = None
+    if args.profile or args.profile_out:
+        from Theorems.profiling import enable
+        profiler = enable(trace=bool(args.profile_out and args.profile_out.endswith('.json')))
+    try:
+        if args.command == 'solve':
+            sys.exit(run_solve(args))
+        if args.command == 'catalog':
+            sys.exit(run_catalog(args))
+        if args.command == 'tree':
+            sys.exit(run_tree(args))
+        interactive_main()
+    finally:
+        if profiler is not None:
+            from Theorems.profiling import disable
+            disable()
+            report_profile(profiler, args)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
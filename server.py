@@ -0,0 +1,275 @@
+"""
+Lightweight HTTP/JSON solving service.
+
+Endpoints:
+    POST /solve        one record, e.g. {"theorem": "master", "a": 2, "b": 2, "k": 1}
+    POST /solve/batch  a JSON list of records
+    GET  /stats        cache and batching counters
+    GET  /health
+
+Concurrent /solve requests arriving within a short window are coalesced into
+one vectorized solve. Connections are kept alive and solved rows are cached.
+
+    python server.py --port 8080
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from Theorems.bulk import RecordError, encode_json, parse_record
+from Theorems.cache import SolverCache
+from Theorems.parallel import solve_chunk
+
+MAX_BODY = 16 * 1024 * 1024
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """
+    Coalesce records submitted within window seconds into a single solve.
+
+    A batch is flushed when the window elapses or max_batch records are
+    waiting, whichever comes first. Solved rows go through an LRU cache, so
+    repeated records skip the solver entirely.
+    """
+
+    def __init__(self, window=0.002, max_batch=1024, cache_size=65536):
+        self.window = window
+        self.max_batch = max_batch
+        self.cache = SolverCache(maxsize=cache_size)
+        self.batches = 0
+        self.batched_records = 0
+        self._pending = []
+        self._flush_handle = None
+        # The event loop only keeps weak references to tasks.
+        self._tasks = set()
+
+    @staticmethod
+    def cache_key(record):
+        """Key a record by theorem and exactly spelled parameters."""
+        try:
+            theorem, params = parse_record(record)
+        except Exception:
+            # Not cached; solving the record reports the error in its row.
+            return None
+        return (theorem,) + tuple((type(p), p) for p in params)
+
+    async def solve_many(self, records):
+        """Solve records, using the cache, in one executor call; returns rows."""
+        keys = [self.cache_key(record) for record in records]
+        rows = [self.cache.get(key) if key is not None else None for key in keys]
+        missing = [pos for pos, row in enumerate(rows) if row is None]
+        if missing:
+            solved = await self._solve([records[pos] for pos in missing],
+                                       [keys[pos] for pos in missing])
+            for pos, row in zip(missing, solved):
+                rows[pos] = row
+        return rows
+
+    async def _solve(self, records, keys):
+        """Solve uncached records off the event loop and cache the results."""
+        chunk = list(enumerate(records, 1))
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(None, solve_chunk, chunk, True)
+        self.batches += 1
+        self.batched_records += len(chunk)
+        for key, row in zip(keys, rows):
+            row.pop("line", None)
+            if key is not None and "error" not in row:
+                self.cache.put(key, row)
+        return rows
+
+    def submit(self, record):
+        """Return a future for the record's row, queuing it for the next batch on a cache miss."""
+        future = asyncio.get_running_loop().create_future()
+        key = self.cache_key(record)
+        row = self.cache.get(key) if key is not None else None
+        if row is not None:
+            future.set_result(row)
+            return future
+
+        self._pending.append((record, key, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending):
+        try:
+            rows = await self._solve([record for record, _, _ in pending],
+                                     [key for _, key, _ in pending])
+        except Exception as e:
+            rows = [{"error": str(e)}] * len(pending)
+        for (_, _, future), row in zip(pending, rows):
+            if not future.done():
+                future.set_result(row)
+
+    def stats(self):
+        stats = {"batches": self.batches, "batched_records": self.batched_records}
+        stats["cache"] = self.cache.stats()
+        return stats
+
+
+async def read_request(reader):
+    """Read one HTTP/1.1 request; returns None when the client closed."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length")
+    if length < 0:
+        raise HTTPError(400, "invalid Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, version, headers, body
+
+
+def write_response(writer, status, payload, keep_alive):
+    body = encode_json(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+def _reject_constant(name):
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def parse_json(body):
+    try:
+        return json.loads(body, parse_constant=_reject_constant)
+    except ValueError as e:
+        raise HTTPError(400, f"invalid JSON: {e}")
+
+
+async def route(batcher, method, path, body):
+    """Dispatch a request to its endpoint; returns (status, payload)."""
+    if path == "/health":
+        return 200, {"status": "ok"}
+    if path == "/stats":
+        return 200, batcher.stats()
+    if path not in ("/solve", "/solve/batch"):
+        raise HTTPError(404, f"no endpoint {path}")
+    if method != "POST":
+        raise HTTPError(405, f"{path} only accepts POST")
+
+    payload = parse_json(body)
+    if path == "/solve":
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "expected a JSON object")
+        try:
+            parse_record(payload)
+        except RecordError as e:
+            raise HTTPError(400, str(e))
+        row = await batcher.submit(payload)
+        return (400 if "error" in row else 200), row
+
+    if not isinstance(payload, list):
+        raise HTTPError(400, "expected a JSON list of records")
+    return 200, await batcher.solve_many(payload)
+
+
+def make_handler(batcher):
+    async def handle(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as e:
+                    write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                except (asyncio.IncompleteReadError, ValueError):
+                    break
+                if request is None:
+                    break
+
+                method, path, version, headers, body = request
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                try:
+                    status, payload = await route(batcher, method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+async def serve(host, port, batcher):
+    server = await asyncio.start_server(make_handler(batcher), host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving on {addresses}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the recurrence solvers over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--window-ms", type=float, default=2.0,
+                        help="How long to wait for more /solve requests to batch (default: 2)")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="Flush a batch early once this many records wait (default: 1024)")
+    parser.add_argument("--cache-size", type=int, default=65536,
+                        help="Number of solved records to cache (default: 65536)")
+    args = parser.parse_args()
+
+    batcher = MicroBatcher(args.window_ms / 1000, args.max_batch, args.cache_size)
+    started = time.perf_counter()
+    try:
+        asyncio.run(serve(args.host, args.port, batcher))
+    except KeyboardInterrupt:
+        print(f"\nStopped after {time.perf_counter() - started:.0f}s: {batcher.stats()}")
+
+
+if __name__ == "__main__":
+    main()
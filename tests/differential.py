@@ -0,0 +1,728 @@
+"""
+Differential testing of the fast solver paths against the scalar references.
+
+Random and boundary parameters are pushed through every fast path (the
+result cache, the NumPy batch solvers, the parser, the dispatcher and
+vectorized bulk solving) and compared with the uncached
+scalar solvers. Exact case decisions may only differ from the float ones at
+the log_b(a) = k boundary, a sample of cases is checked against numerical
+evaluation of the recurrence, and Kitamasa evaluation is checked against
+plain iteration. Parameters the scalar solvers reject must be rejected by
+every fast path too. Failing cases are shrunk to a minimal form before they
+are reported.
+
+    python tests/differential.py --cases 100000 --seed 7
+    python -m pytest tests/test_differential.py
+"""
+import argparse
+from collections import namedtuple
+import math
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Parameter names per theorem, in solver argument order
+PARAMS = {
+    "master": ("a", "b", "k"),
+    "extended": ("a", "b", "k", "i"),
+    "subtractive": ("a", "b", "k"),
+    "akra_bazzi": ("a", "b", "k", "i"),
+    "linear": ("coefficients", "k"),
+}
+
+# Share of generated cases per theorem
+MIX = (("master", 0.35), ("extended", 0.3), ("subtractive", 0.15),
+       ("akra_bazzi", 0.1), ("linear", 0.1))
+
+# Share of cases placed on or next to a case boundary
+BOUNDARY_SHARE = 0.3
+
+# Share of cases with parameters the scalar solvers reject
+INVALID_SHARE = 0.05
+
+# Seed used when none is given, so that runs are reproducible
+DEFAULT_SEED = 0
+
+# Values that sit on or near case boundaries
+A_VALUES = (1, 2, 3, 4, 7, 8, 9, 16, 27, 64, 1.5, 1e6)
+B_VALUES = (2, 3, 4, 8, 16, 1.5, 10)
+K_VALUES = (0, 0.5, 1, 1.5, 2, 3, 8)
+I_VALUES = (-2, -1.5, -1, -0.5, 0, 0.5, 1, 2)
+NUDGES = (1e-15, 1e-12, 1e-9, 1e-6)
+
+# Numerical evaluation is only conclusive this far from the log_b(a) = k
+# boundary; closer cases need astronomically large n to show their growth.
+NUMERIC_GAP = 0.25
+NUMERIC_N_MAX = 1e300
+# Subtractive recurrences are evaluated step by step, so they stop earlier,
+# and T(n) = a T(n-b) + n^k with a within SUBTRACTIVE_GAP of 1 settles or
+# takes off too slowly to judge: a^(n/b) with a = 1.02 and b = 3 barely
+# reaches 10^28 by n = 10^4.
+SUBTRACTIVE_N_MAX = 1e4
+SUBTRACTIVE_GAP = 0.2
+
+REL_TOL = 1e-9
+ABS_TOL = 1e-12
+
+# check - name of the check that failed
+# theorem, params - the generated case
+# minimized - the smallest params found that still fail
+# detail - what differed
+Failure = namedtuple("Failure", ["check", "theorem", "params", "minimized", "detail"])
+
+# cases - generated cases; checked - (case, check) pairs run
+Report = namedtuple("Report", ["cases", "checked", "seconds", "failures"])
+
+
+def _boundary_k(rng, a, b):
+    """Return k = log_b(a), possibly nudged off the boundary."""
+    k = math.log(a, b)
+    if rng.random() < 0.5:
+        k *= 1 + rng.choice((-1, 1)) * rng.choice(NUDGES)
+    return k
+
+
+def _dividing_params(rng, boundary):
+    if boundary:
+        b = rng.choice(B_VALUES)
+        if rng.random() < 0.5:
+            k = rng.choice(K_VALUES)
+            a = b ** k
+            if rng.random() < 0.5:
+                a *= 1 + rng.choice((-1, 1)) * rng.choice(NUDGES)
+            return max(a, 1), b, k
+        a = rng.choice(A_VALUES)
+        return a, b, max(_boundary_k(rng, a, b), 0)
+    a = rng.randint(1, 64) if rng.random() < 0.6 else round(rng.uniform(1, 100), 3)
+    b = rng.randint(2, 16) if rng.random() < 0.6 else round(rng.uniform(1.1, 10), 2)
+    k = rng.randint(0, 16) / 2 if rng.random() < 0.6 else round(rng.uniform(0, 6), 3)
+    return a, b, k
+
+
+def _i(rng, boundary):
+    return rng.choice(I_VALUES) if boundary else rng.randint(-8, 8) / 2
+
+
+def _invalid_case(rng, theorem):
+    """Return a case with parameters the scalar solver of theorem rejects."""
+    if theorem in ("master", "extended"):
+        a, b, k = _dividing_params(rng, False)
+        if rng.random() < 0.5:
+            b = rng.choice((1, 1.0, 0, -2))
+        else:
+            a = rng.choice((0, -1, -3.5))
+        return theorem, (a, b, k) + ((_i(rng, False),) if theorem == "extended" else ())
+    if theorem == "subtractive":
+        return theorem, (round(rng.uniform(0.1, 4), 2), rng.choice((0, 0.0, -1)), rng.randint(0, 6) / 2)
+    if theorem == "akra_bazzi":
+        _, (a, b, k, i) = generate_case(rng, theorem, invalid=False)
+        j = rng.randrange(len(a))
+        if rng.random() < 0.5:
+            b = b[:j] + (rng.choice((1, 0.5, 0, -2)),) + b[j + 1:]
+        else:
+            a = a[:j] + (rng.choice((-1, -0.5)),) + a[j + 1:]
+        return theorem, (a, b, k, i)
+    return theorem, ((0,) * rng.randint(1, 3), rng.randint(0, 3))
+
+
+def generate_case(rng, theorem=None, invalid=None):
+    """
+    Return one random (theorem, params) case. invalid=True gives parameters
+    the scalar solver rejects; by default a share INVALID_SHARE of cases does.
+    """
+    if theorem is None:
+        theorem = rng.choices([name for name, _ in MIX], [share for _, share in MIX])[0]
+    if invalid is None:
+        invalid = rng.random() < INVALID_SHARE
+    if invalid:
+        return _invalid_case(rng, theorem)
+    boundary = rng.random() < BOUNDARY_SHARE
+    if theorem == "master":
+        return theorem, _dividing_params(rng, boundary)
+    if theorem == "extended":
+        return theorem, _dividing_params(rng, boundary) + (_i(rng, boundary),)
+    if theorem == "subtractive":
+        if boundary:
+            return theorem, (rng.choice((0.5, 1, 2, 3)), rng.choice((1, 2, 0.5)), rng.choice(K_VALUES))
+        return theorem, (round(rng.uniform(0.1, 4), 2), rng.randint(1, 4), rng.randint(0, 6) / 2)
+    if theorem == "akra_bazzi":
+        terms = rng.randint(1, 3)
+        a = tuple(round(rng.uniform(0.1, 4), 2) for _ in range(terms))
+        b = tuple(rng.choice(B_VALUES) if boundary else round(rng.uniform(1.1, 8), 2) for _ in range(terms))
+        k = rng.choice(K_VALUES) if boundary else rng.randint(0, 8) / 2
+        return theorem, (a, b, k, _i(rng, boundary))
+    if theorem == "linear":
+        values = (0, 1, 1, 1, -1, 2, -2, 3, 0.5) if boundary else (0, 1, 2, -1, 0.5, 0.3, 0.7, 3, -3, 4)
+        coefficients = [rng.choice(values) for _ in range(rng.randint(1, 4))]
+        if not any(coefficients):
+            coefficients[0] = 1
+        return theorem, (tuple(coefficients), rng.randint(0, 3))
+    raise ValueError(f"unknown theorem {theorem!r}")
+
+
+def generate_cases(count, seed=DEFAULT_SEED):
+    """Return count random (theorem, params) cases for the given seed."""
+    rng = random.Random(seed)
+    return [generate_case(rng) for _ in range(count)]
+
+
+def reference(theorem, params):
+    """Solve a case with the uncached scalar solver; raises for invalid parameters."""
+    if theorem == "master":
+        from Theorems.master_theorem import master_theorem_result
+
+        return master_theorem_result.uncached(*params)
+    if theorem == "extended":
+        from Theorems.extended_master_theorem import extended_master_theorem_result
+
+        return extended_master_theorem_result.uncached(*params)
+    if theorem == "subtractive":
+        from Theorems.subtractive_master_theorem import subtractive_master_theorem_result
+
+        return subtractive_master_theorem_result.uncached(*params)
+    if theorem == "akra_bazzi":
+        from Theorems.extended_master_theorem_akra_bazzi import akra_bazzi_result
+
+        return akra_bazzi_result(*params)
+    from Theorems.linear_recurrence import linear_recurrence_result
+
+    return linear_recurrence_result(*params)
+
+
+# Exceptions the scalar solvers raise for invalid parameters
+SOLVER_ERRORS = (ValueError, TypeError, ZeroDivisionError, OverflowError)
+
+
+def is_valid(theorem, params):
+    """True if the scalar solver accepts the parameters of a case."""
+    try:
+        reference(theorem, params)
+    except SOLVER_ERRORS:
+        return False
+    return True
+
+
+def _close(x, y):
+    if x is None or y is None:
+        return x is y
+    if isinstance(x, bool) or isinstance(y, bool):
+        return bool(x) == bool(y)
+    if math.isnan(x) or math.isnan(y):
+        return math.isnan(x) and math.isnan(y)
+    return math.isclose(x, y, rel_tol=REL_TOL, abs_tol=ABS_TOL)
+
+
+def compare(expected, actual, strings=True):
+    """Describe how two results differ, or return None when they agree."""
+    if int(actual.case) != expected.case:
+        return f"case {int(actual.case)} != {expected.case}"
+    for field in ("log_b_a", "poly_exponent", "log_exponent", "loglog", "exp_base"):
+        x, y = getattr(expected, field), getattr(actual, field)
+        if not _close(None if x is None else float(x), None if y is None else float(y)):
+            return f"{field} {y!r} != {x!r}"
+    if strings:
+        for field in ("complexity", "comparison"):
+            x, y = getattr(expected, field), getattr(actual, field)
+            if x != y:
+                return f"{field} {y!r} != {x!r}"
+    return None
+
+
+def _row(result, index):
+    """View row index of a BatchResult like a RecurrenceResult."""
+    row = SimpleNamespace(exp_base=1.0)
+    for field in result._fields:
+        if getattr(result, field) is not None:
+            setattr(row, field, getattr(result, field)[index].item())
+    return row
+
+
+# Checks take a list of (theorem, params) cases of their theorems and
+# return [(position, detail)] for the cases that fail.
+
+def check_cache(cases):
+    """Cached solver results (first call and cache hit) match the references."""
+    from Theorems import bulk
+
+    failures = []
+    for pos, (theorem, params) in enumerate(cases):
+        expected = reference(theorem, params)
+        solver = bulk.SOLVERS[theorem][0]
+        for attempt in ("miss", "hit"):
+            detail = compare(expected, solver(*params))
+            if detail:
+                failures.append((pos, f"{attempt}: {detail}"))
+                break
+    return failures
+
+
+def _batch(theorem, params):
+    """Solve a list of parameter tuples of one theorem with its batch solver."""
+    import numpy as np
+    from Theorems import batch
+
+    if theorem in ("master", "extended", "subtractive"):
+        solver = getattr(batch, "master_theorem_batch" if theorem == "master"
+                         else f"{theorem}_master_theorem_batch")
+        return solver(*(np.array(column, dtype=np.float64) for column in zip(*params)))
+    if theorem == "akra_bazzi":
+        width = max(len(a) for a, _, _, _ in params)
+        a = np.array([list(a) + [0] * (width - len(a)) for a, _, _, _ in params])
+        b = np.array([list(b) + [2] * (width - len(b)) for _, b, _, _ in params])
+        return batch.akra_bazzi_batch(a, b, [p[2] for p in params], [p[3] for p in params])
+    width = max(len(c) for c, _ in params)
+    coefficients = np.array([list(c) + [0] * (width - len(c)) for c, _ in params], dtype=np.float64)
+    return batch.linear_recurrence_batch(coefficients, [k for _, k in params])
+
+
+def _groups(cases):
+    """Return {theorem: positions of its cases}."""
+    groups = {}
+    for pos, (theorem, _) in enumerate(cases):
+        groups.setdefault(theorem, []).append(pos)
+    return groups
+
+
+def check_batch(cases):
+    """Vectorized batch solvers match the scalar references row by row."""
+    failures = []
+    for theorem, positions in _groups(cases).items():
+        result = _batch(theorem, [cases[pos][1] for pos in positions])
+        for row, pos in enumerate(positions):
+            expected = reference(*cases[pos])
+            actual = _row(result, row)
+            if theorem == "subtractive":
+                # The batch reports NaN where the scalar solver has no log_b(a).
+                actual.log_b_a = None
+            if theorem != "linear" and actual.exp_base == 1:
+                actual.exp_base = expected.exp_base
+            detail = compare(expected, actual, strings=False)
+            if detail:
+                failures.append((pos, detail))
+    return failures
+
+
+def check_exact(cases):
+    """Exact case decisions differ from the float ones only at the boundary."""
+    from Theorems import exact
+
+    failures = []
+    for pos, (theorem, params) in enumerate(cases):
+        expected = reference(theorem, params)
+        solver = exact.exact_master_theorem_result if theorem == "master" else \
+            exact.exact_extended_master_theorem_result
+        actual = solver.uncached(*params)
+        if actual.case == expected.case:
+            continue
+        k = params[2]
+        gap = abs(expected.log_b_a - k)
+        if gap > REL_TOL * max(1.0, abs(expected.log_b_a), abs(k)):
+            failures.append((pos, f"exact case {actual.case} != {expected.case} with log_b(a) - k = {gap:.3g}"))
+    return failures
+
+
+def _decimal(x):
+    """Spell a number the way the parser reads it (no exponent notation)."""
+    text = repr(x)
+    if "e" in text:
+        text = f"{x:.20f}".rstrip("0").rstrip(".")
+    return text
+
+
+def expression(theorem, params):
+    """Render a case as a recurrence string."""
+    if theorem == "linear":
+        coefficients, k = params
+        terms = ""
+        for j, c in enumerate(coefficients, 1):
+            if c:
+                sign = ("-" if c < 0 else "") if not terms else (" - " if c < 0 else " + ")
+                terms += f"{sign}{_decimal(abs(c))}T(n-{j})"
+        return f"T(n) = {terms} + n^{_decimal(k)}"
+    if theorem == "akra_bazzi":
+        a, b, k, i = params
+        terms = " + ".join(f"{_decimal(x)}T(n/{_decimal(y)})" for x, y in zip(a, b))
+        text = f"T(n) = {terms} + n^{_decimal(k)}"
+        return text + f" (log n)^{_decimal(i)}" if i else text
+    a, b, k = params[:3]
+    op = "-" if theorem == "subtractive" else "/"
+    text = f"T(n) = {_decimal(a)}T(n{op}{_decimal(b)}) + n^{_decimal(k)}"
+    if theorem == "extended" and params[3]:
+        text += f" (log n)^{_decimal(params[3])}"
+    return text
+
+
+def check_parser(cases):
+    """Rendering a case as text and parsing it back gives the same result."""
+    from Theorems.parser import parse_recurrence
+
+    failures = []
+    for pos, (theorem, params) in enumerate(cases):
+        if theorem == "akra_bazzi" and len(set(params[1])) < max(2, len(params[1])):
+            # Terms with equal b_j are merged, down to a single T(n/b) term.
+            continue
+        text = expression(theorem, params)
+        recurrence = parse_recurrence(text)
+        if theorem == "extended" and not params[3]:
+            theorem, params = "master", params[:3]
+        if theorem == "linear":
+            coefficients, k = params
+            while coefficients[-1] == 0:
+                coefficients = coefficients[:-1]
+            shifts = [j for j, c in enumerate(coefficients, 1) if c]
+            if len(shifts) == 1 and coefficients[shifts[0] - 1] > 0:
+                # A single T(n-j) term is a subtractive recurrence.
+                theorem, params = "subtractive", (coefficients[shifts[0] - 1], shifts[0], k)
+            else:
+                params = (coefficients, k)
+        parsed = (recurrence.a, recurrence.k) if recurrence.theorem == "linear" else \
+            tuple(recurrence[1:1 + len(params)])
+        if recurrence.theorem != theorem or parsed != tuple(params):
+            failures.append((pos, f"{text!r} parsed as {recurrence}"))
+            continue
+        # The parser spells integral numbers as ints, so the references are
+        # rendered with the parsed values.
+        detail = compare(reference(theorem, parsed), recurrence.solve())
+        if detail:
+            failures.append((pos, f"{text!r}: {detail}"))
+    return failures
+
+
+def _dispatch_reference(theorem, params):
+    """Return the (theorem, params) the dispatcher is expected to pick."""
+    if theorem == "extended" and not params[3]:
+        return "master", params[:3]
+    if theorem == "akra_bazzi" and len(params[0]) == 1 and params[0][0] >= 1:
+        a, b, k, i = params
+        return ("extended", (a[0], b[0], k, i)) if i else ("master", (a[0], b[0], k))
+    return theorem, params
+
+
+def check_dispatch(cases):
+    """solve() and solve_batch() pick the expected rule and agree with it."""
+    import numpy as np
+    from Theorems.dispatch import RULE_NAMES, solve, solve_batch
+    from Theorems.linear_recurrence import linear_recurrence_result
+
+    failures = []
+    single = []
+    for pos, (theorem, params) in enumerate(cases):
+        if theorem == "linear":
+            coefficients, k = params
+            shifts = [j for j, c in enumerate(coefficients, 1) if c]
+            if len(shifts) > 1:
+                actual = solve([coefficients[j - 1] for j in shifts], shifts, k, subtractive=True)
+                expected = linear_recurrence_result(coefficients, k)
+                detail = compare(expected, actual)
+                if detail:
+                    failures.append((pos, detail))
+            continue
+        if theorem == "subtractive":
+            actual = solve(*params, subtractive=True)
+        else:
+            actual = solve(*params)
+        expected_theorem, expected_params = _dispatch_reference(theorem, params)
+        if actual.theorem != expected_theorem:
+            failures.append((pos, f"rule {actual.theorem!r} != {expected_theorem!r}"))
+            continue
+        detail = compare(reference(expected_theorem, expected_params), actual)
+        if detail:
+            failures.append((pos, detail))
+        elif theorem != "akra_bazzi":
+            single.append((pos, theorem, params, actual))
+
+    if single:
+        a, b, k, i, subtractive = zip(*(
+            params[:3] + ((params[3] if theorem == "extended" else 0), theorem == "subtractive")
+            for _, theorem, params, _ in single
+        ))
+        rule, result = solve_batch(np.array(a), np.array(b), np.array(k), np.array(i), np.array(subtractive))
+        for row, (pos, _, _, expected) in enumerate(single):
+            actual = _row(result, row)
+            if RULE_NAMES[rule[row]] != expected.theorem:
+                failures.append((pos, f"solve_batch rule {RULE_NAMES[rule[row]]!r} != {expected.theorem!r}"))
+                continue
+            if expected.theorem == "subtractive":
+                actual.log_b_a = None
+            detail = compare(expected, actual, strings=False)
+            if detail:
+                failures.append((pos, f"solve_batch: {detail}"))
+    return failures
+
+
+def check_bulk(cases):
+    """Vectorized chunk solving produces the same rows as the scalar path."""
+    from Theorems.parallel import solve_chunk
+
+    chunk = [(pos + 1, dict(zip(PARAMS[theorem], params), theorem=theorem))
+             for pos, (theorem, params) in enumerate(cases)]
+    failures = []
+    for pos, (fast, slow) in enumerate(zip(solve_chunk(chunk, vectorized=True), solve_chunk(chunk))):
+        for field in sorted(set(fast) | set(slow)):
+            x, y = slow.get(field), fast.get(field)
+            if isinstance(x, float) and isinstance(y, (int, float)) and not isinstance(y, bool):
+                same = _close(x, float(y))
+            else:
+                same = x == y
+            if not same:
+                failures.append((pos, f"row field {field} {y!r} != {x!r}"))
+                break
+    return failures
+
+
+def check_numeric(cases):
+    """Bounds agree with numerically evaluated recurrences where that is conclusive."""
+    from Theorems.evaluator import verify
+
+    failures = []
+    for pos, (theorem, params) in enumerate(cases):
+        result = reference(theorem, params)
+        if theorem == "subtractive":
+            if 0 < abs(params[0] - 1) < SUBTRACTIVE_GAP:
+                continue
+            verification = verify(result, n_max=SUBTRACTIVE_N_MAX)
+        else:
+            gap = abs(result.log_b_a - params[2])
+            if result.case != 2 and gap < NUMERIC_GAP:
+                continue
+            verification = verify(result, n_max=NUMERIC_N_MAX)
+        if verification.verdict != "tight":
+            failures.append((pos, f"{verification.verdict}, drift {verification.drift:.2f}"))
+    return failures
+
+
+def check_kitamasa(cases):
+    """Kitamasa evaluation of linear recurrences matches plain iteration."""
+    from fractions import Fraction
+    from Theorems.linear_recurrence import linear_recurrence_value
+
+    failures = []
+    for pos, (_, (coefficients, k)) in enumerate(cases):
+        rng = random.Random(repr((coefficients, k)))
+        initial = [rng.randint(-5, 5) for _ in coefficients]
+        forcing = [rng.randint(-3, 3) for _ in range(k + 1)]
+        n = rng.randint(0, 60)
+        exact = [c if isinstance(c, int) else Fraction(str(c)) for c in coefficients]
+        values = list(initial)
+        for t in range(len(values), n + 1):
+            values.append(sum(c * values[t - j] for j, c in enumerate(exact, 1))
+                          + sum(f * t ** e for e, f in enumerate(forcing)))
+        actual = linear_recurrence_value(coefficients, initial, n, forcing)
+        if actual != values[n]:
+            failures.append((pos, f"T({n}) = {actual} != {values[n]} with T(0..) = {initial}, f = {forcing}"))
+            continue
+        if all(isinstance(c, int) for c in coefficients):
+            modulus = rng.choice((97, 10 ** 9 + 7))
+            actual = linear_recurrence_value(coefficients, initial, n, forcing, modulus)
+            if actual != values[n] % modulus:
+                failures.append((pos, f"T({n}) mod {modulus} = {actual} != {values[n] % modulus}"))
+    return failures
+
+
+def check_invalid(cases):
+    """Parameters the scalar solvers reject give errors or case 0 on every fast path."""
+    from Theorems import bulk
+    from Theorems.dispatch import solve, solve_batch
+    from Theorems.parallel import solve_chunk
+
+    failures = []
+    for pos, (theorem, params) in enumerate(cases):
+        try:
+            result = bulk.SOLVERS[theorem][0](*params)
+        except SOLVER_ERRORS:
+            pass
+        else:
+            failures.append((pos, f"cached solver returned {result.complexity}"))
+    for theorem, positions in _groups(cases).items():
+        case = _batch(theorem, [cases[pos][1] for pos in positions]).case
+        failures.extend((pos, f"batch case {case[row]} != 0")
+                        for row, pos in enumerate(positions) if case[row])
+
+    names = {theorem: names for theorem, (_, names) in bulk.SOLVERS.items()}
+    chunk = [(pos, dict(zip(names[theorem], params), theorem=theorem))
+             for pos, (theorem, params) in enumerate(cases)]
+    for vectorized in (True, False):
+        for row in solve_chunk(chunk, vectorized=vectorized):
+            if "error" not in row:
+                failures.append((row["line"], f"bulk row {row['complexity']} (vectorized={vectorized})"))
+
+    single = [(pos, params[:3] + ((params[3] if theorem == "extended" else 0), theorem == "subtractive"))
+              for pos, (theorem, params) in enumerate(cases)
+              if theorem in ("master", "extended", "subtractive")]
+    for pos, row in single:
+        try:
+            result = solve(*row)
+        except SOLVER_ERRORS:
+            pass
+        else:
+            failures.append((pos, f"solve returned {result.complexity}"))
+    if single:
+        _, result = solve_batch(*zip(*(row for _, row in single)))
+        failures.extend((pos, f"solve_batch case {result.case[row]} != 0")
+                        for row, (pos, _) in enumerate(single) if result.case[row])
+    return failures
+
+
+# Check name -> (function, theorems it applies to, run on every Nth case only)
+CHECKS = {
+    "cache": (check_cache, ("master", "extended", "subtractive"), 1),
+    "batch": (check_batch, ("master", "extended", "subtractive", "akra_bazzi", "linear"), 1),
+    "exact": (check_exact, ("master", "extended"), 1),
+    "parser": (check_parser, ("master", "extended", "subtractive", "akra_bazzi", "linear"), 1),
+    "dispatch": (check_dispatch, ("master", "extended", "subtractive", "akra_bazzi", "linear"), 1),
+    "bulk": (check_bulk, ("master", "extended", "subtractive"), 1),
+    "numeric": (check_numeric, ("master", "extended", "subtractive"), 10),
+    "kitamasa": (check_kitamasa, ("linear",), 1),
+    "invalid": (check_invalid, ("master", "extended", "subtractive", "akra_bazzi", "linear"), 1),
+}
+
+
+def run_check(check, cases):
+    """Run a check, isolating cases that make it raise."""
+    try:
+        return check(cases)
+    except Exception:
+        if len(cases) == 1:
+            error = sys.exc_info()[1]
+            return [(0, f"raised {type(error).__name__}: {error}")]
+    failures = []
+    for pos, case in enumerate(cases):
+        failures.extend((pos, detail) for _, detail in run_check(check, [case]))
+    return failures
+
+
+def _size(params):
+    """How complicated a parameter tuple looks; minimizing lowers it."""
+    if isinstance(params, (list, tuple)):
+        return sum(_size(x) for x in params) + len(params)
+    return len(repr(params))
+
+
+def _simpler_numbers(x):
+    candidates = [0, 1, 2, round(x)] + [round(x, digits) for digits in (1, 2, 3, 6)]
+    if x != int(x):
+        candidates += [math.floor(x), math.ceil(x)]
+    return [c for c in candidates if c != x or type(c) is not type(x)]
+
+
+def _candidates(theorem, params):
+    """Yield parameter tuples one simplification away from params."""
+    terms = params[0]
+    if theorem in ("akra_bazzi", "linear") and len(terms) > 1:
+        # Drop a term (from both a and b for Akra–Bazzi).
+        for j in range(len(terms)):
+            dropped = tuple(x[:j] + x[j + 1:] for x in params[:2 if theorem == "akra_bazzi" else 1])
+            yield dropped + params[len(dropped):]
+    for index, value in enumerate(params):
+        if isinstance(value, tuple):
+            for j, x in enumerate(value):
+                for simpler in _simpler_numbers(x):
+                    yield params[:index] + (value[:j] + (simpler,) + value[j + 1:],) + params[index + 1:]
+        else:
+            for simpler in _simpler_numbers(value):
+                yield params[:index] + (simpler,) + params[index + 1:]
+
+
+def _fails(check, theorem, params, kind):
+    """True if the check fails on params with a detail starting like kind."""
+    if is_valid(theorem, params) != (check is not check_invalid):
+        # A valid case is not a smaller version of an invalid one, or vice versa.
+        return False
+    return any(detail.split()[0] == kind for _, detail in run_check(check, [(theorem, params)]))
+
+
+def minimize(check, theorem, params, detail, budget=500):
+    """Shrink params while the check keeps failing on them the same way."""
+    kind = detail.split()[0]
+    tries = 0
+    improved = True
+    while improved and tries < budget:
+        improved = False
+        for candidate in _candidates(theorem, params):
+            tries += 1
+            if _size(candidate) < _size(params) and _fails(check, theorem, candidate, kind):
+                params = candidate
+                improved = True
+                break
+            if tries >= budget:
+                break
+    return params
+
+
+def run(cases=10000, seed=DEFAULT_SEED, checks=None, max_failures=20, minimize_failures=True):
+    """
+    Generate cases and run the selected checks on them (all by default).
+
+    Returns a Report. At most max_failures failures are minimized and
+    reported per check.
+    """
+    generated = cases if isinstance(cases, list) else generate_cases(cases, seed)
+    start = time.perf_counter()
+    valid = [is_valid(*case) for case in generated]
+    checked = 0
+    failures = []
+    for name in checks or CHECKS:
+        check, theorems, every = CHECKS[name]
+        # Only the invalid check sees cases the scalar solvers reject.
+        wanted = check is not check_invalid
+        selected = [case for n, case in enumerate(generated)
+                    if case[0] in theorems and n % every == 0 and valid[n] == wanted]
+        checked += len(selected)
+        found = run_check(check, selected)[:max_failures]
+        for pos, detail in found:
+            theorem, params = selected[pos]
+            smallest = minimize(check, theorem, params, detail) if minimize_failures else params
+            if smallest != params:
+                detail = run_check(check, [(theorem, smallest)])[0][1]
+            failures.append(Failure(name, theorem, params, smallest, detail))
+    return Report(len(generated), checked, time.perf_counter() - start, failures)
+
+
+def format_case(theorem, params):
+    """Render a case as theorem(name=value, ...)."""
+    return f"{theorem}(" + ", ".join(f"{name}={value!r}" for name, value in zip(PARAMS[theorem], params)) + ")"
+
+
+def format_failure(failure):
+    """Render a Failure as one or two lines of text."""
+    text = f"[{failure.check}] {format_case(failure.theorem, failure.minimized)}: {failure.detail}"
+    if failure.minimized != failure.params:
+        text += f"\n    minimized from {format_case(failure.theorem, failure.params)}"
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Differentially test the fast solver paths against the scalar references."
+    )
+    parser.add_argument("--cases", type=float, default=20000, help="Number of random cases (default: 20000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help=f"Random seed (default: {DEFAULT_SEED})")
+    parser.add_argument("--checks", default=",".join(CHECKS),
+                        help=f"Comma-separated checks to run (default: all of {', '.join(CHECKS)})")
+    parser.add_argument("--max-failures", type=int, default=5,
+                        help="Failures to minimize and report per check (default: 5)")
+    parser.add_argument("--no-minimize", action="store_true", help="Report failing cases as generated")
+    args = parser.parse_args(argv)
+
+    checks = [name.strip() for name in args.checks.split(",") if name.strip()]
+    unknown = [name for name in checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)}")
+    seed = args.seed
+    report = run(int(args.cases), seed, checks, args.max_failures, not args.no_minimize)
+    for failure in report.failures:
+        print(format_failure(failure))
+    rate = report.checked / report.seconds if report.seconds > 0 else float("inf")
+    print(f"{report.cases:,} cases, {report.checked:,} checks in {report.seconds:.2f}s "
+          f"({rate:,.0f} checks/s), seed {seed}: {len(report.failures)} failure(s)")
+    return 1 if report.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from Theorems import extended_master_theorem_akra_bazzi as akra
+from Theorems.extended_master_theorem_akra_bazzi import akra_bazzi_result, critical_exponent
+
+
+@pytest.mark.parametrize("a, b", [
+    (1e-300, 1.0000001), (1e300, 1.0000001), (1e300, 1 + 2 ** -52), (0.5, 2), (8, 2),
+])
+def test_far_off_roots_do_not_overflow(a, b):
+    assert critical_exponent([a], [b]) == pytest.approx(math.log(a) / math.log(b), rel=1e-12)
+
+
+def test_several_terms():
+    # 0.5 x + 0.25 x^2 = 1 with x = 2^-p
+    x = (-0.5 + math.sqrt(1.25)) / 0.5
+    assert critical_exponent([0.5, 0.25], [2, 4]) == pytest.approx(-math.log2(x))
+    assert akra_bazzi_result([1e-300], [1.0000001], 0).case == 3
+
+
+def test_bracket_search_is_capped(monkeypatch):
+    monkeypatch.setattr(akra, "MAX_DOUBLINGS", 4)
+    akra._critical_exponent.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="out of floating-point range"):
+            critical_exponent([1e-300], [1.0000001])
+    finally:
+        akra._critical_exponent.cache_clear()
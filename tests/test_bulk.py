@@ -0,0 +1,35 @@
+import io
+import json
+
+import pytest
+
+from Theorems.bulk import read_csv, read_jsonl, solve_records, write_jsonl
+
+
+def _rows(records):
+    out = io.StringIO()
+    write_jsonl(solve_records(records), out)
+    return [json.loads(line, parse_constant=pytest.fail) for line in out.getvalue().splitlines()]
+
+
+@pytest.mark.parametrize("line", [
+    '{"a": "nan", "b": 2, "k": 1}',
+    '{"a": 2, "b": "inf", "k": 1}',
+    '{"a": 2, "b": 2, "k": NaN}',
+    '{"a": 2, "b": 2, "k": -Infinity}',
+    '{"theorem": "akra_bazzi", "a": [1, 1], "b": [2, "nan"], "k": 1, "i": 0}',
+])
+def test_non_finite_parameters_are_record_errors(line):
+    [row] = _rows(read_jsonl([line]))
+    assert "must be finite" in row["error"]
+
+
+def test_non_finite_csv_fields_are_record_errors():
+    rows = _rows(read_csv(["a,b,k", "2,2,1", "2,2,nan", " inf ,2,1"]))
+    assert rows[0]["complexity"] == "O(n^1 log n)"
+    assert ["error" in row for row in rows] == [False, True, True]
+
+
+def test_integers_stay_integral():
+    [row] = _rows(read_jsonl(['{"a": " 8 ", "b": 2, "k": 3.5}']))
+    assert (row["a"], row["k"]) == (8, 3.5)
@@ -0,0 +1,30 @@
+from Theorems.catalog import connect, update_catalog
+
+
+def test_duplicate_ids_are_counted_once(tmp_path):
+    db = connect(str(tmp_path / "catalog.db"))
+    records = [
+        (1, {"id": "x", "theorem": "master", "a": 2, "b": 2, "k": 1}),
+        (2, {"id": "x", "theorem": "master", "a": 4, "b": 2, "k": 1}),
+        (3, {"id": "y", "theorem": "master", "a": 8, "b": 2, "k": 1}),
+    ]
+    summary, changes = update_catalog(db, records)
+    assert (summary.added, summary.changed, summary.errors) == (2, 0, 1)
+    assert [(c.id, c.status) for c in changes] == [("x", "error"), ("x", "added"), ("y", "added")]
+
+    summary, _ = update_catalog(db, records)
+    assert (summary.added, summary.unchanged, summary.errors) == (0, 2, 1)
+    db.close()
+
+
+def test_bad_records_do_not_stop_the_update(tmp_path):
+    db = connect(str(tmp_path / "catalog.db"))
+    records = [
+        (1, {"id": "bad", "theorem": "master", "a": "zz", "b": 2, "k": 1}),
+        (2, {"id": "text", "expression": "T(n) = T(n/2) +"}),
+        (3, {"id": "ok", "theorem": "master", "a": 2, "b": 2, "k": 1}),
+    ]
+    summary, changes = update_catalog(db, records)
+    assert (summary.added, summary.errors) == (1, 2)
+    assert [c.status for c in changes] == ["error", "error", "added"]
+    db.close()
@@ -0,0 +1,15 @@
+from differential import DEFAULT_SEED, format_failure, generate_cases, is_valid, run
+
+# Cases per run; the CLI default of 20000 takes several seconds.
+CASES = 5000
+
+
+def test_fast_paths_match_the_scalar_solvers():
+    report = run(CASES, DEFAULT_SEED)
+    assert not report.failures, "\n".join(map(format_failure, report.failures))
+
+
+def test_cases_include_invalid_parameters():
+    cases = generate_cases(1000)
+    assert cases == generate_cases(1000, DEFAULT_SEED)
+    assert any(not is_valid(*case) for case in cases)
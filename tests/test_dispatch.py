@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Theorems.dispatch import RULE_NAMES, solve, solve_batch
+
+
+def test_solve_batch_invalid_rows_get_case_0():
+    # 0 < a < 1 routes to Akra–Bazzi, whose root finder never brackets a
+    # root when b <= 1; such rows must not reach it.
+    a = [2, 0.5, 0.5, 0.5, 0, -1, 2, 2]
+    b = [2, 0.5, 1, -3, 2, 2, math.nan, 1]
+    rule, result = solve_batch(a, b, 1)
+    assert result.case.tolist() == [2, 0, 0, 0, 0, 0, 0, 0]
+    assert np.isnan(result.poly_exponent[1:]).all()
+    assert RULE_NAMES[rule[1]] == "akra_bazzi"
+
+
+def test_solve_batch_subtractive_log_factor_gets_case_0():
+    rule, result = solve_batch([2, 2], [1, 1], [0, 0], [0, 1], subtractive=True)
+    assert result.case.tolist() == [3, 0]
+    assert RULE_NAMES[rule[1]] == "subtractive"
+
+
+@pytest.mark.parametrize("a, b, k, i, subtractive", [
+    (2, 2, 1, 0, False), (8, 2, 1, 1, False), (0.5, 2, 1, 0, False), (2, 1, 1, 0, True),
+    (2, 0.5, 1, 0, False), (2, 1, 1, 0, False), (0.5, 0.5, 1, 0, False), (0, 2, 1, 0, False),
+    (-1, 2, 1, 0, False), (2, 0, 1, 0, True), (2, 1, 1, 1, True),
+])
+def test_solve_matches_solve_batch(a, b, k, i, subtractive):
+    rule, batch = solve_batch(a, b, k, i, subtractive)
+    try:
+        result = solve(a, b, k, i, subtractive)
+    except ValueError:
+        assert batch.case.item() == 0
+    else:
+        assert batch.case.item() == result.case != 0
+        assert RULE_NAMES[rule.item()] == result.theorem
+        assert batch.poly_exponent.item() == pytest.approx(result.poly_exponent)
@@ -0,0 +1,54 @@
+import copy
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from Theorems.dispatch import solve
+from Theorems.evaluator import evaluate, evaluate_dividing, evaluate_subtractive, verify
+
+
+def test_evaluate_dividing_is_exact_at_powers_of_b():
+    # T(n) = 2T(n/2) + n with T(1) = 1 is n log2(n) + n at n = 2^j.
+    evaluation = evaluate_dividing(2, 2, 1, n_max=2 ** 20)
+    n = evaluation.n
+    assert len(n) == 20
+    assert evaluation.log_t == pytest.approx([math.log(x * math.log2(x) + x) for x in n])
+
+
+def test_evaluate_subtractive_in_chunks():
+    # T(n) = T(n-1) + 1 with T(0) = 1 is n + 1, whatever the chunk size.
+    evaluation = evaluate_subtractive(1, 1, 0, n_max=10_000, chunk_size=7)
+    assert evaluation.log_t == pytest.approx([math.log(x + 1) for x in evaluation.n])
+
+
+@pytest.mark.parametrize("text, verdict", [
+    ("T(n) = 2T(n/2) + n", "tight"),
+    ("T(n) = 8T(n/2) + n^2", "tight"),
+    ("T(n) = 2T(n/2) + n log n", "tight"),
+    ("T(n) = T(n-1) + n", "tight"),
+])
+def test_verify(text, verdict):
+    assert verify(solve(text)).verdict == verdict
+
+
+def test_verify_flags_wrong_bounds():
+    # Results are shared through the solver cache; mutate a copy.
+    result = copy.copy(solve("T(n) = 2T(n/2) + n"))
+    result.log_exponent = 0
+    assert verify(result).verdict == "violated"
+    result.log_exponent = 2
+    assert verify(result).verdict == "loose"
+
+
+@pytest.mark.parametrize("text, theorem", [
+    ("T(n) = T(n/2) + T(n/3) + n", "akra_bazzi"),
+    ("T(n) = 0.5T(n/2) + n", "akra_bazzi"),
+    ("T(n) = T(n-1) + T(n-2)", "linear"),
+])
+def test_multi_term_results_are_rejected(text, theorem):
+    result = solve(text)
+    for check in (evaluate, verify):
+        with pytest.raises(ValueError, match=f"cannot evaluate {theorem} recurrences"):
+            check(result)
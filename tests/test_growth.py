@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from Theorems.dispatch import solve
+from Theorems.growth import MAX_CHART_ROWS, MAX_POINTS, growth_table, predicted_series
+
+
+RECURRENCES = [f"T(n) = {a}T(n/2) + n^{k}" for a in (1, 2, 4, 8) for k in (0, 1, 2)] + ["T(n) = T(n-1) + n"]
+
+
+def test_predicted_series_is_capped_and_read_only():
+    n, log10_t = predicted_series(solve("T(n) = 8T(n/2) + n^2"), points=10 * MAX_POINTS)
+    assert len(n) == len(log10_t) == MAX_POINTS
+    # Θ(n^3) rises by 3 decades per decade of n.
+    assert (log10_t[-1] - log10_t[0]) / math.log10(n[-1] / n[0]) == pytest.approx(3)
+    with pytest.raises(ValueError):
+        log10_t[0] = 0
+
+
+def test_huge_subtractive_bases_stay_finite():
+    import numpy as np
+
+    n, log10_t = predicted_series(solve(10, 0.001, 1, subtractive=True), n_max=1e3)
+    assert np.isfinite(log10_t).all()
+
+
+def test_table_has_one_curve_per_recurrence_and_kind():
+    table = growth_table([solve(text) for text in RECURRENCES[:2]], points=50, evaluated=True)
+    assert set(table["kind"]) == {"predicted", "evaluated"}
+    assert table.groupby(["recurrence", "kind"]).size().max() <= 50
+
+
+def test_many_curves_fit_the_altair_row_limit():
+    pytest.importorskip("altair")
+    from Theorems.growth import growth_chart
+
+    chart = growth_chart([solve(text) for text in RECURRENCES], points=MAX_POINTS, evaluated=True)
+    assert len(RECURRENCES) == 13
+    assert len(chart.data) <= MAX_CHART_ROWS
+    chart.to_dict()
+
+
+def test_extended_labels_keep_the_log_factor():
+    table = growth_table([solve("T(n) = 2T(n/2) + n log n")], points=10)
+    assert table["recurrence"][0].startswith("2T(n/2) + n^1 (log n)^1: ")
@@ -0,0 +1,43 @@
+from concurrent.futures import Future
+
+import pytest
+
+from Theorems.parallel import _collect, iter_chunks, solve_chunk, solve_parallel
+
+
+def _records(count):
+    records = []
+    for line_no in range(1, count + 1):
+        record = {"a": line_no % 9 + 1, "b": 2, "k": line_no % 4}
+        if line_no % 17 == 0:
+            record = {"a": "x", "b": 2, "k": 1}
+        elif line_no % 5 == 0:
+            record = {"theorem": "subtractive", "a": 2, "b": 1, "k": 1}
+        records.append((line_no, record))
+    return records
+
+
+def test_iter_chunks():
+    assert [len(chunk) for chunk in iter_chunks(range(25), 10)] == [10, 10, 5]
+    assert list(iter_chunks([], 10)) == []
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_rows_come_back_in_input_order(vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    records = _records(200)
+    expected = solve_chunk(records)
+    rows = list(solve_parallel(records, workers=2, chunk_size=7, vectorized=vectorized))
+    assert [row["line"] for row in rows] == list(range(1, 201))
+    assert rows == expected
+    assert sum("error" in row for row in rows) == 200 // 17
+
+
+def test_failed_chunks_become_error_rows():
+    future = Future()
+    future.set_exception(RuntimeError("boom"))
+    chunk = _records(3)
+    assert _collect(chunk, future) == [
+        {"line": line_no, "error": "chunk failed: boom"} for line_no in (1, 2, 3)
+    ]
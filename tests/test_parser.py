@@ -0,0 +1,25 @@
+import pytest
+
+from Theorems.parser import ParseError, parse_recurrence
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("T(n) = 2T(n/2) + n", ("master", 2, 2, 1, 0)),
+    ("T(n) = 3T(2n/3) + n^2 log n", ("extended", 3, 1.5, 2, 1)),
+    ("T(n) = T(n/2) + T(n/3) + n", ("akra_bazzi", (1, 1), (2, 3), 1, 0)),
+    ("T(n) = 2T(n-0.5) + 1", ("subtractive", 2, 0.5, 0, 0)),
+    ("T(n) = T(n-1) + T(n-2)", ("linear", (1, 1), None, 0, 0)),
+])
+def test_parse(text, expected):
+    assert tuple(parse_recurrence(text)) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "T(n) = 2T(n/0.5) + n",
+    "T(n) = 2T(n/1) + n",
+    "T(n) = T(n/2) + T(n/1) + n",
+    "T(n) = 2T(3n/2) + n",
+])
+def test_dividing_terms_must_shrink_n(text):
+    with pytest.raises(ParseError, match="must shrink n"):
+        parse_recurrence(text)
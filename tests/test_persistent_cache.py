@@ -0,0 +1,93 @@
+from fractions import Fraction
+import json
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from Theorems import SOLVER_VERSION
+from Theorems.cache import get_default_cache, set_default_cache
+from Theorems.exact import exact_master_theorem_result
+from Theorems.master_theorem import master_theorem_result
+from Theorems.persistent_cache import PersistentCache, params_key
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def use_cache():
+    previous = get_default_cache()
+    caches = []
+
+    def use(path, **kwargs):
+        cache = PersistentCache(str(path), **kwargs)
+        caches.append(cache)
+        set_default_cache(cache)
+        return cache
+
+    yield use
+    set_default_cache(previous)
+    for cache in caches:
+        cache.close()
+
+
+def _count(path):
+    db = sqlite3.connect(str(path))
+    try:
+        return db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    finally:
+        db.close()
+
+
+def test_results_survive_a_new_cache(tmp_path, use_cache):
+    path = tmp_path / "cache.db"
+    cache = use_cache(path)
+    expected = master_theorem_result(8, 2, 2)
+    cache.close()
+    assert _count(path) == 1
+
+    cache = use_cache(path)
+    result = master_theorem_result(8, 2, 2)
+    assert (cache.disk_hits, result.case, result.complexity) == (1, expected.case, expected.complexity)
+    # Same numbers, different spelling: the stored decision is rendered with these params.
+    assert master_theorem_result(8.0, 2, 2).a == 8.0
+
+
+def test_entries_of_older_solver_versions_are_dropped(tmp_path, use_cache):
+    path = tmp_path / "cache.db"
+    use_cache(path).close()
+    db = sqlite3.connect(str(path))
+    with db:
+        db.execute("INSERT INTO results VALUES ('master', '[8.0, 2.0, 2.0]', ?, '[]', 0, 0)",
+                   (SOLVER_VERSION - 1,))
+    db.close()
+    use_cache(path)
+    assert _count(path) == 0
+
+
+def test_exact_solvers_are_keyed_on_exact_values(tmp_path, use_cache):
+    assert params_key("master_exact", (2, 8, Fraction(1, 3))) != params_key("master_exact", (2, 8, 1 / 3))
+    assert params_key("master_exact", (2 ** 53 + 1,)) != params_key("master_exact", (2 ** 53,))
+    assert params_key("master_exact", (2, 8.0, 1)) == params_key("master_exact", (2.0, 8, 1))
+    assert params_key("master", (2, 8, Fraction(1, 2))) == params_key("master", (2, 8, 0.5))
+
+    path = tmp_path / "cache.db"
+    use_cache(path)
+    assert exact_master_theorem_result(2 ** 53, 2, 53).case == 2
+    get_default_cache().close()
+    use_cache(path)
+    # float(2**53 + 1) == 2**53, but log_2(2**53 + 1) > 53.
+    assert exact_master_theorem_result(2 ** 53 + 1, 2, 53).case == 1
+    assert exact_master_theorem_result(Fraction(2 ** 53), 2, 53).case == 2
+    assert get_default_cache().disk_hits == 1
+
+
+def test_parallel_workers_write_their_entries(tmp_path):
+    path = tmp_path / "cache.db"
+    records = "".join(json.dumps({"a": a, "b": 2, "k": 1}) + "\n" for a in range(1, 101))
+    subprocess.run(
+        [sys.executable, "main.py", "--cache-db", str(path), "solve", "-j", "2", "--chunk-size", "10"],
+        input=records, cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert _count(path) == 100
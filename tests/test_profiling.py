@@ -0,0 +1,41 @@
+import sys
+import threading
+import types
+
+from Theorems import master_theorem
+from Theorems.profiling import disable, enable
+
+
+def test_disable_restores_names_bound_while_profiling():
+    original = master_theorem.master_theorem_result
+    enable()
+    try:
+        # A module imported while profiling binds the timed wrapper.
+        probe = types.ModuleType("Theorems._profiling_probe")
+        probe.master_theorem_result = master_theorem.master_theorem_result
+        sys.modules[probe.__name__] = probe
+        assert probe.master_theorem_result is not original
+    finally:
+        disable()
+    try:
+        assert probe.master_theorem_result is original
+        assert master_theorem.master_theorem_result is original
+    finally:
+        del sys.modules[probe.__name__]
+
+
+def test_record_counts_every_call_across_threads():
+    profiler = enable()
+    try:
+        def work():
+            for _ in range(2000):
+                profiler.record(("master", "call"), 0, 1)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        disable()
+    assert profiler.stats[("master", "call")] == [16000, 16000]
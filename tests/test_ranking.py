@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Theorems.dispatch import solve, solve_batch
+from Theorems.ranking import argsort_growth, growth_signature, signature_array, sort_by_growth, top_k
+
+
+TEXTS = [
+    "T(n) = 8T(n/2) + n^2",   # n^3
+    "T(n) = 2T(n-1) + 1",     # 2^n
+    "T(n) = T(n/2) + 1",      # log n
+    "T(n) = 3T(n/3) + n",     # n log n
+    "T(n) = 27T(n/3) + n",    # n^3, log_3(27) is not exactly 3 in floats
+    "T(n) = 2T(n/2) + n",     # n log n
+]
+
+
+def test_signatures_order_results():
+    results = [solve(text) for text in TEXTS]
+    assert growth_signature(results[0]) == growth_signature(results[4])
+    assert sort_by_growth(results) == [results[j] for j in (2, 3, 5, 0, 4, 1)]
+    assert sort_by_growth(results, descending=True) == [results[j] for j in (1, 0, 4, 3, 5, 2)]
+
+
+def test_batch_rows_rank_like_scalar_results():
+    a = [8, 2, 1, 3, 27, 2, 0.5]
+    b = [2, 1, 2, 3, 3, 2, 0.5]
+    k = [2, 0, 0, 1, 1, 1, 1]
+    subtractive = [False, True, False, False, False, False, False]
+    solution = solve_batch(a, b, k, 0, subtractive)
+    # The last row is invalid (b < 1) and always ranks last.
+    assert argsort_growth(solution).tolist() == [2, 3, 5, 0, 4, 1, 6]
+    assert argsort_growth(solution, descending=True).tolist() == [1, 0, 4, 3, 5, 2, 6]
+    scalar = signature_array([solve(text) for text in TEXTS])
+    np.testing.assert_array_equal(signature_array(solution)[:6], scalar)
+
+
+def test_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(0)
+    a = rng.choice([1, 2, 3, 4, 8, 9, 27], 5000)
+    b = rng.choice([2, 3, 4], 5000)
+    k = rng.choice([0, 0.5, 1, 2, 3], 5000)
+    solution = solve_batch(a, b, k)
+    signatures = signature_array(solution)
+    for count, largest in ((1, False), (10, False), (123, True), (5000, False)):
+        chosen = top_k(solution, count, largest=largest)
+        expected = argsort_growth(solution, descending=largest)[:count]
+        np.testing.assert_array_equal(signatures[chosen], signatures[expected])
+    assert top_k(solution, 0).size == 0
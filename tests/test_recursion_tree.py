@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+import main
+from Theorems.recursion_tree import iter_levels, level_table, tree_summary
+
+
+def test_merge_sort_levels_are_balanced():
+    summary = tree_summary("master", 2, 2, 1, n=1024)
+    assert (summary.levels, summary.dominant) == (11, "balanced")
+    # n work on each of the 10 internal levels, and 1024 leaves of cost 1.
+    assert 10 ** summary.log10_internal == pytest.approx(10 * 1024)
+    assert 10 ** summary.log10_leaves == pytest.approx(1024)
+    level = next(iter_levels("master", 2, 2, 1, n=1024, depths=[3]))
+    assert (level.depth, level.size) == (3, 128)
+    assert 10 ** level.log10_nodes == pytest.approx(8)
+
+
+def test_deep_subtractive_tree_stays_finite():
+    summary, levels = level_table("subtractive", 2, 0.0001, 0, n=1e6, max_rows=5)
+    assert summary.dominant == "leaves"
+    assert math.isfinite(summary.log10_total) and len(levels) <= 5
+
+
+def test_tree_command(capsys):
+    with pytest.raises(SystemExit) as exited:
+        main.main(["tree", "T(n) = 8T(n/2) + n^2", "-n", "1024", "--rows", "4"])
+    assert exited.value.code == 0
+    assert "O(n^3" in capsys.readouterr().out
+
+
+def test_tree_command_reports_solver_errors(capsys, monkeypatch):
+    import Theorems.dispatch
+
+    def fail(recurrence):
+        raise OverflowError("math range error")
+
+    monkeypatch.setattr(Theorems.dispatch, "solve", fail)
+    with pytest.raises(SystemExit) as exited:
+        main.main(["tree", "T(n) = 2T(n/2) + n"])
+    assert exited.value.code == 2
+    assert capsys.readouterr().err == "Error: math range error\n"
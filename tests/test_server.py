@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import pytest
+
+from server import HTTPError, MicroBatcher, make_handler, route
+
+
+def _route(method, path, payload, batcher=None):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return asyncio.run(route(batcher or MicroBatcher(), method, path, body))
+
+
+def test_solve_and_batch():
+    status, row = _route("POST", "/solve", {"a": 2, "b": 2, "k": 1})
+    assert (status, row["case"]) == (200, 2)
+    status, rows = _route("POST", "/solve/batch", [{"a": 8, "b": 2, "k": 1}, {"a": "zz", "b": 2, "k": 1}])
+    assert status == 200
+    assert rows[0]["case"] == 1 and "error" in rows[1]
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/solve", {"a": "nan", "b": 2, "k": 1}),
+    ("/solve", {"theorem": "subtractive", "a": 2, "b": "-inf", "k": 1}),
+    ("/solve", b'{"a": 2, "b": 2, "k": NaN}'),
+    ("/solve/batch", b'[{"a": 2, "b": 2, "k": Infinity}]'),
+])
+def test_non_finite_parameters_are_rejected(path, body):
+    batcher = MicroBatcher()
+    with pytest.raises(HTTPError) as raised:
+        _route("POST", path, body, batcher)
+    assert raised.value.status == 400
+    assert batcher.batches == 0
+
+
+def test_pending_batches_hold_their_tasks():
+    async def run():
+        batcher = MicroBatcher(window=10)
+        futures = [batcher.submit({"a": a, "b": 2, "k": 1}) for a in (1, 2, 3)]
+        batcher._flush()
+        assert len(batcher._tasks) == 1
+        rows = await asyncio.gather(*futures)
+        await asyncio.sleep(0)
+        return batcher, rows
+
+    batcher, rows = asyncio.run(run())
+    assert [row["case"] for row in rows] == [3, 2, 1]
+    assert not batcher._tasks and batcher.batches == 1
+
+
+def test_http_round_trip():
+    async def run():
+        server = await asyncio.start_server(make_handler(MicroBatcher()), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = b'{"a": "inf", "b": 2, "k": 1}'
+        writer.write(b"POST /solve HTTP/1.1\r\nConnection: close\r\n"
+                     b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+
+    head, _, body = asyncio.run(run()).partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 400 ")
+    assert "must be finite" in json.loads(body)["error"]
@@ -0,0 +1,46 @@
+import io
+import json
+import math
+
+import pytest
+
+from Theorems.bulk import read_jsonl, solve_records, write_jsonl
+from Theorems.subtractive_master_theorem import (
+    subtractive_master_theorem,
+    subtractive_master_theorem_result,
+)
+
+
+@pytest.mark.parametrize("a, b", [(10, 0.001), (1e31, 0.1), (2, 1e-4)])
+def test_tiny_b_does_not_overflow(a, b):
+    assert subtractive_master_theorem(a, b, 1)[1] == 3
+    result = subtractive_master_theorem_result(a, b, 1)
+    assert result.exp_base == math.inf
+    assert result.exp_rate == pytest.approx(math.log(a) / b)
+
+
+def test_tiny_b_bulk_rows_are_strict_json():
+    out = io.StringIO()
+    records = read_jsonl(['{"theorem": "subtractive", "a": 10, "b": 0.001, "k": 1}'])
+    write_jsonl(solve_records(records), out)
+    row = json.loads(out.getvalue(), parse_constant=pytest.fail)
+    assert row["case"] == 3 and row["exp_base"] is None
+
+
+def test_exponential_case_stores_the_tight_bound():
+    from Theorems.ranking import compare_growth
+
+    # Both are Θ(2^n): the n^k term is dominated by the deepest levels.
+    linear, constant = (subtractive_master_theorem_result(2, 1, k) for k in (1, 0))
+    assert linear.poly_exponent == constant.poly_exponent == 0
+    assert compare_growth(linear, constant) == 0
+    assert compare_growth(subtractive_master_theorem_result(3, 1, 0), linear) == 1
+    assert compare_growth(subtractive_master_theorem_result(10, 0.001, 0),
+                          subtractive_master_theorem_result(1e31, 0.1, 5)) == 1
+
+
+def test_exponential_case_verifies_tight():
+    pytest.importorskip("numpy")
+    from Theorems.evaluator import verify
+
+    assert verify(subtractive_master_theorem_result(2, 1, 1)).verdict == "tight"
@@ -0,0 +1,43 @@
+import pytest
+
+sympy = pytest.importorskip("sympy")
+
+from Theorems.dispatch import solve
+from Theorems.master_theorem import master_theorem_result
+from Theorems.symbolic import bound, compare, is_little_o, shutdown, sort_results, submit, symbol
+
+
+n = symbol()
+
+
+def test_bounds_are_exact():
+    assert bound(master_theorem_result(3, 2, 1)) == n ** (sympy.log(3) / sympy.log(2))
+    assert bound(solve("T(n) = 2T(n/2) + n")) == n * sympy.log(n)
+    assert bound(solve("T(n) = 2T(n-1) + n")) == 2 ** n
+
+
+def test_compare_results_and_strings():
+    karatsuba = master_theorem_result(3, 2, 1)
+    assert is_little_o(karatsuba, "n^2")
+    assert compare("n^2 log n", karatsuba) == 1
+    # log_2(4) equals k = 2 exactly, and 4T(n/2) + n^2 is Θ(n^2 log n).
+    assert compare(master_theorem_result(4, 2, 2), "O(n^2 log n)") == 0
+    assert compare(master_theorem_result(8, 4, 1.5), master_theorem_result(27, 9, 1.5)) == 0
+
+
+def test_sort_results_ranks_equal_bounds_together():
+    texts = ["T(n) = 8T(n/2) + n^2", "T(n) = 16T(n/4) + n", "T(n) = T(n/2) + 1",
+             "T(n) = 4T(n/2) + n", "T(n) = 2T(n/2) + n"]
+    results = [solve(text) for text in texts]
+    # 16T(n/4) + n and 4T(n/2) + n are both Θ(n^2) and keep their input order.
+    assert sort_results(results) == [results[j] for j in (2, 4, 1, 3, 0)]
+    assert sort_results(results, reverse=True) == [results[j] for j in (0, 1, 3, 4, 2)]
+
+
+def test_submit_builds_bounds_off_process():
+    try:
+        future = submit(master_theorem_result(7, 2, 2))
+        assert future.result(timeout=60) == n ** (sympy.log(7) / sympy.log(2))
+        assert submit(master_theorem_result(7, 2, 2)).done()
+    finally:
+        shutdown()